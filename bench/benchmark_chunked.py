@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+"""
+Compare decoding chunked response bodies with HTTPResponse.read_chunked()
+against the previous implementation, which read each chunk-size line, chunk
+and CRLF with separate calls on the socket file.
+
+The bodies are read from memory to leave out the network.
+"""
+
+import http.client
+import io
+import sys
+import time
+
+sys.path.append("../src")
+from urllib3.response import HTTPResponse  # noqa: E402
+
+BODY_SIZE = 32 * 1024 ** 2
+
+
+class Sock:
+    def __init__(self, data):
+        self.data = data
+
+    def makefile(self, *args, **kwargs):
+        return io.BufferedReader(io.BytesIO(self.data))
+
+
+def make_response(response_class, chunk_size):
+    chunk = b"%X\r\n%s\r\n" % (chunk_size, b"x" * chunk_size)
+    body = chunk * (BODY_SIZE // chunk_size) + b"0\r\n\r\n"
+    r = http.client.HTTPResponse(
+        Sock(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + body),
+        method="GET",
+    )
+    r.begin()
+    return response_class.from_httplib(r, preload_content=False)
+
+
+class LegacyHTTPResponse(HTTPResponse):
+    """read_chunked() before the buffered decoder."""
+
+    chunk_left = None
+
+    def _update_chunk_length(self):
+        if self.chunk_left is not None:
+            return
+        line = self._fp.fp.readline()
+        line = line.split(b";", 1)[0]
+        self.chunk_left = int(line, 16)
+
+    def _handle_chunk(self, amt):
+        if amt is None:
+            chunk = self._fp._safe_read(self.chunk_left)
+            self._fp._safe_read(2)
+            self.chunk_left = None
+        elif amt < self.chunk_left:
+            chunk = self._fp._safe_read(amt)
+            self.chunk_left = self.chunk_left - amt
+        else:
+            chunk = self._fp._safe_read(self.chunk_left)
+            self._fp._safe_read(2)
+            self.chunk_left = None
+        return chunk
+
+    def read_chunked(self, amt=None, decode_content=None):
+        self._init_decoder()
+        with self._error_catcher():
+            while True:
+                self._update_chunk_length()
+                if self.chunk_left == 0:
+                    break
+                chunk = self._handle_chunk(amt)
+                self._count_bytes_received(len(chunk))
+                decoded = self._decode(
+                    chunk, decode_content=decode_content, flush_decoder=False
+                )
+                if decoded:
+                    yield decoded
+            while True:
+                line = self._fp.fp.readline()
+                if not line or line == b"\r\n":
+                    break
+            self._original_response.close()
+
+
+def measure(response_class, chunk_size, repeat=5):
+    """Return the best throughput of ``repeat`` runs in MiB/s."""
+    best = 0.0
+    for _ in range(repeat):
+        response = make_response(response_class, chunk_size)
+        start = time.perf_counter()
+        total = sum(len(data) for data in response.stream())
+        elapsed = time.perf_counter() - start
+        assert total == BODY_SIZE // chunk_size * chunk_size
+        best = max(best, total / elapsed / 1024 ** 2)
+    return best
+
+
+if __name__ == "__main__":
+    for chunk_size in (16, 256, 4096, 65536):
+        legacy = measure(LegacyHTTPResponse, chunk_size)
+        buffered = measure(HTTPResponse, chunk_size)
+        print(
+            f"{chunk_size:6} byte chunks: legacy {legacy:7.0f} MiB/s, "
+            f"buffered {buffered:7.0f} MiB/s, speedup {buffered / legacy:5.1f}x"
+        )
+
+
+"""
+Example results:
+
+    16 byte chunks: legacy      10 MiB/s, buffered      23 MiB/s, speedup   2.3x
+   256 byte chunks: legacy     160 MiB/s, buffered     319 MiB/s, speedup   2.0x
+  4096 byte chunks: legacy    1973 MiB/s, buffered    2164 MiB/s, speedup   1.1x
+ 65536 byte chunks: legacy    5950 MiB/s, buffered    5208 MiB/s, speedup   0.9x
+"""
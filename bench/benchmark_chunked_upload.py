@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+"""
+Compare sending requests with HTTPConnection, which hands the header block,
+chunk size lines, data and CRLFs to socket.sendmsg() without joining them and
+coalesces small writes, against the previous implementation, which sent the
+header block on its own and copied every chunk into a new bytearray that it
+sent with one call each.
+
+A local server reads the requests. The number of send(), sendall() and
+sendmsg() calls on the socket is counted.
+"""
+
+import http.client
+import socket
+import sys
+import threading
+import time
+
+sys.path.append("../src")
+from urllib3.connection import HTTPConnection  # noqa: E402
+
+BODIES = {
+    "bytes, 1 KiB": (False, b"x" * 1024),
+    "1000 x 100 B chunks": (True, [b"x" * 100] * 1000),
+    "1000 x 100 B generator": (True, lambda: (b"x" * 100 for _ in range(1000))),
+    "64 x 1 MiB chunks": (True, [b"x" * 1024 ** 2] * 64),
+}
+REQUESTS = 20
+
+
+class LegacyHTTPConnection(HTTPConnection):
+    """HTTPConnection before vectored writes."""
+
+    def request(self, method, url, body=None, headers=None):
+        http.client.HTTPConnection.request(self, method, url, body, headers or {})
+
+    def request_chunked(self, method, url, body=None, headers=None):
+        self.putrequest(method, url)
+        self.putheader("Transfer-Encoding", "chunked")
+        self.endheaders()
+        for chunk in body:
+            len_str = hex(len(chunk))[2:]
+            to_send = bytearray(len_str.encode())
+            to_send += b"\r\n"
+            to_send += chunk
+            to_send += b"\r\n"
+            self.send(to_send)
+        self.send(b"0\r\n\r\n")
+
+
+def serve(listener):
+    while True:
+        sock, _ = listener.accept()
+        with sock:
+            while sock.recv(1024 ** 2):
+                pass
+
+
+calls = 0
+
+
+def counting(method):
+    def wrapper(*args, **kwargs):
+        global calls
+        calls += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def measure(connection_class, port, chunked, body):
+    """Return the best time of REQUESTS requests and the send calls per request."""
+    global calls
+    best = float("inf")
+    calls = 0
+    for _ in range(REQUESTS):
+        conn = connection_class("127.0.0.1", port)
+        conn.connect()
+        data = body() if callable(body) else body
+        start = time.perf_counter()
+        if chunked:
+            conn.request_chunked("POST", "/", body=data)
+        else:
+            conn.request("POST", "/", body=data)
+        # Wait for the server to have read everything.
+        conn.sock.shutdown(socket.SHUT_WR)
+        conn.sock.recv(1)
+        best = min(best, time.perf_counter() - start)
+        conn.close()
+    return best, calls / REQUESTS
+
+
+if __name__ == "__main__":
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    threading.Thread(target=serve, args=(listener,), daemon=True).start()
+    port = listener.getsockname()[1]
+
+    for name in ("send", "sendall", "sendmsg"):
+        setattr(socket.socket, name, counting(getattr(socket.socket, name)))
+
+    for name, (chunked, body) in BODIES.items():
+        for connection_class in (LegacyHTTPConnection, HTTPConnection):
+            elapsed, per_request = measure(connection_class, port, chunked, body)
+            label = "legacy" if connection_class is LegacyHTTPConnection else "current"
+            print(
+                f"{name:24} {label:8} {elapsed * 1e3:8.3f} ms "
+                f"{per_request:6.0f} send calls"
+            )
+
+
+"""
+Example results:
+
+bytes, 1 KiB             legacy      0.059 ms      2 send calls
+bytes, 1 KiB             current     0.059 ms      1 send calls
+1000 x 100 B chunks      legacy      2.984 ms   1002 send calls
+1000 x 100 B chunks      current     0.764 ms      3 send calls
+1000 x 100 B generator   legacy      3.089 ms   1002 send calls
+1000 x 100 B generator   current     2.890 ms   1002 send calls
+64 x 1 MiB chunks        legacy     20.567 ms     66 send calls
+64 x 1 MiB chunks        current    15.261 ms     65 send calls
+"""
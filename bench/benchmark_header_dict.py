@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+"""
+Compare HTTPHeaderDict against the previous implementation, which copied and
+merged header dicts with add() for every value and looked up every field once
+more while iterating over its items.
+
+Each operation works on a set of typical request or response headers.
+"""
+
+import sys
+import timeit
+from typing import Mapping
+
+sys.path.append("../src")
+from urllib3._collections import HTTPHeaderDict  # noqa: E402
+
+HEADERS = [
+    ("Host", "example.com"),
+    ("User-Agent", "python-urllib3/2.0.0"),
+    ("Accept", "*/*"),
+    ("Accept-Encoding", "gzip, deflate, br"),
+    ("Connection", "keep-alive"),
+    ("Content-Type", "application/json"),
+    ("Content-Length", "1234"),
+    ("Cache-Control", "no-cache"),
+    ("Set-Cookie", "a=1; Path=/"),
+    ("Set-Cookie", "b=2; Path=/"),
+    ("X-Request-Id", "4c7ee4bc-d1a0-4a3e-9a8e-2fd3f0e1c6a5"),
+]
+N = 20000
+
+
+class LegacyHTTPHeaderDict(HTTPHeaderDict):
+    """HTTPHeaderDict before the fast paths."""
+
+    def __init__(self, headers=None, **kwargs):
+        self._container = {}
+        if headers is not None:
+            if isinstance(headers, HTTPHeaderDict):
+                self._copy_from(headers)
+            else:
+                self.extend(headers)
+        if kwargs:
+            self.extend(kwargs)
+
+    def __getitem__(self, key):
+        val = self._container[key.lower()]
+        return ", ".join(val[1:])
+
+    def __eq__(self, other):
+        other = type(self)(other)
+        return {k.lower(): v for k, v in self.itermerged()} == {
+            k.lower(): v for k, v in other.itermerged()
+        }
+
+    def extend(self, other=()):
+        if isinstance(other, HTTPHeaderDict):
+            for key, val in other.iteritems():
+                self.add(key, val)
+        elif isinstance(other, Mapping):
+            for key, val in other.items():
+                self.add(key, val)
+        else:
+            for key, val in other:
+                self.add(key, val)
+
+    def _copy_from(self, other):
+        for key in other:
+            val = other.getlist(key)
+            self._container[key.lower()] = [key, *val]
+
+    def iteritems(self):
+        for key in self:
+            vals = self._container[key.lower()]
+            for val in vals[1:]:
+                yield vals[0], val
+
+    def itermerged(self):
+        for key in self:
+            val = self._container[key.lower()]
+            yield val[0], ", ".join(val[1:])
+
+
+def operations(cls):
+    headers = cls(HEADERS)
+    other = cls(dict(HEADERS[:4]))
+    return {
+        "construct from list": lambda: cls(HEADERS),
+        "construct from dict": lambda: cls(dict(HEADERS)),
+        "copy": headers.copy,
+        "merge": lambda: cls(headers).extend(other),
+        "lookup": lambda: (
+            headers["content-type"],
+            headers["Set-Cookie"],
+            "host" in headers,
+            headers.get("missing"),
+        ),
+        "items": lambda: list(headers.items()),
+        "compare": lambda: headers == other,
+    }
+
+
+if __name__ == "__main__":
+    legacy = operations(LegacyHTTPHeaderDict)
+    current = operations(HTTPHeaderDict)
+    for name in current:
+        # Alternate between the implementations to even out noise.
+        before = after = float("inf")
+        for _ in range(7):
+            before = min(before, timeit.timeit(legacy[name], number=N) / N * 1e6)
+            after = min(after, timeit.timeit(current[name], number=N) / N * 1e6)
+        print(
+            f"{name:20} legacy {before:6.2f} us, current {after:6.2f} us, "
+            f"speedup {before / after:4.1f}x"
+        )
+
+
+"""
+Example results:
+
+construct from list  legacy   3.62 us, current   2.50 us, speedup  1.4x
+construct from dict  legacy   4.25 us, current   4.16 us, speedup  1.0x
+copy                 legacy   4.32 us, current   1.47 us, speedup  2.9x
+merge                legacy   7.26 us, current   2.77 us, speedup  2.6x
+lookup               legacy   1.32 us, current   1.13 us, speedup  1.2x
+items                legacy   5.40 us, current   4.36 us, speedup  1.2x
+compare              legacy   8.71 us, current   2.61 us, speedup  3.3x
+"""
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+Compare reading the head of a response with HTTPLibResponse, which parses the
+headers straight into an HTTPHeaderDict, against http.client.HTTPResponse,
+whose headers are parsed by the email package and then copied into an
+HTTPHeaderDict by HTTPResponse.from_httplib().
+
+The responses are read from memory to leave out the network.
+"""
+
+import http.client
+import io
+import sys
+import time
+
+sys.path.append("../src")
+from urllib3.connection import HTTPLibResponse  # noqa: E402
+from urllib3.response import HTTPResponse  # noqa: E402
+
+HEADS = {
+    "minimal": b"HTTP/1.1 204 No Content\r\nDate: Mon, 18 Oct 2021 10:00:00 GMT\r\n",
+    "typical": (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Date: Mon, 18 Oct 2021 10:00:00 GMT\r\n"
+        b"Server: nginx\r\n"
+        b"Content-Type: application/json; charset=utf-8\r\n"
+        b"Content-Length: 0\r\n"
+        b"Connection: keep-alive\r\n"
+        b"Cache-Control: private, max-age=0\r\n"
+        b'ETag: W/"5e15153d-120f"\r\n'
+        b"Vary: Accept-Encoding\r\n"
+        b"X-Request-Id: 4c7ee4bc-d1a0-4a3e-9a8e-2fd3f0e1c6a5\r\n"
+        b"Strict-Transport-Security: max-age=31536000\r\n"
+    ),
+    "cookies": b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n"
+    + b"".join(b"Set-Cookie: c%d=%s; Path=/\r\n" % (i, b"v" * 40) for i in range(30)),
+}
+N = 20000
+
+
+class Sock:
+    def __init__(self, data):
+        self.data = data
+
+    def makefile(self, *args, **kwargs):
+        return io.BufferedReader(io.BytesIO(self.data))
+
+
+def measure(response_class, head, repeat=5):
+    """Return the best time per response of ``repeat`` runs in microseconds."""
+    sock = Sock(head + b"\r\n")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(N):
+            r = response_class(sock, method="GET")
+            r.begin()
+            HTTPResponse.from_httplib(r, preload_content=False)
+        best = min(best, (time.perf_counter() - start) / N * 1e6)
+    return best
+
+
+if __name__ == "__main__":
+    for name, head in HEADS.items():
+        email = measure(http.client.HTTPResponse, head)
+        direct = measure(HTTPLibResponse, head)
+        print(
+            f"{name:8} email + copy {email:6.1f} us/response, "
+            f"direct {direct:6.1f} us/response, speedup {email / direct:4.1f}x"
+        )
+
+
+"""
+Example results:
+
+minimal  email + copy   56.0 us/response, direct   26.2 us/response, speedup  2.1x
+typical  email + copy  121.7 us/response, direct   41.9 us/response, speedup  2.9x
+cookies  email + copy  158.1 us/response, direct   54.0 us/response, speedup  2.9x
+"""
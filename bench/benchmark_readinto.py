@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+Compare reading a large response body with HTTPResponse.readinto(), which
+reads straight into the caller's buffer, against the previous implementation
+which read a bytes object with read() and copied it into the buffer.
+
+A local server sends a 1 GiB body, with a Content-Length and chunked.
+"""
+
+import socket
+import sys
+import threading
+import time
+
+sys.path.append("../src")
+from urllib3 import HTTPConnectionPool  # noqa: E402
+from urllib3.response import BaseHTTPResponse  # noqa: E402
+
+BODY_SIZE = 1024 ** 3
+BLOCK = b"x" * 1024 ** 2
+BUFFER_SIZE = 64 * 1024
+
+
+def serve(listener):
+    while True:
+        sock, _ = listener.accept()
+        with sock:
+            request = b""
+            while not request.endswith(b"\r\n\r\n"):
+                request += sock.recv(65536)
+            if b"chunked" in request.split(b"\r\n", 1)[0]:
+                sock.sendall(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n")
+                frame = b"%X\r\n%s\r\n" % (len(BLOCK), BLOCK)
+                for _ in range(BODY_SIZE // len(BLOCK)):
+                    sock.sendall(frame)
+                sock.sendall(b"0\r\n\r\n")
+            else:
+                sock.sendall(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % BODY_SIZE
+                )
+                for _ in range(BODY_SIZE // len(BLOCK)):
+                    sock.sendall(BLOCK)
+
+
+def download(pool, path, readinto):
+    response = pool.request("GET", path, preload_content=False)
+    buffer = bytearray(BUFFER_SIZE)
+    total = calls = 0
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    while True:
+        n = readinto(response, buffer)
+        if not n:
+            break
+        total += n
+        calls += 1
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    assert total == BODY_SIZE
+    return elapsed, cpu, calls
+
+
+if __name__ == "__main__":
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    threading.Thread(target=serve, args=(listener,), daemon=True).start()
+    pool = HTTPConnectionPool("127.0.0.1", listener.getsockname()[1], retries=False)
+
+    for path in ("/content-length", "/chunked"):
+        for name, readinto in (
+            ("read() + copy", BaseHTTPResponse.readinto),
+            ("readinto()", lambda response, b: response.readinto(b)),
+        ):
+            elapsed, cpu, calls = download(pool, path, readinto)
+            copies = calls if readinto is BaseHTTPResponse.readinto else 0
+            print(
+                f"{path:16} {name:14} {BODY_SIZE / elapsed / 1024 ** 2:7.0f} MiB/s "
+                f"{cpu:6.2f}s CPU  {copies:6} intermediate bytes objects"
+            )
+
+
+"""
+Example results:
+
+/content-length  read() + copy     1509 MiB/s   0.66s CPU   16384 intermediate bytes objects
+/content-length  readinto()        1923 MiB/s   0.53s CPU       0 intermediate bytes objects
+/chunked         read() + copy     1531 MiB/s   0.66s CPU   16384 intermediate bytes objects
+/chunked         readinto()        1900 MiB/s   0.53s CPU       0 intermediate bytes objects
+"""
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+"""
+Compare the per-connection cost of building a fresh verified SSLContext, as
+HTTPSConnection.connect() does without a cache, against fetching the shared
+context from an SSLContextCache.
+"""
+
+import sys
+import timeit
+
+sys.path.append("../src")
+from urllib3.util.ssl_ import SSLContextCache, create_urllib3_context  # noqa: E402
+
+NUMBER = 200
+
+
+def fresh_context():
+    context = create_urllib3_context()
+    context.check_hostname = False
+    context.load_default_certs()
+    return context
+
+
+def cached_context(cache=SSLContextCache()):
+    return cache.get_context()
+
+
+if __name__ == "__main__":
+    fresh = timeit.timeit(fresh_context, number=NUMBER)
+    # The first lookup builds the context, exclude it as it only happens once.
+    cached_context()
+    cached = timeit.timeit(cached_context, number=NUMBER)
+
+    print(f"fresh context:  {fresh / NUMBER * 1e6:10.1f} us per connection")
+    print(f"cached context: {cached / NUMBER * 1e6:10.1f} us per connection")
+    print(f"speedup: {fresh / cached:0.0f}x")
+
+
+"""
+Example results:
+
+fresh context:     32481.3 us per connection
+cached context:        2.1 us per connection
+speedup: 15752x
+"""
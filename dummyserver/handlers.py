@@ -287,9 +287,9 @@ class TestingApp(RequestHandler):
         return Response(data, headers=[("Content-Type", "application/octet-stream")])
 
     def status(self, request):
-        status = request.params.get("status", "200 OK")
+        status = request.params.get("status", b"200 OK")
 
-        return Response(status=status)
+        return Response(status=status.decode("utf-8"))
 
     def retry_after(self, request):
         if datetime.now() - self.application.last_req < timedelta(seconds=1):
@@ -10,6 +10,10 @@ import nox
 TYPED_FILES = {
     "src/urllib3/contrib/__init__.py",
     "src/urllib3/__init__.py",
+    "src/urllib3/async_connection.py",
+    "src/urllib3/async_connectionpool.py",
+    "src/urllib3/async_poolmanager.py",
+    "src/urllib3/async_response.py",
     "src/urllib3/connection.py",
     "src/urllib3/connectionpool.py",
     "src/urllib3/exceptions.py",
@@ -18,7 +22,9 @@ TYPED_FILES = {
     "src/urllib3/filepost.py",
     "src/urllib3/poolmanager.py",
     "src/urllib3/request.py",
+    "src/urllib3/util/circuit_breaker.py",
     "src/urllib3/util/connection.py",
+    "src/urllib3/util/connection_limit.py",
     "src/urllib3/util/proxy.py",
     "src/urllib3/util/queue.py",
     "src/urllib3/util/response.py",
@@ -27,12 +33,16 @@ TYPED_FILES = {
     "src/urllib3/util/ssltransport.py",
     "src/urllib3/util/url.py",
     "src/urllib3/util/request.py",
+    "src/urllib3/util/resolver.py",
     "src/urllib3/util/retry.py",
+    "src/urllib3/util/stats.py",
     "src/urllib3/util/timeout.py",
+    "src/urllib3/util/trace.py",
     "src/urllib3/util/util.py",
     "src/urllib3/util/wait.py",
 }
 SOURCE_FILES = [
+    "bench/",
     "docs/",
     "dummyserver/",
     "src/",
@@ -42,7 +52,7 @@ SOURCE_FILES = [
 ]
 
 
-def tests_impl(session, extras="socks,secure,brotli"):
+def tests_impl(session, extras="socks,secure,brotli,zstd"):
     # Install deps and the package itself.
     session.install("-r", "dev-requirements.txt")
     session.install(f".[{extras}]")
@@ -165,7 +175,7 @@ def mypy(session):
 @nox.session
 def docs(session):
     session.install("-r", "docs/requirements.txt")
-    session.install(".[socks,secure,brotli]")
+    session.install(".[socks,secure,brotli,zstd]")
 
     session.chdir("docs")
     if os.path.exists("_build"):
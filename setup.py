@@ -119,5 +119,6 @@ setup(
             "certifi",
         ],
         "socks": ["PySocks>=1.5.6,<2.0,!=1.5.7"],
+        "zstd": ["zstandard>=0.18.0"],
     },
 )
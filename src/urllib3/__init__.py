@@ -11,6 +11,8 @@ from typing import Mapping, Optional, Type, Union
 from . import exceptions
 from ._collections import HTTPHeaderDict
 from ._version import __version__
+from .async_connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from .async_poolmanager import AsyncPoolManager
 from .connection import HTTPBody
 from .connectionpool import HTTPConnectionPool, HTTPSConnectionPool, connection_from_url
 from .filepost import _TYPE_FIELDS, encode_multipart_formdata
@@ -25,6 +27,9 @@ __license__ = "MIT"
 __version__ = __version__
 
 __all__ = (
+    "AsyncHTTPConnectionPool",
+    "AsyncHTTPSConnectionPool",
+    "AsyncPoolManager",
     "HTTPConnectionPool",
     "HTTPHeaderDict",
     "HTTPSConnectionPool",
@@ -4,6 +4,7 @@ from enum import Enum, auto
 from typing import (
     TYPE_CHECKING,
     Callable,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -16,6 +17,7 @@ from typing import (
     Tuple,
     TypeVar,
     Union,
+    ValuesView,
     cast,
     overload,
 )
@@ -107,19 +109,38 @@ class RecentlyUsedContainer(Generic[_KT, _VT], MutableMapping[_KT, _VT]):
     :param dispose_func:
         Every time an item is evicted from the container,
         ``dispose_func(value)`` is called.  Callback which will get called
+
+    :param eviction_rank:
+        If set, ``eviction_rank(value)`` is called for the items when one has
+        to be evicted to make room, and the least recently used item with the
+        lowest rank is evicted. Items with a rank of 0 or less are evicted
+        right away, without looking at more recently used ones.
+
+    :param evict_func:
+        If set, ``evict_func(key, value)`` is called instead of
+        ``dispose_func`` for items evicted to make room, but not for items
+        which were replaced, deleted or cleared.
     """
 
     _container: "OrderedDict[_KT, _VT]"
     _maxsize: int
     dispose_func: Optional[Callable[[_VT], None]]
+    eviction_rank: Optional[Callable[[_VT], int]]
+    evict_func: Optional[Callable[[_KT, _VT], None]]
     lock: RLock
 
     def __init__(
-        self, maxsize: int = 10, dispose_func: Optional[Callable[[_VT], None]] = None
+        self,
+        maxsize: int = 10,
+        dispose_func: Optional[Callable[[_VT], None]] = None,
+        eviction_rank: Optional[Callable[[_VT], int]] = None,
+        evict_func: Optional[Callable[[_KT, _VT], None]] = None,
     ) -> None:
         super().__init__()
         self._maxsize = maxsize
         self.dispose_func = dispose_func
+        self.eviction_rank = eviction_rank
+        self.evict_func = evict_func
         self._container = OrderedDict()
         self.lock = RLock()
 
@@ -132,6 +153,7 @@ class RecentlyUsedContainer(Generic[_KT, _VT], MutableMapping[_KT, _VT]):
 
     def __setitem__(self, key: _KT, value: _VT) -> None:
         evicted_item = None
+        made_room = False
         with self.lock:
             # Possibly evict the existing value of 'key'
             try:
@@ -144,15 +166,33 @@ class RecentlyUsedContainer(Generic[_KT, _VT], MutableMapping[_KT, _VT]):
                     # If we didn't evict an existing value, and we've hit our maximum
                     # size, then we have to evict the least recently used item from
                     # the beginning of the container.
-                    evicted_item = self._container.popitem(last=False)
+                    evicted_item = self._pop_eviction_candidate()
+                    made_room = True
 
             # Finally, insert the new value.
             self._container[key] = value
 
         # After releasing the lock on the pool, dispose of any evicted value.
-        if evicted_item is not None and self.dispose_func:
-            _, evicted_value = evicted_item
-            self.dispose_func(evicted_value)
+        if evicted_item is None:
+            return
+        if made_room and self.evict_func:
+            self.evict_func(*evicted_item)
+        elif self.dispose_func:
+            self.dispose_func(evicted_item[1])
+
+    def _pop_eviction_candidate(self) -> Tuple[_KT, _VT]:
+        if self.eviction_rank is None:
+            return self._container.popitem(last=False)
+
+        candidate = None
+        lowest = 0
+        for key, value in self._container.items():
+            rank = self.eviction_rank(value)
+            if candidate is None or rank < lowest:
+                candidate, lowest = key, rank
+                if rank <= 0:
+                    break
+        return candidate, self._container.pop(candidate)  # type: ignore
 
     def __delitem__(self, key: _KT) -> None:
         with self.lock:
@@ -184,6 +224,10 @@ class RecentlyUsedContainer(Generic[_KT, _VT], MutableMapping[_KT, _VT]):
         with self.lock:
             return set(self._container.keys())
 
+    def values(self) -> ValuesView[_VT]:
+        with self.lock:
+            return dict(self._container).values()
+
 
 class HTTPHeaderDictItemView(Set[Tuple[str, str]]):
     """
@@ -217,7 +261,7 @@ class HTTPHeaderDictItemView(Set[Tuple[str, str]]):
         self._headers = headers
 
     def __len__(self) -> int:
-        return len(list(self._headers.iteritems()))
+        return sum(len(vals) - 1 for vals in self._headers._container.values())
 
     def __iter__(self) -> Iterator[Tuple[str, str]]:
         return self._headers.iteritems()
@@ -264,10 +308,12 @@ class HTTPHeaderDict(MutableMapping[str, str]):
     '7'
     """
 
+    __slots__ = ("_container",)
+
+    # Maps each lower-cased field name to [first seen name, value, value, ...].
     _container: MutableMapping[str, List[str]]
 
     def __init__(self, headers: Optional[ValidHTTPHeaderSource] = None, **kwargs: str):
-        super().__init__()
         self._container = _ordered_dict()
         if headers is not None:
             if isinstance(headers, HTTPHeaderDict):
@@ -281,8 +327,10 @@ class HTTPHeaderDict(MutableMapping[str, str]):
         self._container[key.lower()] = [key, val]
 
     def __getitem__(self, key: str) -> str:
-        val = self._container[key.lower()]
-        return ", ".join(val[1:])
+        vals = self._container[key.lower()]
+        if len(vals) == 2:
+            return vals[1]
+        return ", ".join(vals[1:])
 
     def __delitem__(self, key: str) -> None:
         del self._container[key.lower()]
@@ -293,15 +341,13 @@ class HTTPHeaderDict(MutableMapping[str, str]):
         return False
 
     def __eq__(self, other: object) -> bool:
-        maybe_constructable = ensure_can_construct_http_header_dict(other)
-        if maybe_constructable is None:
-            return False
-        else:
-            other_as_http_header_dict = type(self)(maybe_constructable)
+        if not isinstance(other, HTTPHeaderDict):
+            maybe_constructable = ensure_can_construct_http_header_dict(other)
+            if maybe_constructable is None:
+                return False
+            other = type(self)(maybe_constructable)
 
-        return {k.lower(): v for k, v in self.itermerged()} == {
-            k.lower(): v for k, v in other_as_http_header_dict.itermerged()
-        }
+        return self._merged() == other._merged()
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
@@ -314,6 +360,12 @@ class HTTPHeaderDict(MutableMapping[str, str]):
         for vals in self._container.values():
             yield vals[0]
 
+    def _merged(self) -> Dict[str, str]:
+        return {
+            key_lower: ", ".join(vals[1:])
+            for key_lower, vals in self._container.items()
+        }
+
     def discard(self, key: str) -> None:
         try:
             del self[key]
@@ -348,15 +400,21 @@ class HTTPHeaderDict(MutableMapping[str, str]):
         other = args[0] if len(args) >= 1 else ()
 
         if isinstance(other, HTTPHeaderDict):
-            for key, val in other.iteritems():
-                self.add(key, val)
-        elif isinstance(other, Mapping):
-            for key, val in other.items():
-                self.add(key, val)
+            container = self._container
+            for key_lower, other_vals in other._container.items():
+                vals = container.get(key_lower)
+                if vals is None:
+                    container[key_lower] = other_vals[:]
+                else:
+                    vals.extend(other_vals[1:])
+        # The builtin types are checked first because checks against the
+        # abstract base classes are comparatively slow.
+        elif isinstance(other, (list, tuple)):
+            self._add_pairs(other)
+        elif isinstance(other, (dict, Mapping)):
+            self._add_pairs(other.items())
         elif isinstance(other, Iterable):
-            other = cast(Iterable[Tuple[str, str]], other)
-            for key, value in other:
-                self.add(key, value)
+            self._add_pairs(cast(Iterable[Tuple[str, str]], other))
         elif hasattr(other, "keys") and hasattr(other, "__getitem__"):
             # THIS IS NOT A TYPESAFE BRANCH
             # In this branch, the object has a `keys` attr but is not a Mapping or any of
@@ -366,8 +424,17 @@ class HTTPHeaderDict(MutableMapping[str, str]):
             for key in other.keys():
                 self.add(key, other[key])
 
-        for key, value in kwargs.items():
-            self.add(key, value)
+        if kwargs:
+            self._add_pairs(kwargs.items())
+
+    def _add_pairs(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        # Same as calling add() for each pair.
+        container = self._container
+        for key, val in pairs:
+            new_vals = [key, val]
+            vals = container.setdefault(key.lower(), new_vals)
+            if new_vals is not vals:
+                vals.append(val)
 
     @overload
     def getlist(self, key: str) -> List[str]:
@@ -407,9 +474,9 @@ class HTTPHeaderDict(MutableMapping[str, str]):
         return f"{type(self).__name__}({dict(self.itermerged())})"
 
     def _copy_from(self, other: "HTTPHeaderDict") -> None:
-        for key in other:
-            val = other.getlist(key)
-            self._container[key.lower()] = [key, *val]
+        container = self._container
+        for key_lower, vals in other._container.items():
+            container[key_lower] = vals[:]
 
     def copy(self) -> "HTTPHeaderDict":
         clone = type(self)()
@@ -418,21 +485,21 @@ class HTTPHeaderDict(MutableMapping[str, str]):
 
     def iteritems(self) -> Iterator[Tuple[str, str]]:
         """Iterate over all header lines, including duplicate ones."""
-        for key in self:
-            vals = self._container[key.lower()]
+        for vals in self._container.values():
+            key = vals[0]
             for val in vals[1:]:
-                yield vals[0], val
+                yield key, val
 
     def itermerged(self) -> Iterator[Tuple[str, str]]:
         """Iterate over all headers, merging duplicate ones together."""
-        for key in self:
-            val = self._container[key.lower()]
-            yield val[0], ", ".join(val[1:])
+        for vals in self._container.values():
+            yield vals[0], ", ".join(vals[1:])
 
     def items(self) -> HTTPHeaderDictItemView:
         return HTTPHeaderDictItemView(self)
 
     def _has_value_for_header(self, header_name: str, potential_value: str) -> bool:
-        if header_name in self:
-            return potential_value in self._container[header_name.lower()][1:]
-        return False
+        vals = self._container.get(header_name.lower())
+        if vals is None:
+            return False
+        return potential_value in vals[1:]
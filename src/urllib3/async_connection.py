@@ -0,0 +1,354 @@
+import asyncio
+import io
+import logging
+import os
+import socket
+import time
+from http.client import HTTPException
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional, Tuple, Union
+
+from .connection import (
+    BaseSSLError,
+    HTTPBody,
+    HTTPConnection,
+    HTTPLibResponse,
+    _match_hostname,
+    port_by_scheme,
+    ssl,
+)
+from .exceptions import ConnectTimeoutError, NewConnectionError
+from .util.ssl_ import SSLContextCache, assert_fingerprint, resolve_cert_reqs
+from .util.stats import PoolStats
+from .util.timeout import Timeout
+
+if TYPE_CHECKING:
+    from typing_extensions import Literal
+
+__all__ = ["AsyncHTTPConnection", "AsyncHTTPSConnection"]
+
+log = logging.getLogger(__name__)
+
+# Same limits as http.client.
+_MAXLINE = 65536
+_MAXHEADERS = 100
+
+
+def _resolve_timeout(value: Any) -> Optional[float]:
+    """Turn a value of :class:`~urllib3.util.Timeout` into seconds or None."""
+    if value is Timeout.DEFAULT_TIMEOUT:
+        return socket.getdefaulttimeout()
+    return value  # type: ignore
+
+
+class _RequestBuffer:
+    """
+    Stands in for the socket of an :class:`urllib3.connection.HTTPConnection`
+    to collect the bytes of a request instead of sending them.
+    """
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def sendall(self, data: bytes) -> None:
+        self.data += data
+
+
+class _HeadSocket:
+    """Socket returning the received response head to http.client."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def makefile(self, mode: str) -> io.BytesIO:
+        return io.BytesIO(self._data)
+
+
+class AsyncHTTPConnection:
+    """
+    Connection to an HTTP server over :mod:`asyncio` streams, used by
+    :class:`urllib3.AsyncHTTPConnectionPool`.
+
+    Requests are serialized by :class:`urllib3.connection.HTTPConnection`, so
+    they are validated and encoded exactly like synchronous requests, and
+    response heads are parsed by :mod:`http.client`. The request body is
+    built in memory before it is sent.
+
+    :param host: Host to connect to.
+    :param port: Port to connect to, 80 if None.
+    :param timeout: Seconds to wait for the connection to be established.
+    :param source_address: ``(host, port)`` to bind the socket to.
+    """
+
+    default_port: int = port_by_scheme["http"]
+
+    #: Whether this connection verifies the host's certificate.
+    is_verified: bool = False
+
+    #: :func:`time.monotonic` when the connection was opened.
+    connected_at: Optional[float] = None
+
+    #: :func:`time.monotonic` when the connection was last returned to its pool.
+    idle_since: Optional[float] = None
+
+    #: Stats of the pool the connection belongs to, which count the bytes sent.
+    pool_stats: Optional[PoolStats] = None
+
+    #: Whether the server is going to close the connection after the current
+    #: response, set when the response head was received.
+    will_close: bool = False
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+        source_address: Optional[Tuple[str, int]] = None,
+    ) -> None:
+        self.host = host
+        self.port = port or self.default_port
+        self.timeout = timeout
+        self.source_address = source_address
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._closing: Optional[asyncio.StreamWriter] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(host={self.host!r}, port={self.port!r})"
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection is open."""
+        return self.writer is not None
+
+    def is_dropped(self) -> bool:
+        """
+        Whether the connection was opened but has been closed by the server
+        since.
+        """
+        if self.reader is None or self.writer is None:
+            return False
+        return self.reader.at_eof() or self.writer.transport.is_closing()
+
+    async def _open(self, **kw: Any) -> None:
+        timeout = _resolve_timeout(self.timeout)
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.host.strip("[]"),
+                    self.port,
+                    local_addr=self.source_address,
+                    limit=_MAXLINE,
+                    **kw,
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={timeout})",
+            )
+        except BaseSSLError:
+            raise
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}")  # type: ignore
+
+        self.connected_at = time.monotonic()
+
+    async def connect(self) -> None:
+        """Open the connection."""
+        await self._open()
+
+    def close(self) -> None:
+        """Close the connection. It is opened again by the next request."""
+        writer, self.reader, self.writer = self.writer, None, None
+        self.will_close = False
+        if writer is not None:
+            writer.close()
+            self._closing = writer
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection closed by :meth:`close` was shut down."""
+        writer, self._closing = self._closing, None
+        if writer is None:
+            return
+        try:
+            if hasattr(writer, "wait_closed"):  # Python 3.7+
+                await writer.wait_closed()
+            else:
+                await asyncio.sleep(0)
+        except OSError:
+            pass
+
+    def _serialize_request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[HTTPBody],
+        headers: Optional[Mapping[str, str]],
+        chunked: bool,
+    ) -> bytes:
+        conn = HTTPConnection(self.host, self.port)
+        conn.default_port = self.default_port
+        conn.sock = buffer = _RequestBuffer()  # type: ignore
+        if chunked:
+            conn.request_chunked(method, url, body=body, headers=headers)
+        else:
+            conn.request(method, url, body=body, headers=headers)
+        return bytes(buffer.data)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[HTTPBody] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunked: bool = False,
+    ) -> None:
+        """
+        Send a request, connecting first if the connection isn't open. The
+        arguments have the same meaning as for
+        :meth:`urllib3.connection.HTTPConnection.request`.
+        """
+        data = self._serialize_request(method, url, body, headers, chunked)
+        if self.writer is None:
+            await self.connect()
+        assert self.writer is not None
+        self.writer.write(data)
+        await self.writer.drain()
+        if self.pool_stats is not None:
+            self.pool_stats.incr("bytes_sent", len(data))
+
+    async def _read_head(self) -> bytes:
+        """
+        Read the status line and headers of the response, skipping
+        informational responses other than ``101 Switching Protocols``.
+        """
+        assert self.reader is not None
+        while True:
+            lines: List[bytes] = []
+            while True:
+                try:
+                    line = await self.reader.readline()
+                except ValueError:
+                    raise HTTPException("got more than %d bytes in a line" % _MAXLINE)
+                lines.append(line)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                if len(lines) > _MAXHEADERS + 1:
+                    raise HTTPException("got more than %d headers" % _MAXHEADERS)
+
+            status = lines[0].split(None, 2)[1:2]
+            if status and status[0].startswith(b"1") and status[0] != b"101":
+                continue
+            return b"".join(lines)
+
+    async def getresponse(
+        self, method: str, timeout: Optional[float] = None
+    ) -> HTTPLibResponse:
+        """
+        Receive the head of the response to a request made with ``method``,
+        parsed into an :class:`~urllib3.connection.HTTPLibResponse` whose body must be
+        read from :attr:`reader`.
+
+        :raises asyncio.TimeoutError:
+            If the head wasn't received within ``timeout`` seconds.
+        """
+        head = await asyncio.wait_for(self._read_head(), timeout)
+        response = HTTPLibResponse(_HeadSocket(head), method=method)  # type: ignore
+        response.begin()
+        self.will_close = bool(response.will_close)
+        return response
+
+
+class AsyncHTTPSConnection(AsyncHTTPConnection):
+    """
+    Same as :class:`AsyncHTTPConnection`, but HTTPS. Certificates are verified
+    like by :class:`urllib3.connection.HTTPSConnection`: with
+    ``assert_fingerprint`` if given, else against ``assert_hostname`` or the
+    host. Unless an ``ssl_context`` is given, the context comes from
+    ``ssl_context_cache``.
+    """
+
+    default_port = port_by_scheme["https"]
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+        source_address: Optional[Tuple[str, int]] = None,
+        key_file: Optional[str] = None,
+        cert_file: Optional[str] = None,
+        key_password: Optional[str] = None,
+        cert_reqs: Optional[Union[int, str]] = None,
+        ca_certs: Optional[str] = None,
+        ca_cert_dir: Optional[str] = None,
+        ca_cert_data: Union[None, str, bytes] = None,
+        ssl_version: Optional[Union[int, str]] = None,
+        assert_hostname: Union[None, str, "Literal[False]"] = None,
+        assert_fingerprint: Optional[str] = None,
+        ssl_context: Optional["ssl.SSLContext"] = None,
+        ssl_context_cache: Optional[SSLContextCache] = None,
+        server_hostname: Optional[str] = None,
+    ) -> None:
+        super().__init__(host, port, timeout=timeout, source_address=source_address)
+        if cert_reqs is None and ssl_context is not None:
+            cert_reqs = ssl_context.verify_mode
+        self.key_file = key_file
+        self.cert_file = cert_file
+        self.key_password = key_password
+        self.cert_reqs = cert_reqs
+        self.ca_certs = ca_certs and os.path.expanduser(ca_certs)
+        self.ca_cert_dir = ca_cert_dir and os.path.expanduser(ca_cert_dir)
+        self.ca_cert_data = ca_cert_data
+        self.ssl_version = ssl_version
+        self.assert_hostname = assert_hostname
+        self.assert_fingerprint = assert_fingerprint
+        self.ssl_context = ssl_context
+        self.ssl_context_cache = ssl_context_cache or SSLContextCache(maxsize=1)
+        self.server_hostname = server_hostname
+
+    def _get_ssl_context(self) -> "ssl.SSLContext":
+        if self.ssl_context is not None:
+            self.ssl_context.verify_mode = resolve_cert_reqs(self.cert_reqs)
+            return self.ssl_context
+        return self.ssl_context_cache.get_context(
+            ssl_version=self.ssl_version,
+            cert_reqs=self.cert_reqs,
+            ca_certs=self.ca_certs,
+            ca_cert_dir=self.ca_cert_dir,
+            ca_cert_data=self.ca_cert_data,
+            certfile=self.cert_file,
+            keyfile=self.key_file,
+            key_password=self.key_password,
+        )
+
+    async def connect(self) -> None:
+        context = self._get_ssl_context()
+        server_hostname = self.server_hostname or self.host.rstrip(".")
+        await self._open(ssl=context, server_hostname=server_hostname)
+        assert self.writer is not None
+
+        try:
+            sock = self.writer.get_extra_info("ssl_object")
+            if self.assert_fingerprint:
+                assert_fingerprint(
+                    sock.getpeercert(binary_form=True), self.assert_fingerprint
+                )
+            elif (
+                context.verify_mode != ssl.CERT_NONE
+                and not context.check_hostname
+                and self.assert_hostname is not False
+            ):
+                _match_hostname(
+                    sock.getpeercert(), self.assert_hostname or server_hostname
+                )
+        except BaseException:
+            # Don't bother shutting down TLS with an untrusted server.
+            self.writer.transport.abort()
+            self.close()
+            raise
+
+        self.is_verified = context.verify_mode == ssl.CERT_REQUIRED or bool(
+            self.assert_fingerprint
+        )
@@ -0,0 +1,619 @@
+import asyncio
+import collections
+import logging
+import sys
+import time
+import warnings
+from typing import Any, Deque, Mapping, Optional, Type, Union
+
+from ._collections import HTTPHeaderDict
+from .async_connection import (
+    AsyncHTTPConnection,
+    AsyncHTTPSConnection,
+    _resolve_timeout,
+)
+from .async_response import AsyncHTTPResponse
+from .connection import BrokenPipeError, HTTPBody, port_by_scheme
+from .connectionpool import (
+    _RETRY_CONNECTION_ERRORS,
+    _TYPE_TIMEOUT,
+    ConnectionPool,
+    _Default,
+    _follow_up,
+    _wrap_connection_error,
+)
+from .exceptions import (
+    ClosedPoolError,
+    EmptyPoolError,
+    HeaderParsingError,
+    HostChangedError,
+    InsecureRequestWarning,
+    MaxRetryError,
+    ReadTimeoutError,
+)
+from .request import RequestMethods
+from .util.request import set_file_position
+from .util.response import assert_header_parsing
+from .util.retry import Retry
+from .util.ssl_ import SSLContextCache
+from .util.stats import PoolStats
+from .util.timeout import Timeout
+from .util.url import Url, _encode_target, parse_url
+from .util.util import to_str
+
+__all__ = ["AsyncHTTPConnectionPool", "AsyncHTTPSConnectionPool"]
+
+log = logging.getLogger(__name__)
+
+
+async def _sleep_for_retry(
+    retries: Retry, response: Optional[AsyncHTTPResponse] = None
+) -> None:
+    """Same as :meth:`urllib3.util.Retry.sleep`, without blocking the loop."""
+    if retries.respect_retry_after_header and response:
+        retry_after = retries.get_retry_after(response)  # type: ignore
+        if retry_after:
+            await asyncio.sleep(retry_after)
+            return
+
+    backoff = retries.get_backoff_time()
+    if backoff > 0:
+        await asyncio.sleep(backoff)
+
+
+class AsyncHTTPConnectionPool(ConnectionPool, RequestMethods):
+    """
+    Connection pool for one host, like :class:`urllib3.HTTPConnectionPool` but
+    for :mod:`asyncio`. Requests are coroutines which return an
+    :class:`urllib3.async_response.AsyncHTTPResponse`::
+
+        async with AsyncHTTPConnectionPool("example.com", maxsize=10) as pool:
+            response = await pool.request("GET", "/")
+
+    Retries, redirects, timeouts and headers work like for the synchronous
+    pool, and usage is counted in ``stats``. A pool must only be used from the
+    event loop it was first used in. Proxies aren't supported.
+
+    :param host:
+        Host used for this HTTP Connection (e.g. "localhost").
+
+    :param port:
+        Port used for this HTTP Connection (None is equivalent to 80).
+
+    :param timeout:
+        Timeout in seconds for connecting and for each read, or an instance
+        of :class:`urllib3.util.Timeout`.
+
+    :param maxsize:
+        Number of idle connections to keep for reuse.
+
+    :param block:
+        If set to True, no more than ``maxsize`` connections will be used at
+        a time, further requests wait for a connection to be released.
+
+    :param headers:
+        Headers to include with all requests, unless other headers are given
+        explicitly.
+
+    :param retries:
+        Retry configuration to use by default with requests in this pool.
+
+    :param \\**conn_kw:
+        Additional parameters are used to create fresh
+        :class:`urllib3.async_connection.AsyncHTTPConnection` instances.
+    """
+
+    scheme = "http"
+    ConnectionCls: Type[AsyncHTTPConnection] = AsyncHTTPConnection
+    ResponseCls = AsyncHTTPResponse
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        timeout: _TYPE_TIMEOUT = Timeout.DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        retries: Optional[Union[Retry, bool, int]] = None,
+        **conn_kw: Any,
+    ) -> None:
+        ConnectionPool.__init__(self, host, port)
+        RequestMethods.__init__(self, headers)
+
+        if not isinstance(timeout, Timeout):
+            timeout = Timeout.from_float(timeout)
+
+        if retries is None:
+            retries = Retry.DEFAULT  # type: ignore
+
+        self.timeout = timeout
+        self.retries = retries
+        self.maxsize = maxsize
+        self.block = block
+
+        self.pool: Optional[Deque[AsyncHTTPConnection]] = collections.deque()
+        # Created on first use, so that it belongs to the running loop.
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Set by close_when_idle().
+        self._close_when_idle = False
+
+        self.stats = PoolStats()
+        self.conn_kw = conn_kw
+
+    async def __aenter__(self) -> "AsyncHTTPConnectionPool":
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
+
+    @property
+    def num_connections(self) -> int:
+        """Number of connections opened, same as ``stats.connections_created``."""
+        return self.stats.connections_created
+
+    @property
+    def num_requests(self) -> int:
+        """Number of requests sent, same as ``stats.requests``."""
+        return self.stats.requests
+
+    def _new_conn(self) -> AsyncHTTPConnection:
+        """
+        Return a fresh :attr:`ConnectionCls` instance.
+        """
+        self.stats.incr("connections_created")
+        log.debug(
+            "Starting new %s connection (%d): %s:%s",
+            self.scheme.upper(),
+            self.num_connections,
+            self.host,
+            self.port or port_by_scheme[self.scheme],
+        )
+
+        conn = self.ConnectionCls(
+            host=self.host,
+            port=self.port,
+            timeout=self.timeout.connect_timeout,  # type: ignore
+            **self.conn_kw,
+        )
+        conn.pool_stats = self.stats
+        return conn
+
+    async def _get_conn(self, timeout: Optional[float] = None) -> AsyncHTTPConnection:
+        """
+        Get a connection. Will return a pooled connection if one is available.
+
+        :param timeout:
+            Seconds to wait before giving up and raising
+            :class:`urllib3.exceptions.EmptyPoolError` if :prop:`.block` is
+            ``True`` and ``maxsize`` connections are in use.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        start = time.monotonic()
+        if self.block:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.maxsize)
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self.stats.record_checkout(time.monotonic() - start)
+                raise EmptyPoolError(
+                    self,
+                    "Pool is empty and a new connection can't be opened due to blocking mode.",
+                )
+        self.stats.record_checkout(time.monotonic() - start)
+
+        conn = self.pool.pop() if self.pool else None
+        if conn and conn.is_dropped():
+            log.debug("Resetting dropped connection: %s", self.host)
+            self.stats.incr("connections_dropped")
+            conn.close()
+
+        if conn and conn.is_connected:
+            self.stats.incr("connections_reused")
+
+        self.stats.incr("in_flight")
+        return conn or self._new_conn()
+
+    def _put_conn(self, conn: Optional[AsyncHTTPConnection]) -> None:
+        """
+        Put a connection back into the pool, or just give up its slot if
+        ``conn`` is None.
+
+        Closed connections are discarded, as well as all connections once the
+        pool is full or closed.
+        """
+        self.stats.incr("in_flight", -1)
+        if self._slots is not None:
+            self._slots.release()
+
+        if self._close_when_idle and self.stats.in_flight <= 0:
+            # Closing first makes the code below close the connection.
+            self._close_when_idle = False
+            self.close()
+
+        if conn is None:
+            return
+        conn.idle_since = time.monotonic()
+
+        if self.pool is not None and conn.is_connected:
+            if len(self.pool) < self.maxsize:
+                self.pool.append(conn)
+                return
+            self.stats.incr("connections_discarded")
+            log.warning("Connection pool is full, discarding connection: %s", self.host)
+
+        conn.close()
+
+    async def _validate_conn(self, conn: AsyncHTTPConnection) -> None:
+        """
+        Called right before a request is made, connects ``conn`` if it isn't
+        open yet.
+        """
+        if not conn.is_connected:
+            await conn.connect()
+
+    def _get_timeout(self, timeout: _TYPE_TIMEOUT) -> Timeout:
+        """ Helper that always returns a :class:`urllib3.util.Timeout` """
+        if timeout is _Default:
+            return self.timeout.clone()
+
+        if isinstance(timeout, Timeout):
+            return timeout.clone()
+        else:
+            return Timeout.from_float(timeout)
+
+    async def _make_request(
+        self,
+        conn: AsyncHTTPConnection,
+        method: str,
+        url: str,
+        timeout_obj: Timeout,
+        body: Optional[HTTPBody] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunked: bool = False,
+        **response_kw: Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Send a request on ``conn`` and return the response once its headers
+        were received.
+        """
+        self.stats.incr("requests")
+
+        timeout_obj.start_connect()
+        conn.timeout = timeout_obj.connect_timeout  # type: ignore
+        await self._validate_conn(conn)
+
+        try:
+            await conn.request(method, url, body=body, headers=headers, chunked=chunked)
+        except BrokenPipeError:
+            # The server may legitimately close the connection after sending a
+            # valid response, which is still readable.
+            pass
+
+        read_timeout = _resolve_timeout(timeout_obj.read_timeout)
+        if read_timeout == 0:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={read_timeout})"
+            )
+
+        try:
+            httplib_response = await conn.getresponse(method, read_timeout)
+        except asyncio.TimeoutError:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={read_timeout})"
+            )
+
+        log.debug(
+            '%s://%s:%s "%s %s HTTP/1.1" %s %s',
+            self.scheme,
+            self.host,
+            self.port,
+            method,
+            url,
+            httplib_response.status,
+            httplib_response.length,
+        )
+
+        try:
+            assert_header_parsing(httplib_response.msg)
+        except (HeaderParsingError, TypeError) as hpe:
+            log.warning(
+                "Failed to parse headers (url=%s): %s",
+                self._absolute_url(url),
+                hpe,
+                exc_info=True,
+            )
+
+        headers = httplib_response.msg
+        if not isinstance(headers, HTTPHeaderDict):
+            headers = HTTPHeaderDict(headers.items())
+
+        return self.ResponseCls(
+            headers=headers,
+            status=httplib_response.status,
+            version=httplib_response.version,
+            reason=httplib_response.reason,
+            pool=self,
+            connection=conn,
+            msg=httplib_response.msg,
+            request_method=method,
+            read_timeout=read_timeout,
+            **response_kw,
+        )
+
+    def _absolute_url(self, path: str) -> str:
+        return Url(scheme=self.scheme, host=self.host, port=self.port, path=path).url
+
+    def close(self) -> None:
+        """
+        Close all idle connections and disable the pool. Connections in use
+        are closed when they are released.
+        """
+        if self.pool is None:
+            return
+        old_pool, self.pool = self.pool, None
+        while old_pool:
+            old_pool.pop().close()
+
+    async def aclose(self) -> None:
+        """
+        Same as :meth:`close`, and wait until the idle connections were shut
+        down.
+        """
+        conns = list(self.pool or ())
+        self.close()
+        await asyncio.gather(*(conn.wait_closed() for conn in conns))
+
+    def _eviction_rank(self) -> int:
+        """
+        Same as :meth:`urllib3.HTTPConnectionPool._eviction_rank`.
+        """
+        if self.stats.in_flight > 0:
+            return 2
+        if self.pool and any(conn.is_connected for conn in self.pool):
+            return 1
+        return 0
+
+    def close_when_idle(self) -> bool:
+        """
+        Same as :meth:`urllib3.HTTPConnectionPool.close_when_idle`.
+        """
+        if self.stats.in_flight > 0:
+            self._close_when_idle = True
+            return False
+        self.close()
+        return True
+
+    def _cancel_close(self) -> bool:
+        """
+        Same as :meth:`urllib3.HTTPConnectionPool._cancel_close`.
+        """
+        self._close_when_idle = False
+        return self.pool is not None
+
+    async def urlopen(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: Optional[HTTPBody] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        retries: Optional[Union[Retry, bool, int]] = None,
+        redirect: bool = True,
+        assert_same_host: bool = True,
+        timeout: _TYPE_TIMEOUT = _Default,
+        pool_timeout: Optional[float] = None,
+        chunked: bool = False,
+        body_pos: Optional[Union[int, object]] = None,
+        preload_content: bool = True,
+        **response_kw: Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Get a connection from the pool and perform an HTTP request, see
+        :meth:`urllib3.HTTPConnectionPool.urlopen` for the parameters.
+
+        With ``preload_content=False`` the response keeps its connection until
+        the body was read, or :meth:`~AsyncHTTPResponse.release_conn` is
+        called. There is no ``release_conn`` parameter.
+        """
+        parsed_url = parse_url(url)
+
+        if headers is None:
+            headers = self.headers
+
+        if not isinstance(retries, Retry):
+            retries = Retry.from_int(retries, redirect=redirect, default=self.retries)
+
+        # Check host
+        if assert_same_host and not self.is_same_host(url):
+            raise HostChangedError(self, url, retries)
+
+        # Ensure that the URL we're connecting to is properly encoded
+        if url.startswith("/"):
+            url = to_str(_encode_target(url))
+        else:
+            url = to_str(parsed_url.url)
+
+        conn = None
+        err = None
+        clean_exit = False
+
+        # Rewind body position, if needed. Record current position
+        # for future rewinds in the event of a redirect/retry.
+        body_pos = set_file_position(body, body_pos)
+
+        try:
+            timeout_obj = self._get_timeout(timeout)
+            conn = await self._get_conn(timeout=pool_timeout)
+
+            response = await self._make_request(
+                conn,
+                method,
+                url,
+                timeout_obj,
+                body=body,
+                headers=headers,
+                chunked=chunked,
+                retries=retries,
+                **response_kw,
+            )
+            # The response gives the connection back once the body was read.
+            conn = None
+
+            if preload_content:
+                await response.read(cache_content=True)
+
+            clean_exit = True
+
+        except EmptyPoolError:
+            # Didn't get a connection from the pool, no need to clean up
+            clean_exit = True
+            raise
+
+        except _RETRY_CONNECTION_ERRORS as e:
+            e = _wrap_connection_error(e, None)
+
+            retries = retries.increment(
+                method, url, error=e, _pool=self, _stacktrace=sys.exc_info()[2]
+            )
+            await _sleep_for_retry(retries)
+
+            # Keep track of the error for the retry warning.
+            err = e
+
+        finally:
+            if not clean_exit and conn is not None:
+                # Discard the connection, it will be replaced during the next
+                # _get_conn() call.
+                conn.close()
+                self._put_conn(conn)
+
+        if not clean_exit:
+            # Try again
+            log.warning(
+                "Retrying (%r) after connection broken by '%r': %s", retries, err, url
+            )
+            return await self.urlopen(
+                method,
+                url,
+                body,
+                headers,
+                retries,
+                redirect,
+                assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                **response_kw,
+            )
+
+        # Handle redirects and retries of the response.
+        try:
+            follow_up = _follow_up(self, method, url, response, retries, redirect)
+        except MaxRetryError:
+            await response.drain_conn()
+            raise
+        if follow_up is None:
+            return response
+
+        await response.drain_conn()
+        if follow_up.is_redirect:
+            retry_after = follow_up.retries.get_retry_after(response)  # type: ignore
+            if retry_after:
+                await asyncio.sleep(retry_after)
+            log.debug("Redirecting %s -> %s", url, follow_up.url)
+        else:
+            await _sleep_for_retry(follow_up.retries, response)
+            log.debug("Retry: %s", url)
+        return await self.urlopen(
+            follow_up.method,
+            follow_up.url,
+            body,
+            headers,
+            retries=follow_up.retries,
+            redirect=redirect,
+            assert_same_host=assert_same_host,
+            timeout=timeout,
+            pool_timeout=pool_timeout,
+            chunked=chunked,
+            body_pos=body_pos,
+            preload_content=preload_content,
+            **response_kw,
+        )
+
+
+class AsyncHTTPSConnectionPool(AsyncHTTPConnectionPool):
+    """
+    Same as :class:`.AsyncHTTPConnectionPool`, but HTTPS. The TLS parameters
+    have the same meaning as for :class:`urllib3.HTTPSConnectionPool`, and
+    ``stats.tls_handshakes`` counts the handshakes made by the pool.
+    """
+
+    scheme = "https"
+    ConnectionCls = AsyncHTTPSConnection
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        timeout: _TYPE_TIMEOUT = Timeout.DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        retries: Optional[Union[Retry, bool, int]] = None,
+        key_file: Optional[str] = None,
+        cert_file: Optional[str] = None,
+        cert_reqs: Optional[Union[int, str]] = None,
+        key_password: Optional[str] = None,
+        ca_certs: Optional[str] = None,
+        ssl_version: Optional[Union[int, str]] = None,
+        assert_hostname: Optional[Union[str, bool]] = None,
+        assert_fingerprint: Optional[str] = None,
+        ca_cert_dir: Optional[str] = None,
+        ssl_context_cache: Optional[SSLContextCache] = None,
+        **conn_kw: Any,
+    ) -> None:
+        if ssl_context_cache is None:
+            ssl_context_cache = SSLContextCache()
+        conn_kw.update(
+            key_file=key_file,
+            cert_file=cert_file,
+            cert_reqs=cert_reqs,
+            key_password=key_password,
+            ca_certs=ca_certs,
+            ssl_version=ssl_version,
+            assert_hostname=assert_hostname,
+            assert_fingerprint=assert_fingerprint,
+            ca_cert_dir=ca_cert_dir,
+            ssl_context_cache=ssl_context_cache,
+        )
+        super().__init__(
+            host, port, timeout, maxsize, block, headers, retries, **conn_kw
+        )
+        self.ssl_context_cache = ssl_context_cache
+
+    async def _validate_conn(self, conn: AsyncHTTPConnection) -> None:
+        """
+        Called right before a request is made, connects ``conn`` if it isn't
+        open yet.
+        """
+        if not conn.is_connected:
+            await conn.connect()
+            self.stats.incr("tls_handshakes")
+
+        if not conn.is_verified:
+            warnings.warn(
+                (
+                    f"Unverified HTTPS request is being made to host '{conn.host}'. "
+                    "Adding certificate verification is strongly advised. See: "
+                    "https://urllib3.readthedocs.io/en/latest/advanced-usage.html"
+                    "#tls-warnings"
+                ),
+                InsecureRequestWarning,
+            )
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from typing import Any, Dict, NoReturn, Optional
+
+from .async_connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from .async_response import AsyncHTTPResponse
+from .exceptions import MaxRetryError
+from .poolmanager import PoolManager
+from .util.url import parse_url
+
+__all__ = ["AsyncPoolManager"]
+
+log = logging.getLogger(__name__)
+
+async_pool_classes_by_scheme = {
+    "http": AsyncHTTPConnectionPool,
+    "https": AsyncHTTPSConnectionPool,
+}
+
+
+class AsyncPoolManager(PoolManager):
+    """
+    Same as :class:`urllib3.PoolManager`, but keeps
+    :class:`urllib3.AsyncHTTPConnectionPool` instances and its requests are
+    coroutines::
+
+        async with urllib3.AsyncPoolManager() as http:
+            response = await http.request("GET", "https://example.com/")
+
+    Pools are keyed and created like by :class:`~urllib3.PoolManager`, HTTPS
+    pools share an :class:`urllib3.util.ssl_.SSLContextCache`, requests go
+    through the ``circuit_breaker`` and :meth:`stats` adds up the stats of all
+    pools. :meth:`request_many`, :meth:`prewarm`, ``max_total_connections``
+    and ``connection_limit`` aren't supported.
+    """
+
+    def __init__(
+        self, num_pools: int = 10, headers: Optional[Dict[str, str]] = None, **kw: Any
+    ) -> None:
+        for name in ("max_total_connections", "connection_limit"):
+            if kw.get(name) is not None:
+                raise TypeError(f"AsyncPoolManager doesn't support {name}")
+        super().__init__(num_pools, headers, **kw)
+        self.pool_classes_by_scheme = async_pool_classes_by_scheme  # type: ignore
+
+    async def __aenter__(self) -> "AsyncPoolManager":
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Same as :meth:`clear`, and wait until the idle connections of the
+        pools were shut down.
+        """
+        pools = list(self.pools.values())
+        await asyncio.gather(*(pool.aclose() for pool in pools))
+        self.clear()
+
+    def _new_pool(  # type: ignore[override]
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncHTTPConnectionPool:
+        if request_context is None:
+            request_context = self.connection_pool_kw.copy()
+        if scheme == "https":
+            request_context.setdefault("ssl_context_cache", self.ssl_context_cache)
+        return super()._new_pool(scheme, host, port, request_context)  # type: ignore
+
+    async def urlopen(  # type: ignore[override]
+        self, method: str, url: str, redirect: bool = True, **kw: Any
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.urlopen`, awaiting
+        :meth:`urllib3.AsyncHTTPConnectionPool.urlopen`.
+        """
+        u = parse_url(url)
+
+        conn: AsyncHTTPConnectionPool = self.connection_from_host(  # type: ignore
+            u.host, port=u.port, scheme=u.scheme
+        )
+
+        kw["assert_same_host"] = False
+        kw["redirect"] = False
+
+        if "headers" not in kw:
+            kw["headers"] = self.headers.copy()  # type: ignore
+
+        circuit = self._allow_request(conn, url)
+        try:
+            response = await conn.urlopen(method, u.request_uri, **kw)
+        except Exception as e:
+            self._record_outcome(circuit, error=e)
+            raise
+        self._record_outcome(circuit, response=response)
+
+        try:
+            follow_up = self._follow_redirect(conn, method, url, response, redirect, kw)
+        except MaxRetryError:
+            await response.drain_conn()
+            raise
+        if follow_up is None:
+            return response
+
+        method, redirect_location = follow_up
+        log.info("Redirecting %s -> %s", url, redirect_location)
+
+        await response.drain_conn()
+        return await self.urlopen(method, redirect_location, **kw)
+
+    def request_many(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """
+        Not supported, gather the :meth:`request` coroutines instead.
+        """
+        raise NotImplementedError(
+            "AsyncPoolManager doesn't support request_many(), "
+            "use asyncio.gather() with request() instead"
+        )
+
+    def prewarm(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """
+        Not supported, connections are opened by the first requests.
+        """
+        raise NotImplementedError("AsyncPoolManager doesn't support prewarm()")
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import typing
+from http.client import HTTPException
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Optional, TypeVar
+
+from .connection import BaseSSLError
+from .exceptions import (
+    HTTPError,
+    IncompleteRead,
+    InvalidChunkLength,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+from .response import BaseHTTPResponse
+
+if TYPE_CHECKING:
+    from .async_connection import AsyncHTTPConnection
+    from .async_connectionpool import AsyncHTTPConnectionPool
+    from .util.retry import Retry
+
+__all__ = ["AsyncHTTPResponse"]
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class AsyncHTTPResponse(BaseHTTPResponse):
+    """
+    Response returned by :class:`urllib3.AsyncHTTPConnectionPool` and
+    :class:`urllib3.AsyncPoolManager`, with the same interface as
+    :class:`urllib3.response.HTTPResponse` except that reading the body is
+    awaited::
+
+        response = await http.request("GET", url, preload_content=False)
+        async for chunk in response.stream(1024):
+            ...
+
+    The response holds on to its connection until the body was read
+    completely, or :meth:`release_conn` or :meth:`close` is called. With
+    ``preload_content=True``, the default, the body was already read into
+    :attr:`data`.
+
+    :param read_timeout:
+        Seconds to wait for each read of the body, None to wait forever.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[typing.Mapping[str, str]] = None,
+        status: int = 0,
+        version: int = 0,
+        reason: Optional[str] = None,
+        decode_content: bool = True,
+        pool: Optional["AsyncHTTPConnectionPool"] = None,
+        connection: Optional["AsyncHTTPConnection"] = None,
+        msg: Any = None,
+        retries: Optional["Retry"] = None,
+        request_method: Optional[str] = None,
+        request_url: Optional[str] = None,
+        read_timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            headers=headers,
+            status=status,
+            version=version,
+            reason=reason,  # type: ignore
+            decode_content=decode_content,
+        )
+        self.retries = retries
+        self.msg = msg
+        self.read_timeout = read_timeout
+
+        self._body: Optional[bytes] = None
+        self._pool = pool
+        self._connection = connection
+        self._request_url = request_url
+        self._fp_bytes_read = 0
+
+        # The stream the body is read from, None once it was read.
+        self._fp = connection.reader if connection is not None else None
+
+        self.chunk_left: Optional[int] = None
+        self.length_remaining: Optional[int] = self._init_length(request_method)
+        if request_method == "HEAD":
+            self.length_remaining = 0
+
+    @property
+    def data(self) -> bytes:
+        """
+        The body read with ``preload_content=True`` or
+        ``await read(cache_content=True)``, empty until then.
+        """
+        return self._body or b""
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL that was the source of this response.
+        If the request that generated this response redirected, this method
+        will return the final redirect location.
+        """
+        if self.retries is not None and self.retries.history:
+            return self.retries.history[-1].redirect_location  # type: ignore
+        else:
+            return self._request_url  # type: ignore
+
+    @property
+    def connection(self) -> Optional["AsyncHTTPConnection"]:
+        return self._connection
+
+    @property
+    def closed(self) -> bool:
+        return self._fp is None
+
+    def tell(self) -> int:
+        """
+        Obtain the number of bytes pulled over the wire so far. May differ from
+        the amount of content returned by :meth:`read` if bytes are encoded on
+        the wire (e.g, compressed).
+        """
+        return self._fp_bytes_read
+
+    def release_conn(self) -> None:
+        """
+        Return the connection to the pool. If the body wasn't read completely
+        the connection is closed first, since it can't be reused.
+        """
+        if self._fp is not None and self._connection is not None:
+            self._connection.close()
+        self._fp = None
+
+        if not self._pool or not self._connection:
+            return
+
+        self._pool._put_conn(self._connection)
+        self._connection = None
+
+    async def drain_conn(self) -> None:  # type: ignore[override]
+        """
+        Read and discard any remaining HTTP response data in the response
+        connection, so that the connection can be reused.
+        """
+        try:
+            await self.read()
+        except (HTTPError, OSError, BaseSSLError, HTTPException):
+            pass
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+        self.release_conn()
+
+    async def _wait(self, aw: Awaitable[_T]) -> _T:
+        try:
+            return await asyncio.wait_for(aw, self.read_timeout)
+        except asyncio.TimeoutError:
+            raise ReadTimeoutError(self._pool, None, "Read timed out.")  # type: ignore
+
+    async def _read_exactly(self, amt: int) -> bytes:
+        assert self._fp is not None
+        try:
+            return await self._wait(self._fp.readexactly(amt))
+        except asyncio.IncompleteReadError as e:
+            self._fp_bytes_read += len(e.partial)
+            raise IncompleteRead(self._fp_bytes_read, amt - len(e.partial))
+
+    async def _read_chunked(self, amt: Optional[int]) -> bytes:
+        assert self._fp is not None
+        parts = []
+        while self._fp is not None and (amt is None or not parts):
+            if self.chunk_left is None:
+                line = await self._wait(self._fp.readline())
+                line = line.split(b";", 1)[0]
+                try:
+                    self.chunk_left = int(line, 16)
+                except ValueError:
+                    self.close()
+                    raise InvalidChunkLength(self, line)  # type: ignore
+
+                if self.chunk_left == 0:
+                    # Discard the trailers up to the final empty line.
+                    while line not in (b"\r\n", b"\n", b""):
+                        line = await self._wait(self._fp.readline())
+                    self._finish()
+                    break
+
+            size = self.chunk_left if amt is None else min(amt, self.chunk_left)
+            parts.append(await self._read_exactly(size))
+            self.chunk_left -= size
+            if self.chunk_left == 0:
+                await self._read_exactly(2)  # Toss the CRLF at the end of the chunk.
+                self.chunk_left = None
+        return b"".join(parts)
+
+    async def _read_raw(self, amt: Optional[int]) -> bytes:
+        """Read up to ``amt`` bytes of the body, or all of it if None."""
+        assert self._fp is not None
+        if self.length_remaining is not None:
+            size = self.length_remaining
+            if amt is not None:
+                size = min(amt, size)
+            data = await self._read_exactly(size)
+            self.length_remaining -= len(data)
+            if self.length_remaining == 0:
+                self._finish()
+        elif self.chunked:
+            data = await self._read_chunked(amt)
+        else:
+            # Without a length the body ends when the connection is closed.
+            data = await self._wait(self._fp.read(-1 if amt is None else amt))
+            if amt is None or not data:
+                self._finish()
+        return data
+
+    def _finish(self) -> None:
+        """Called once the body was read, to give the connection back."""
+        self._fp = None
+        if self._connection is not None and self._connection.will_close:
+            self._connection.close()
+        self.release_conn()
+
+    async def read(  # type: ignore[override]
+        self,
+        amt: Optional[int] = None,
+        decode_content: Optional[bool] = None,
+        cache_content: bool = False,
+    ) -> bytes:
+        """
+        Similar to :meth:`urllib3.response.HTTPResponse.read`, read and return
+        up to ``amt`` bytes of the body, or all of it if ``amt`` is None.
+        Returns ``b""`` once the body was read.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param cache_content:
+            If True, save the returned data in :attr:`data`. Ignored if
+            ``amt`` is set.
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        if self._fp is None:
+            return b""
+
+        clean_exit = False
+        try:
+            data = await self._read_raw(amt)
+            clean_exit = True
+        except BaseSSLError as e:
+            raise SSLError(e)
+        except (HTTPException, OSError) as e:
+            # This includes IncompleteRead.
+            raise ProtocolError(f"Connection broken: {e!r}", e)
+        finally:
+            if not clean_exit:
+                # The connection can't be reused once its response is broken.
+                self.close()
+
+        self._fp_bytes_read += len(data)
+        if self._pool is not None:
+            self._pool.stats.incr("bytes_received", len(data))
+
+        flush_decoder = amt is None or self._fp is None
+        if data or flush_decoder:
+            data = self._decode(data, decode_content, flush_decoder)
+
+        if cache_content and amt is None:
+            self._body = data
+
+        return data
+
+    async def stream(  # type: ignore[override]
+        self, amt: int = 2 ** 16, decode_content: Optional[bool] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Asynchronous generator of the body in pieces of up to ``amt`` bytes,
+        see :meth:`urllib3.response.HTTPResponse.stream`.
+        """
+        while self._fp is not None:
+            data = await self.read(amt=amt, decode_content=decode_content)
+            if data:
+                yield data
@@ -1,13 +1,19 @@
 import datetime
+import io
 import logging
 import os
 import re
 import socket
+import stat
 import sys
+import time
 import warnings
 from copy import copy
-from http.client import HTTPConnection as _HTTPConnection
 from http.client import HTTPException  # noqa: F401
+from http.client import CONTINUE, NO_CONTENT, NOT_MODIFIED
+from http.client import HTTPConnection as _HTTPConnection
+from http.client import HTTPResponse as _HttplibHTTPResponse
+from http.client import NotConnected, UnknownProtocol
 from socket import timeout as SocketTimeout
 from typing import (
     IO,
@@ -15,6 +21,7 @@ from typing import (
     Any,
     Callable,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -42,14 +49,20 @@ except (ImportError, AttributeError):  # Platform-specific: No SSL.
 
 from ._version import __version__
 from .exceptions import (
+    ConnectionLimitError,
     ConnectTimeoutError,
     HTTPSProxyError,
     NewConnectionError,
     SystemTimeWarning,
 )
 from .util import SKIP_HEADER, SKIPPABLE_HEADERS, connection, ssl_
+from .util.connection_limit import ConnectionLimit
+from .util.resolver import Resolver
+from .util.response import parse_headers
 from .util.ssl_ import (
     PeerCertRetType,
+    SSLContextCache,
+    SSLSessionCache,
     assert_fingerprint,
     create_urllib3_context,
     resolve_cert_reqs,
@@ -57,6 +70,8 @@ from .util.ssl_ import (
     ssl_wrap_socket,
 )
 from .util.ssl_match_hostname import CertificateError, match_hostname
+from .util.stats import PoolStats
+from .util.trace import Tracer, _TracingResolver
 
 # Not a no-op, we're adding this to the namespace so it can be imported.
 ConnectionError = ConnectionError
@@ -73,6 +88,13 @@ RECENT_DATE = datetime.date(2020, 7, 1)
 
 _CONTAINS_CONTROL_CHAR_RE = re.compile(r"[^-!#$%&'*+.^_`|~0-9a-zA-Z]")
 
+#: Size of the blocks which file bodies are sent in when they can't be sent with
+#: :meth:`socket.socket.sendfile`, for example over TLS.
+DEFAULT_BLOCKSIZE = 64 * 1024
+
+# Most buffers passed to one socket.sendmsg() call, IOV_MAX on Linux and macOS.
+_IOV_MAX = 1024
+
 
 HTTPBody = Union[bytes, IO[Any], Iterable[bytes], str]
 
@@ -82,6 +104,79 @@ class ProxyConfig(NamedTuple):
     use_forwarding_for_https: bool
 
 
+class HTTPLibResponse(_HttplibHTTPResponse):
+    """
+    :class:`http.client.HTTPResponse` whose headers are read with
+    :func:`urllib3.util.response.parse_headers`, straight into the
+    :class:`~urllib3._collections.HTTPHeaderDict` that
+    :meth:`urllib3.response.HTTPResponse.from_httplib` uses without copying it.
+    """
+
+    def begin(self) -> None:
+        if self.headers is not None:
+            # We've already started reading the response.
+            return
+
+        # Read until we get a non-100 response.
+        while True:
+            version, status, reason = self._read_status()  # type: ignore[attr-defined]
+            if status != CONTINUE:
+                break
+            skipped_headers = parse_headers(self.fp)
+            if self.debuglevel > 0:
+                print("headers:", skipped_headers)
+
+        self.code = self.status = status
+        self.reason = reason.strip()
+        if version in ("HTTP/1.0", "HTTP/0.9"):
+            # Some servers might still return "0.9", treat it as 1.0 anyway.
+            self.version = 10
+        elif version.startswith("HTTP/1."):
+            self.version = 11
+        else:
+            raise UnknownProtocol(version)
+
+        self.headers = self.msg = parse_headers(self.fp)  # type: ignore[assignment]
+
+        if self.debuglevel > 0:
+            for hdr, val in self.headers.items():
+                print("header:", hdr + ":", val)
+
+        tr_enc = self.headers.get("transfer-encoding")
+        if tr_enc and tr_enc.lower() == "chunked":
+            self.chunked = True
+            self.chunk_left = None
+        else:
+            self.chunked = False
+
+        self.will_close = self._check_close()  # type: ignore[attr-defined]
+
+        # RFC 7230 3.3.3: Content-Length is ignored if the body is chunked.
+        self.length = None
+        length = self.headers.get("content-length")
+        if length and not self.chunked:
+            try:
+                self.length = int(length)
+            except ValueError:
+                self.length = None
+            else:
+                if self.length < 0:  # Ignore nonsensical negative lengths.
+                    self.length = None
+
+        if (
+            status == NO_CONTENT
+            or status == NOT_MODIFIED
+            or 100 <= status < 200
+            or self._method == "HEAD"  # type: ignore[attr-defined]
+        ):
+            self.length = 0
+
+        # Without chunking or a Content-Length the body ends when the
+        # connection is closed.
+        if not self.will_close and not self.chunked and self.length is None:
+            self.will_close = True
+
+
 class HTTPConnection(_HTTPConnection):
     """
     Based on :class:`http.client.HTTPConnection` but provides an extra constructor
@@ -105,10 +200,22 @@ class HTTPConnection(_HTTPConnection):
          ]
 
       Or you may want to disable the defaults by passing an empty list (e.g., ``[]``).
+    - ``happy_eyeballs_delay``: Race connection attempts to all addresses of the host as
+      described in :rfc:`8305`, starting a new attempt every ``happy_eyeballs_delay``
+      seconds. This avoids waiting for the full connect timeout when one address family,
+      usually IPv6, is unreachable. See :func:`urllib3.util.connection.create_connection`.
+    - ``resolver``: The :class:`urllib3.util.resolver.Resolver` used to look up the
+      addresses of the host, for example a :class:`~urllib3.util.resolver.CachingResolver`.
+    - ``blocksize``: Size of the blocks in which file bodies are read and sent when they
+      can't be sent with :meth:`socket.socket.sendfile`, which is used for regular files
+      over plain TCP. Defaults to :data:`DEFAULT_BLOCKSIZE`.
     """
 
     default_port: int = port_by_scheme["http"]
 
+    #: Class of the responses returned by :meth:`getresponse`.
+    response_class = HTTPLibResponse
+
     #: Disable Nagle's algorithm by default.
     #: ``[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]``
     default_socket_options: connection.SocketOptions = [
@@ -118,26 +225,55 @@ class HTTPConnection(_HTTPConnection):
     #: Whether this connection verifies the host's certificate.
     is_verified: bool = False
 
+    #: :func:`time.monotonic` when the socket was connected.
+    connected_at: Optional[float] = None
+
+    #: :func:`time.monotonic` when the connection was last returned to its pool.
+    idle_since: Optional[float] = None
+
+    #: Stats of the pool the connection belongs to, which count the bytes sent.
+    pool_stats: Optional[PoolStats] = None
+
+    #: :class:`urllib3.util.trace.Tracer` receiving the events of connecting,
+    #: set by the pool for each request.
+    tracer: Optional[Tracer] = None
+
+    #: :class:`urllib3.util.ConnectionLimit` which the connection takes a
+    #: slot of while it is connected, set by the pool.
+    connection_limit: Optional[ConnectionLimit] = None
+
+    # Whether the connection took a slot of connection_limit.
+    _holds_connection_slot = False
+
     source_address: Optional[Tuple[str, int]]
     socket_options: Optional[connection.SocketOptions]
+    happy_eyeballs_delay: Optional[float]
+    resolver: Optional[Resolver]
     _tunnel_host: Optional[str]
     _tunnel: Callable[["HTTPConnection"], None]
 
+    # Data passed to send() is queued here instead while it's not None.
+    _write_queue: Optional[List[bytes]] = None
+
     def __init__(
         self,
         host: str,
         port: Optional[int] = None,
         timeout: Optional[float] = connection.SOCKET_GLOBAL_DEFAULT_TIMEOUT,
         source_address: Optional[Tuple[str, int]] = None,
-        blocksize: int = 8192,
+        blocksize: int = DEFAULT_BLOCKSIZE,
         socket_options: Optional[connection.SocketOptions] = default_socket_options,
         proxy: Optional[str] = None,
         proxy_config: Optional[ProxyConfig] = None,
+        happy_eyeballs_delay: Optional[float] = None,
+        resolver: Optional[Resolver] = None,
     ) -> None:
         # Pre-set source_address.
         self.source_address = source_address
 
         self.socket_options = socket_options
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self.resolver = resolver
 
         # Proxy options provided by the user.
         self.proxy = proxy
@@ -155,6 +291,7 @@ class HTTPConnection(_HTTPConnection):
             super().__init__(
                 host=host, port=port, timeout=timeout, source_address=source_address
             )
+            self.blocksize = blocksize
 
     # https://github.com/python/mypy/issues/4125
     # Mypy treats this as LSP violation, which is considered a bug.
@@ -195,6 +332,14 @@ class HTTPConnection(_HTTPConnection):
 
         :return: New socket connection.
         """
+        tracer = self.tracer
+        resolver = self.resolver
+        if tracer is not None:
+            tracer.event("connect_start", time.monotonic())
+            resolver = _TracingResolver(resolver, tracer)
+
+        if self.connection_limit is not None:
+            self._acquire_connection_slot(self.connection_limit)
 
         try:
             conn = connection.create_connection(
@@ -202,19 +347,55 @@ class HTTPConnection(_HTTPConnection):
                 self.timeout,
                 source_address=self.source_address,
                 socket_options=self.socket_options,
+                happy_eyeballs_delay=self.happy_eyeballs_delay,
+                resolver=resolver,
             )
 
         except SocketTimeout:
+            self._release_connection_slot()
             raise ConnectTimeoutError(
                 self,
                 f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
             )
 
         except OSError as e:
+            self._release_connection_slot()
             raise NewConnectionError(self, f"Failed to establish a new connection: {e}")  # type: ignore
 
+        self.connected_at = time.monotonic()
+        if tracer is not None:
+            tracer.event("connect_end", self.connected_at)
         return conn
 
+    def _acquire_connection_slot(self, limit: ConnectionLimit) -> None:
+        if self._holds_connection_slot:
+            return
+        if not limit.acquire(blocking=False):
+            if self.pool_stats is not None:
+                self.pool_stats.incr("connection_limit_waits")
+            timeout = self.timeout
+            if timeout is connection.SOCKET_GLOBAL_DEFAULT_TIMEOUT:
+                timeout = None
+            if not limit.acquire(timeout=timeout):
+                raise ConnectionLimitError(
+                    self,
+                    f"Timed out waiting for one of the {limit.max_connections} "
+                    f"connections allowed by the connection limit. "
+                    f"(connect timeout={self.timeout})",
+                )
+        self._holds_connection_slot = True
+
+    def _release_connection_slot(self) -> None:
+        if self._holds_connection_slot:
+            self._holds_connection_slot = False
+            self.connection_limit.release()  # type: ignore
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._release_connection_slot()
+
     def _is_using_tunnel(self) -> Optional[str]:
         return self._tunnel_host
 
@@ -262,6 +443,19 @@ class HTTPConnection(_HTTPConnection):
                 f"urllib3.util.SKIP_HEADER only supports '{skippable_headers}'"
             )
 
+    def send(self, data: Any) -> None:
+        """"""
+        if self._write_queue is not None:
+            self._write_queue.append(data)
+            return
+        super().send(data)
+        if self.pool_stats is None:
+            return
+        if isinstance(data, (bytes, bytearray)):
+            self.pool_stats.incr("bytes_sent", len(data))
+        elif isinstance(data, memoryview):
+            self.pool_stats.incr("bytes_sent", data.nbytes)
+
     # `request` method's signature intentionally violates LSP.
     # urllib3's API is different from `http.client.HTTPConnection` and the subclassing is only incidental.
     def request(  # type: ignore
@@ -276,11 +470,109 @@ class HTTPConnection(_HTTPConnection):
         else:
             # Avoid modifying the headers passed into .request()
             headers = copy(headers)
-        if "user-agent" not in (to_str(k.lower()) for k in headers):
+        header_keys = {to_str(k.lower()) for k in headers}
+        if "user-agent" not in header_keys:
             updated_headers = {"User-Agent": _get_default_user_agent()}
             updated_headers.update(headers)
             headers = updated_headers
-        super().request(method, url, body=body, headers=headers)
+
+        length = None
+        if hasattr(body, "read") and "transfer-encoding" not in header_keys:
+            if self.sock is None and self.auto_open:
+                self.connect()
+            if self._can_sendfile(body):
+                length = self._file_body_length(body, headers)
+
+        if length is None:
+            if not isinstance(body, (bytes, str)):
+                super().request(method, url, body=body, headers=headers)
+                return
+            # Send the header block and the body with one system call.
+            buffers: List[bytes] = []
+            self._write_queue = buffers
+            try:
+                super().request(method, url, body=body, headers=headers)
+            finally:
+                self._write_queue = None
+            self._send_buffers(buffers)
+            return
+
+        # Send the headers, then let the kernel copy the file to the socket.
+        super().request(method, url, body=None, headers=headers)
+        sent = self.sock.sendfile(body, body.tell(), length) if length else 0
+        if self.pool_stats is not None:
+            self.pool_stats.incr("bytes_sent", sent)
+
+    def _send_buffers(self, buffers: List[bytes]) -> None:
+        """
+        Send ``buffers`` in as few system calls as possible. Up to ``blocksize``
+        bytes are joined, which is cheaper than passing many small buffers.
+        More are sent with :meth:`socket.socket.sendmsg` without copying them
+        on plain sockets, and one by one otherwise.
+        """
+        if self.sock is None:
+            if self.auto_open:
+                self.connect()
+            else:
+                raise NotConnected()
+        sock = self.sock
+        total = sum(map(len, buffers))
+        if total <= self.blocksize:
+            sock.sendall(b"".join(buffers))
+        elif type(sock) is socket.socket and hasattr(sock, "sendmsg"):
+            unsent: List[Any] = buffers
+            remaining = total
+            while True:
+                sent = sock.sendmsg(unsent[:_IOV_MAX])
+                remaining -= sent
+                if not remaining:
+                    break
+                # Drop what was sent, keeping the rest of a partly sent buffer.
+                done = 0
+                while sent >= len(unsent[done]):
+                    sent -= len(unsent[done])
+                    done += 1
+                unsent = unsent[done:]
+                if sent:
+                    unsent[0] = memoryview(unsent[0])[sent:]
+        else:
+            # TLS sockets don't support sendmsg().
+            for data in buffers:
+                sock.sendall(data)
+        if self.pool_stats is not None:
+            self.pool_stats.incr("bytes_sent", total)
+
+    def _can_sendfile(self, body: Any) -> bool:
+        """
+        Whether ``body`` is a regular file which :meth:`socket.socket.sendfile`
+        can send over this connection's socket.
+        """
+        if not hasattr(os, "sendfile") or isinstance(body, io.TextIOBase):
+            return False
+        # TLS sockets encrypt in userspace and fall back to send().
+        if type(self.sock) is not socket.socket:
+            return False
+        try:
+            return stat.S_ISREG(os.fstat(body.fileno()).st_mode)
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    @staticmethod
+    def _file_body_length(body: Any, headers: Mapping[str, str]) -> Optional[int]:
+        """
+        Return the number of bytes of the file ``body`` to send, from the
+        Content-Length header or else the rest of the file. Sets the header if
+        it's missing, because http.client would send the file chunked instead.
+        """
+        for key, value in headers.items():
+            if key.lower() == "content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        length = max(os.fstat(body.fileno()).st_size - body.tell(), 0)
+        headers["Content-Length"] = str(length)  # type: ignore[index]
+        return length
 
     def request_chunked(
         self,
@@ -291,7 +583,13 @@ class HTTPConnection(_HTTPConnection):
     ) -> None:
         """
         Alternative to the common request method, which sends the
-        body with chunked encoding and not as one block
+        body with chunked encoding and not as one block.
+
+        The header block and the chunks of a list or tuple body are coalesced
+        into writes of at least ``blocksize`` bytes, in which the data of large
+        chunks isn't copied.
+        Other iterables are written as their chunks come in, since the next
+        one might not be available yet.
         """
         if headers is None:
             headers = {}
@@ -307,25 +605,40 @@ class HTTPConnection(_HTTPConnection):
             self.putheader(header, value)
         if "transfer-encoding" not in headers:
             self.putheader("Transfer-Encoding", "chunked")
-        self.endheaders()
+        buffers: List[bytes] = []
+        self._write_queue = buffers
+        try:
+            self.endheaders()
+        finally:
+            self._write_queue = None
 
         if body is not None:
             if isinstance(body, (str, bytes)):
                 body = (body,)
+            coalesce = isinstance(body, (list, tuple))
+            if not coalesce:
+                self._send_buffers(buffers)
+                buffers = []
+            queued = 0
             for chunk in body:
                 if not chunk:
                     continue
                 if not isinstance(chunk, bytes):
                     chunk = chunk.encode("utf8")
-                len_str = hex(len(chunk))[2:]
-                to_send = bytearray(len_str.encode())
-                to_send += b"\r\n"
-                to_send += chunk
-                to_send += b"\r\n"
-                self.send(to_send)
+                buffers += (b"%x\r\n" % len(chunk), chunk, b"\r\n")
+                queued += len(chunk)
+                if (
+                    not coalesce
+                    or queued >= self.blocksize
+                    or len(buffers) > _IOV_MAX - 3
+                ):
+                    self._send_buffers(buffers)
+                    buffers = []
+                    queued = 0
 
         # After the if clause, to always have a closed body
-        self.send(b"0\r\n\r\n")
+        buffers.append(b"0\r\n\r\n")
+        self._send_buffers(buffers)
 
 
 class HTTPSConnection(HTTPConnection):
@@ -343,6 +656,10 @@ class HTTPSConnection(HTTPConnection):
     ssl_version: Optional[Union[int, str]] = None
     assert_fingerprint: Optional[str] = None
     tls_in_tls_required: bool = False
+    ssl_context_cache: Optional[SSLContextCache] = None
+    ssl_session_cache: Optional[SSLSessionCache] = None
+    ssl_session_reused: bool = False
+    _ssl_session_key: Optional[Tuple[str, Optional[int], "ssl.SSLContext"]] = None
 
     def __init__(
         self,
@@ -355,12 +672,14 @@ class HTTPSConnection(HTTPConnection):
         ssl_context: Optional["ssl.SSLContext"] = None,
         server_hostname: Optional[str] = None,
         source_address: Optional[Tuple[str, int]] = None,
-        blocksize: int = 8192,
+        blocksize: int = DEFAULT_BLOCKSIZE,
         socket_options: Optional[
             connection.SocketOptions
         ] = HTTPConnection.default_socket_options,
         proxy: Optional[str] = None,
         proxy_config: Optional[ProxyConfig] = None,
+        happy_eyeballs_delay: Optional[float] = None,
+        resolver: Optional[Resolver] = None,
     ) -> None:
 
         super().__init__(
@@ -372,6 +691,8 @@ class HTTPSConnection(HTTPConnection):
             socket_options=socket_options,
             proxy=proxy,
             proxy_config=proxy_config,
+            happy_eyeballs_delay=happy_eyeballs_delay,
+            resolver=resolver,
         )
 
         self.key_file = key_file
@@ -417,6 +738,8 @@ class HTTPSConnection(HTTPConnection):
         # Add certificate verification
         conn = self._new_conn()
         hostname: str = self.host
+        port = self.port
+        self._ssl_session_key = None
         tls_in_tls = False
 
         if self._is_using_tunnel():
@@ -436,11 +759,16 @@ class HTTPSConnection(HTTPConnection):
             hostname = cast(
                 str, self._tunnel_host
             )  # self._tunnel_host is not None, because self._is_using_tunnel() returned a truthy value.
+            port = self._tunnel_port
 
         server_hostname = hostname
         if self.server_hostname is not None:
             server_hostname = self.server_hostname
 
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.event("tls_start", time.monotonic())
+
         is_time_off = datetime.date.today() < RECENT_DATE
         if is_time_off:
             warnings.warn(
@@ -454,7 +782,21 @@ class HTTPSConnection(HTTPConnection):
         # Wrap socket using verification with the root certs in
         # trusted_root_certs
         default_ssl_context = False
-        if self.ssl_context is None:
+        cached_ssl_context = None
+        if self.ssl_context is None and self.ssl_context_cache is not None:
+            default_ssl_context = True
+            cached_ssl_context = self.ssl_context_cache.get_context(
+                ssl_version=self.ssl_version,
+                cert_reqs=self.cert_reqs,
+                ca_certs=self.ca_certs,
+                ca_cert_dir=self.ca_cert_dir,
+                ca_cert_data=self.ca_cert_data,
+                certfile=self.cert_file,
+                keyfile=self.key_file,
+                key_password=self.key_password,
+                session_tickets=self.ssl_session_cache is not None,
+            )
+        elif self.ssl_context is None:
             default_ssl_context = True
             self.ssl_context = create_urllib3_context(
                 ssl_version=resolve_ssl_version(self.ssl_version),
@@ -474,33 +816,56 @@ class HTTPSConnection(HTTPConnection):
                 or True
             ):
                 self.ssl_context.check_hostname = False
+            if self.ssl_session_cache is not None:
+                self.ssl_context.options &= ~ssl_.OP_NO_TICKET
 
-        context = self.ssl_context
-        context.verify_mode = resolve_cert_reqs(self.cert_reqs)
+        if cached_ssl_context is not None:
+            context = cached_ssl_context
+        else:
+            context = cast("ssl.SSLContext", self.ssl_context)
 
-        # Try to load OS default certs if none are given.
-        # Works well on Windows (requires Python3.4+)
-        if (
-            not self.ca_certs
-            and not self.ca_cert_dir
-            and not self.ca_cert_data
-            and default_ssl_context
-            and hasattr(context, "load_default_certs")
-        ):
-            context.load_default_certs()
-
-        self.sock = ssl_wrap_socket(
-            sock=conn,
-            keyfile=self.key_file,
-            certfile=self.cert_file,
-            key_password=self.key_password,
-            ca_certs=self.ca_certs,
-            ca_cert_dir=self.ca_cert_dir,
-            ca_cert_data=self.ca_cert_data,
-            server_hostname=server_hostname,
-            ssl_context=context,
-            tls_in_tls=tls_in_tls,
-        )
+        session = None
+        if self.ssl_session_cache is not None and not tls_in_tls:
+            session = self.ssl_session_cache.get(hostname, port, context)
+
+        if cached_ssl_context is not None:
+            # Shared contexts come with their certificates already loaded.
+            self.sock = ssl_wrap_socket(
+                sock=conn,
+                server_hostname=server_hostname,
+                ssl_context=context,
+                tls_in_tls=tls_in_tls,
+                session=session,
+            )
+        else:
+            context.verify_mode = resolve_cert_reqs(self.cert_reqs)
+
+            # Try to load OS default certs if none are given.
+            # Works well on Windows (requires Python3.4+)
+            if (
+                not self.ca_certs
+                and not self.ca_cert_dir
+                and not self.ca_cert_data
+                and default_ssl_context
+                and hasattr(context, "load_default_certs")
+            ):
+                context.load_default_certs()
+
+            self.sock = ssl_wrap_socket(
+                sock=conn,
+                keyfile=self.key_file,
+                certfile=self.cert_file,
+                key_password=self.key_password,
+                ca_certs=self.ca_certs,
+                ca_cert_dir=self.ca_cert_dir,
+                ca_cert_data=self.ca_cert_data,
+                server_hostname=server_hostname,
+                ssl_context=context,
+                tls_in_tls=tls_in_tls,
+                session=session,
+            )
+
+        self.ssl_session_reused = bool(getattr(self.sock, "session_reused", False))
 
         # If we're using all defaults and the connection
         # is TLSv1 or TLSv1.1 we throw a DeprecationWarning
@@ -535,6 +900,34 @@ class HTTPSConnection(HTTPConnection):
             self.assert_fingerprint
         )
 
+        # Only sessions of verified connections are offered for resumption.
+        self._ssl_session_key = (hostname, port, context)
+        self._store_ssl_session()
+
+        if tracer is not None:
+            tracer.event("tls_end", time.monotonic())
+
+    def close(self) -> None:
+        # TLS 1.3 servers send their session tickets after the handshake, so
+        # the session is only resumable once some data has been read.
+        self._store_ssl_session()
+        super().close()
+
+    def _store_ssl_session(self) -> None:
+        if (
+            self.ssl_session_cache is None
+            or self._ssl_session_key is None
+            or self.sock is None
+        ):
+            return
+        session = getattr(self.sock, "session", None)
+        if session is None:
+            return
+        if not session.has_ticket and self.sock.version() == "TLSv1.3":
+            return
+        hostname, port, context = self._ssl_session_key
+        self.ssl_session_cache.put(hostname, port, context, session)
+
     def _connect_tls_proxy(
         self, hostname: Optional[str], conn: socket.socket
     ) -> "ssl.SSLSocket":
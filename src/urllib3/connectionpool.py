@@ -3,10 +3,24 @@ import logging
 import queue
 import socket
 import sys
+import threading
+import time
 import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from http.client import HTTPResponse as _HttplibHTTPResponse
 from socket import timeout as SocketTimeout
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Type, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+    overload,
+)
 
 from .connection import (  # type: ignore
     BaseSSLError,
@@ -22,6 +36,7 @@ from .connection import (  # type: ignore
 )
 from .exceptions import (
     ClosedPoolError,
+    ConnectionLimitError,
     EmptyPoolError,
     FullPoolError,
     HeaderParsingError,
@@ -40,12 +55,17 @@ from .exceptions import (
 from .request import RequestMethods
 from .response import BaseHTTPResponse, HTTPResponse
 from .util.connection import is_connection_dropped
+from .util.connection_limit import ConnectionLimit
 from .util.proxy import connection_requires_http_tunnel
+from .util.queue import FairLifoQueue
 from .util.request import set_file_position
 from .util.response import assert_header_parsing
 from .util.retry import Retry
+from .util.ssl_ import SSLContextCache, SSLSessionCache
 from .util.ssl_match_hostname import CertificateError
+from .util.stats import PoolStats
 from .util.timeout import Timeout
+from .util.trace import Tracer
 from .util.url import Url, _encode_target
 from .util.url import _normalize_host as normalize_host
 from .util.url import parse_url
@@ -62,6 +82,118 @@ _Default = object()
 _TYPE_TIMEOUT = Union[Timeout, int, float, object]
 
 
+class PrewarmResult(NamedTuple):
+    """
+    Outcome of :meth:`HTTPConnectionPool.prewarm` and
+    :meth:`urllib3.PoolManager.prewarm`.
+    """
+
+    #: Number of connections which were opened.
+    succeeded: int
+    #: Number of connections which could not be opened.
+    failed: int
+    #: Seconds it took to open all connections.
+    elapsed: float
+
+
+#: Errors after which the connection of a request is discarded and the
+#: request retried.
+_RETRY_CONNECTION_ERRORS = (
+    TimeoutError,
+    HTTPException,
+    OSError,
+    ProtocolError,
+    BaseSSLError,
+    SSLError,
+    CertificateError,
+    HTTPSProxyError,
+)
+
+
+def _wrap_connection_error(e: Exception, proxy: Optional[Url]) -> Exception:
+    """
+    Return the error passed to :meth:`Retry.increment` for one of
+    :data:`_RETRY_CONNECTION_ERRORS`.
+    """
+    if isinstance(e, (BaseSSLError, CertificateError)):
+        return SSLError(e)
+    if isinstance(e, (OSError, NewConnectionError)) and proxy:
+        return ProxyError("Cannot connect to proxy.", e)
+    if isinstance(e, (OSError, HTTPException)):
+        return ProtocolError("Connection aborted.", e)
+    return e
+
+
+class _FollowUp(NamedTuple):
+    """Request made after a response, decided by :func:`_follow_up`."""
+
+    method: str
+    url: str
+    retries: Retry
+    #: Whether it's a redirect rather than the same request again.
+    is_redirect: bool
+
+
+def _follow_up(
+    pool: "ConnectionPool",
+    method: str,
+    url: str,
+    response: BaseHTTPResponse,
+    retries: Retry,
+    redirect: bool,
+) -> Optional[_FollowUp]:
+    """
+    Decide whether ``response`` is redirected or retried by ``urlopen()`` of
+    the sync and async pools. Returns ``None`` if the response is returned.
+
+    Raises :class:`~urllib3.exceptions.MaxRetryError` if no retries are left
+    and ``retries`` says to raise, the response must be drained then.
+    """
+    redirect_location = redirect and response.get_redirect_location()
+    if redirect_location:
+        if response.status == 303:
+            method = "GET"
+
+        try:
+            retries = retries.increment(method, url, response=response, _pool=pool)
+        except MaxRetryError:
+            if retries.raise_on_redirect:
+                raise
+            return None
+        return _FollowUp(method, redirect_location, retries, True)
+
+    # Check if we should retry the HTTP response.
+    has_retry_after = bool(response.getheader("Retry-After"))
+    if retries.is_retry(method, response.status, has_retry_after):
+        try:
+            retries = retries.increment(method, url, response=response, _pool=pool)
+        except MaxRetryError:
+            if retries.raise_on_status:
+                raise
+            return None
+        return _FollowUp(method, url, retries, False)
+
+    # A PoolManager follows the redirects it gets back itself, and deposits
+    # for the response it ends up returning.
+    if redirect or not response.get_redirect_location():
+        _deposit_retry_budget(response, retries)
+    return None
+
+
+def _deposit_retry_budget(response: BaseHTTPResponse, retries: Retry) -> None:
+    """
+    Deposit into the budget of ``retries``, if any, for a final ``response``
+    which didn't need a retry and isn't an error.
+    """
+    # Redirects don't count as retries.
+    if (
+        retries.budget is not None
+        and response.status < 400
+        and all(h.redirect_location for h in retries.history)
+    ):
+        retries.budget.deposit()
+
+
 # Pool objects
 class ConnectionPool:
     """
@@ -75,7 +207,7 @@ class ConnectionPool:
     """
 
     scheme: Optional[str] = None
-    QueueCls = queue.LifoQueue
+    QueueCls = FairLifoQueue
 
     def __init__(self, host: str, port: Optional[int] = None) -> None:
         if not host:
@@ -104,6 +236,28 @@ class ConnectionPool:
         """
         pass
 
+    def is_same_host(self, url: str) -> bool:
+        """
+        Check if the given ``url`` is a member of the same host as this
+        connection pool.
+        """
+        if url.startswith("/"):
+            return True
+
+        # TODO: Add optional support for socket.gethostbyname checking.
+        scheme, _, host, port, *_ = parse_url(url)
+        scheme = scheme or "http"
+        if host is not None:
+            host = _normalize_host(host, scheme=scheme)
+
+        # Use explicit default port for comparison when none is given
+        if self.port and not port:
+            port = port_by_scheme.get(scheme)
+        elif not self.port and port == port_by_scheme.get(scheme):
+            port = None
+
+        return (scheme, host, port) == (self.scheme, self.host, self.port)
+
 
 # This is taken from http://hg.python.org/cpython/file/7aaba721ebc0/Lib/socket.py#l252
 _blocking_errnos = {errno.EAGAIN, errno.EWOULDBLOCK}
@@ -113,6 +267,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
     """
     Thread-safe connection pool for one host.
 
+    Counters of how the pool is used are kept in ``stats``, a
+    :class:`urllib3.util.stats.PoolStats`.
+
     :param host:
         Host used for this HTTP Connection (e.g. "localhost"), passed into
         :class:`http.client.HTTPConnection`.
@@ -139,7 +296,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         a time. When no free connections are available, the call will block
         until a connection has been released. This is a useful side effect for
         particular multithreaded situations where one does not want to use more
-        than maxsize connections per host to prevent flooding.
+        than maxsize connections per host to prevent flooding. Blocked
+        requests get connections in the order they asked for them, unless
+        they were given a higher ``pool_priority``.
 
     :param headers:
         Headers to include with all requests, unless other headers are given
@@ -148,6 +307,30 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
     :param retries:
         Retry configuration to use by default with requests in this pool.
 
+    :param max_idle_time:
+        Seconds a connection may stay unused in the pool before it is closed
+        instead of being reused. Connections younger than this are reused
+        without first checking whether the server has closed them, so set it
+        below the keep-alive timeout of the server.
+
+    :param max_connection_age:
+        Seconds after which a connection is closed instead of being reused,
+        counted from when it was opened.
+
+    :param reap_interval:
+        If set, a background thread checks the pool every ``reap_interval``
+        seconds and closes the connections which exceeded ``max_idle_time`` or
+        ``max_connection_age``, rather than waiting until they are checked out.
+
+    :param tracer:
+        :class:`urllib3.util.trace.Tracer` receiving the events of all
+        requests made with the pool, unless a request is given its own.
+
+    :param connection_limit:
+        :class:`urllib3.util.ConnectionLimit` shared with other pools, which
+        caps the number of connections all of them have open at the same
+        time.
+
     :param _proxy:
         Parsed proxy URL, should not be used directly, instead, see
         :class:`urllib3.ProxyManager`
@@ -177,6 +360,11 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         _proxy: Optional[Url] = None,
         _proxy_headers: Optional[Mapping[str, str]] = None,
         _proxy_config: Optional[ProxyConfig] = None,
+        max_idle_time: Optional[float] = None,
+        max_connection_age: Optional[float] = None,
+        reap_interval: Optional[float] = None,
+        tracer: Optional[Tracer] = None,
+        connection_limit: Optional[ConnectionLimit] = None,
         **conn_kw: Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -202,11 +390,25 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         for _ in range(maxsize):
             self.pool.put(None)
 
-        # These are mostly for testing and debugging purposes.
-        self.num_connections = 0
-        self.num_requests = 0
+        self.max_idle_time = max_idle_time
+        self.max_connection_age = max_connection_age
+        self.tracer = tracer
+
+        self.connection_limit = connection_limit
+        if connection_limit is not None:
+            connection_limit.add_pool(self)
+
+        self.stats = PoolStats()
         self.conn_kw = conn_kw
 
+        # Set by close_when_idle(), guarded by _close_lock.
+        self._close_when_idle = False
+        self._close_lock = threading.Lock()
+
+        self._reaper_stop: Optional[threading.Event] = None
+        if reap_interval is not None:
+            self._start_reaper(reap_interval)
+
         if self.proxy:
             # Enable Nagle's algorithm for proxies, to avoid packet fragmentation.
             # We cannot know if the user has added default socket options, so we cannot replace the
@@ -216,11 +418,29 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             self.conn_kw["proxy"] = self.proxy
             self.conn_kw["proxy_config"] = self.proxy_config
 
+    @property
+    def num_connections(self) -> int:
+        """Number of connections opened, same as ``stats.connections_created``."""
+        return self.stats.connections_created
+
+    @num_connections.setter
+    def num_connections(self, value: int) -> None:
+        self.stats.incr("connections_created", value - self.stats.connections_created)
+
+    @property
+    def num_requests(self) -> int:
+        """Number of requests sent, same as ``stats.requests``."""
+        return self.stats.requests
+
+    @num_requests.setter
+    def num_requests(self, value: int) -> None:
+        self.stats.incr("requests", value - self.stats.requests)
+
     def _new_conn(self) -> HTTPConnection:
         """
         Return a fresh :class:`HTTPConnection`.
         """
-        self.num_connections += 1
+        self.stats.incr("connections_created")
         log.debug(
             "Starting new HTTP connection (%d): %s:%s",
             self.num_connections,
@@ -234,9 +454,13 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             timeout=self.timeout.connect_timeout,  # type: ignore
             **self.conn_kw,
         )
+        conn.pool_stats = self.stats
+        conn.connection_limit = self.connection_limit
         return conn
 
-    def _get_conn(self, timeout: Optional[float] = None) -> HTTPConnection:
+    def _get_conn(
+        self, timeout: Optional[float] = None, priority: int = 0
+    ) -> HTTPConnection:
         """
         Get a connection. Will return a pooled connection if one is available.
 
@@ -247,38 +471,150 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             Seconds to wait before giving up and raising
             :class:`urllib3.exceptions.EmptyPoolError` if the pool is empty and
             :prop:`.block` is ``True``.
+
+        :param priority:
+            Waiters with a higher priority get connections first when
+            :prop:`.block` is ``True``.
         """
         conn = None
 
         if self.pool is None:
             raise ClosedPoolError(self, "Pool is closed.")
 
+        start = time.monotonic()
         try:
-            conn = self.pool.get(block=self.block, timeout=timeout)
+            try:
+                conn = self.pool.get(block=False)
+            except queue.Empty:
+                if not self.block:
+                    raise
+                conn = self._wait_for_conn(timeout, priority)
 
         except AttributeError:  # self.pool is None
             raise ClosedPoolError(self, "Pool is closed.")  # Defensive:
 
         except queue.Empty:
             if self.block:
+                self.stats.record_checkout(time.monotonic() - start)
                 raise EmptyPoolError(
                     self,
                     "Pool is empty and a new connection can't be opened due to blocking mode.",
                 )
             pass  # Oh well, we'll create a new connection then
 
-        # If this is a persistent connection, check if it got disconnected
-        if conn and is_connection_dropped(conn):
+        self.stats.record_checkout(time.monotonic() - start)
+
+        # If this is a persistent connection, check if it expired or got
+        # disconnected
+        if conn and self._is_conn_expired(conn):
+            log.debug("Closing expired connection: %s", self.host)
+            self.stats.incr("connections_expired")
+            conn = self._reset_conn(conn)
+        elif conn and conn.sock and self.max_idle_time is not None:
+            # Connections which haven't expired yet are trusted to be alive.
+            self.stats.incr("dropped_checks_skipped")
+        elif conn and is_connection_dropped(conn):
             log.debug("Resetting dropped connection: %s", self.host)
-            conn.close()
-            if getattr(conn, "auto_open", 1) == 0:
-                # This is a proxied connection that has been mutated by
-                # http.client._tunnel() and cannot be reused (since it would
-                # attempt to bypass the proxy)
-                conn = None
+            self.stats.incr("connections_dropped")
+            conn = self._reset_conn(conn)
+
+        if conn and conn.sock:
+            self.stats.incr("connections_reused")
 
+        self.stats.incr("in_flight")
         return conn or self._new_conn()
 
+    def _wait_for_conn(
+        self, timeout: Optional[float], priority: int
+    ) -> Optional[HTTPConnection]:
+        self.stats.incr("checkouts_waited")
+        self.stats.incr("waiting")
+        try:
+            if priority:
+                # Only pass it when needed, QueueCls may be a plain LifoQueue.
+                return self.pool.get(timeout=timeout, priority=priority)  # type: ignore
+            return self.pool.get(timeout=timeout)  # type: ignore
+        finally:
+            self.stats.incr("waiting", -1)
+
+    def _reset_conn(self, conn: HTTPConnection) -> Optional[HTTPConnection]:
+        """
+        Close ``conn`` and return it if it can be reconnected, otherwise
+        ``None``.
+        """
+        conn.close()
+        if getattr(conn, "auto_open", 1) == 0:
+            # This is a proxied connection that has been mutated by
+            # http.client._tunnel() and cannot be reused (since it would
+            # attempt to bypass the proxy)
+            return None
+        return conn
+
+    def _is_conn_expired(
+        self, conn: HTTPConnection, now: Optional[float] = None
+    ) -> bool:
+        """
+        Whether ``conn`` is open and exceeded ``max_idle_time`` or
+        ``max_connection_age``.
+        """
+        if not conn.sock:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if (
+            self.max_connection_age is not None
+            and conn.connected_at is not None
+            and now - conn.connected_at >= self.max_connection_age
+        ):
+            return True
+        if (
+            self.max_idle_time is not None
+            and conn.idle_since is not None
+            and now - conn.idle_since >= self.max_idle_time
+        ):
+            return True
+        return False
+
+    def _start_reaper(self, interval: float) -> None:
+        self._reaper_stop = stop = threading.Event()
+        pool_ref = weakref.ref(self)
+
+        def reap() -> None:
+            # Only hold a weak reference so that the thread doesn't keep an
+            # abandoned pool alive.
+            while not stop.wait(interval):
+                pool = pool_ref()
+                if pool is None:
+                    return
+                pool._reap_expired_conns()
+                del pool
+
+        thread = threading.Thread(
+            target=reap, name=f"urllib3-reaper-{self.host}", daemon=True
+        )
+        thread.start()
+
+    def _reap_expired_conns(self) -> int:
+        """
+        Close the idle connections in the pool which expired. Returns the
+        number of closed connections.
+        """
+        pool = self.pool
+        if pool is None:
+            return 0
+
+        reaped = 0
+        now = time.monotonic()
+        with pool.mutex:
+            for i, conn in enumerate(pool.queue):
+                if conn and self._is_conn_expired(conn, now):
+                    pool.queue[i] = self._reset_conn(conn)
+                    reaped += 1
+        if reaped:
+            log.debug("Closed %d expired connections: %s", reaped, self.host)
+            self.stats.incr("connections_expired", reaped)
+        return reaped
+
     def _put_conn(self, conn: Optional[HTTPConnection]) -> None:
         """
         Put a connection back into the pool.
@@ -293,9 +629,27 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         If the pool is closed, then the connection will be closed and discarded.
         """
+        if conn is not None:
+            conn.idle_since = time.monotonic()
+            conn.tracer = None
+        if conn is not None or self.pool is not None:
+            # urlopen() also returns an empty slot when it failed to get a
+            # connection from a closed pool.
+            self.stats.incr("in_flight", -1)
+
+        # Checked under the lock after in_flight went down, so that a
+        # concurrent close_when_idle() can't miss the last release. Closing
+        # first makes the code below close the connection.
+        with self._close_lock:
+            if self._close_when_idle and self.stats.in_flight <= 0:
+                self._close_when_idle = False
+                self.close()
+
         if self.pool is not None:
             try:
                 self.pool.put(conn, block=False)
+                if conn is not None and self.connection_limit is not None:
+                    self.connection_limit.notify_idle()
                 return  # Everything is dandy, done.
             except AttributeError:
                 # self.pool is None.
@@ -305,6 +659,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 # Connection never got put back into the pool, close it.
                 if conn:
                     conn.close()
+                    self.stats.incr("connections_discarded")
 
                 if self.block:
                     # This should never happen if you got the conn from self._get_conn
@@ -331,6 +686,112 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # Nothing to do for HTTP connections.
         pass
 
+    def prewarm(
+        self, num_connections: Optional[int] = None, parallel: bool = False
+    ) -> PrewarmResult:
+        """
+        Open connections ahead of time, so that the first requests made with
+        the pool don't have to wait for the TCP and TLS handshakes.
+
+        Free slots of the pool are filled with connected and validated
+        connections. Connections in the pool which are already open are left
+        alone and not counted.
+
+        :param num_connections:
+            Number of connections to open, by default ``maxsize``. No more
+            connections than the pool has free slots are opened.
+
+        :param parallel:
+            Open the connections from separate threads at the same time instead
+            of one after the other.
+
+        :returns: A :class:`PrewarmResult`.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        if num_connections is None:
+            num_connections = self.pool.maxsize
+
+        start = time.monotonic()
+        conns: List[Optional[HTTPConnection]] = []
+        try:
+            for _ in range(num_connections):
+                conns.append(self.pool.get(block=False))
+        except AttributeError:  # self.pool is None
+            raise ClosedPoolError(self, "Pool is closed.")  # Defensive:
+        except queue.Empty:
+            pass
+        self.stats.incr("in_flight", len(conns))
+
+        cold: List[Optional[HTTPConnection]] = []
+        warm: List[Optional[HTTPConnection]] = []
+        for conn in conns:
+            if (
+                conn is None
+                or self._is_conn_expired(conn)
+                or is_connection_dropped(conn)
+            ):
+                cold.append(conn)
+            else:
+                warm.append(conn)
+
+        # Until they are opened the free slots are returned as empty.
+        opened: List[Optional[HTTPConnection]] = [None] * len(cold)
+        try:
+            if parallel and len(cold) > 1:
+                with ThreadPoolExecutor(max_workers=len(cold)) as executor:
+                    opened = list(executor.map(self._prewarm_conn, cold))
+            else:
+                opened = [self._prewarm_conn(conn) for conn in cold]
+        finally:
+            for conn in warm + opened:
+                self._put_conn(conn)
+
+        succeeded = sum(1 for conn in opened if conn is not None)
+        return PrewarmResult(
+            succeeded=succeeded,
+            failed=len(opened) - succeeded,
+            elapsed=time.monotonic() - start,
+        )
+
+    def _prewarm_conn(self, conn: Optional[HTTPConnection]) -> Optional[HTTPConnection]:
+        """
+        Connect ``conn``, or a new connection if it is ``None``. Returns
+        ``None`` if the connection could not be opened.
+        """
+        if conn is not None:
+            conn.close()
+            if getattr(conn, "auto_open", 1) == 0:
+                # Tunneled connections can't be reopened, see _get_conn().
+                conn = None
+        if conn is None:
+            conn = self._new_conn()
+
+        conn.timeout = self.timeout.connect_timeout  # type: ignore
+        try:
+            if self.proxy is not None and connection_requires_http_tunnel(
+                self.proxy, self.proxy_config, self.scheme
+            ):
+                self._prepare_proxy(conn)
+            self._validate_conn(conn)
+            if not conn.sock:
+                conn.connect()
+        except (
+            TimeoutError,
+            HTTPException,
+            OSError,
+            BaseSSLError,
+            SSLError,
+            CertificateError,
+            HTTPSProxyError,
+        ) as e:
+            log.debug("Failed to prewarm connection to %s: %r", self.host, e)
+            conn.close()
+            return None
+
+        return conn
+
     def _get_timeout(self, timeout: _TYPE_TIMEOUT) -> Timeout:
         """ Helper that always returns a :class:`urllib3.util.Timeout` """
         if timeout is _Default:
@@ -385,7 +846,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             :class:`urllib3.util.Timeout`, which gives you more fine-grained
             control over your timeouts.
         """
-        self.num_requests += 1
+        self.stats.incr("requests")
 
         timeout_obj = self._get_timeout(timeout)
         timeout_obj.start_connect()
@@ -398,6 +859,14 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             self._raise_timeout(err=e, url=url, timeout_value=conn.timeout)
             raise
 
+        tracer = conn.tracer
+        if tracer is not None:
+            if not conn.sock and getattr(conn, "auto_open", 1):
+                # Connect now instead of when sending the request, so that
+                # the events of connecting don't overlap with sending.
+                conn.connect()
+            tracer.event("request_start", time.monotonic())
+
         # conn.request() calls http.client.*.request, not the method in
         # urllib3.request. It also calls makefile (recv) on the socket.
         try:
@@ -418,6 +887,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             if e.errno != errno.EPROTOTYPE:
                 raise
 
+        if tracer is not None:
+            tracer.event("request_end", time.monotonic())
+
         # Reset the timeout for the recv() on the socket
         read_timeout = timeout_obj.read_timeout
 
@@ -443,6 +915,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             self._raise_timeout(err=e, url=url, timeout_value=read_timeout)
             raise
 
+        if tracer is not None:
+            tracer.event("response_start", time.monotonic())
+
         log.debug(
             '%s://%s:%s "%s %s %s" %s %s',
             self.scheme,
@@ -480,6 +955,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # Disable access to the pool
         old_pool, self.pool = self.pool, None
 
+        if self._reaper_stop is not None:
+            self._reaper_stop.set()
+
         try:
             while True:
                 conn = old_pool.get(block=False)
@@ -489,27 +967,41 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         except queue.Empty:
             pass  # Done.
 
-    def is_same_host(self, url: str) -> bool:
+    def _eviction_rank(self) -> int:
         """
-        Check if the given ``url`` is a member of the same host as this
-        connection pool.
+        Rank the pool for eviction by a :class:`~urllib3.PoolManager`: 0
+        without open connections, 1 with only idle connections and 2 with
+        connections in use.
         """
-        if url.startswith("/"):
+        if self.stats.in_flight > 0:
+            return 2
+        q = self.pool
+        if q is not None:
+            with q.mutex:
+                if any(conn is not None and conn.sock for conn in q.queue):
+                    return 1
+        return 0
+
+    def close_when_idle(self) -> bool:
+        """
+        Close the pool once none of its connections are in use, right away if
+        none are. Returns whether the pool was closed right away.
+        """
+        with self._close_lock:
+            if self.stats.in_flight > 0:
+                self._close_when_idle = True
+                return False
+            self.close()
             return True
 
-        # TODO: Add optional support for socket.gethostbyname checking.
-        scheme, _, host, port, *_ = parse_url(url)
-        scheme = scheme or "http"
-        if host is not None:
-            host = _normalize_host(host, scheme=scheme)
-
-        # Use explicit default port for comparison when none is given
-        if self.port and not port:
-            port = port_by_scheme.get(scheme)
-        elif not self.port and port == port_by_scheme.get(scheme):
-            port = None
-
-        return (scheme, host, port) == (self.scheme, self.host, self.port)
+    def _cancel_close(self) -> bool:
+        """
+        Undo :meth:`close_when_idle`. Returns ``False`` if the pool is
+        already closed.
+        """
+        with self._close_lock:
+            self._close_when_idle = False
+            return self.pool is not None
 
     def urlopen(  # type: ignore
         self,
@@ -525,6 +1017,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         release_conn: Optional[bool] = None,
         chunked: bool = False,
         body_pos: Optional[Union[int, object]] = None,
+        tracer: Optional[Tracer] = None,
+        pool_priority: int = 0,
         **response_kw: Any,
     ) -> BaseHTTPResponse:
         """
@@ -615,6 +1109,15 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             redirect. Typically this won't need to be set because urllib3 will
             auto-populate the value when needed.
 
+        :param tracer:
+            :class:`urllib3.util.trace.Tracer` receiving the events of this
+            request, instead of the ``tracer`` of the pool.
+
+        :param pool_priority:
+            If the pool is set to block=True and all its connections are in
+            use, requests with a higher priority get the next free connection
+            before requests which have waited longer.
+
         :param \\**response_kw:
             Additional parameters are passed to
             :meth:`urllib3.response.HTTPResponse.from_httplib`
@@ -632,6 +1135,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if release_conn is None:
             release_conn = response_kw.get("preload_content", True)
 
+        if tracer is None:
+            tracer = self.tracer
+
         # Check host
         if assert_same_host and not self.is_same_host(url):
             raise HostChangedError(self, url, retries)
@@ -681,8 +1187,13 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         try:
             # Request a connection from the queue.
             timeout_obj = self._get_timeout(timeout)
-            conn = self._get_conn(timeout=pool_timeout)
+            if tracer is not None:
+                tracer.event("checkout_start", time.monotonic())
+            conn = self._get_conn(timeout=pool_timeout, priority=pool_priority)
+            if tracer is not None:
+                tracer.event("checkout_end", time.monotonic())
 
+            conn.tracer = tracer
             conn.timeout = timeout_obj.connect_timeout  # type: ignore
 
             is_new_proxy_conn = self.proxy is not None and not getattr(
@@ -717,37 +1228,29 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 pool=self,
                 connection=response_conn,
                 retries=retries,
+                tracer=tracer,
                 **response_kw,
             )
 
             # Everything went great!
             clean_exit = True
 
+        except ConnectionLimitError:
+            # The connection couldn't connect, put it back closed.
+            clean_exit = False
+            raise
+
         except EmptyPoolError:
             # Didn't get a connection from the pool, no need to clean up
             clean_exit = True
             release_this_conn = False
             raise
 
-        except (
-            TimeoutError,
-            HTTPException,
-            OSError,
-            ProtocolError,
-            BaseSSLError,
-            SSLError,
-            CertificateError,
-            HTTPSProxyError,
-        ) as e:
+        except _RETRY_CONNECTION_ERRORS as e:
             # Discard the connection for these exceptions. It will be
             # replaced during the next _get_conn() call.
             clean_exit = False
-            if isinstance(e, (BaseSSLError, CertificateError)):
-                e = SSLError(e)
-            elif isinstance(e, (OSError, NewConnectionError)) and self.proxy:
-                e = ProxyError("Cannot connect to proxy.", e)
-            elif isinstance(e, (OSError, HTTPException)):
-                e = ProtocolError("Connection aborted.", e)
+            e = _wrap_connection_error(e, self.proxy)
 
             retries = retries.increment(
                 method, url, error=e, _pool=self, _stacktrace=sys.exc_info()[2]
@@ -792,73 +1295,44 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 release_conn=release_conn,
                 chunked=chunked,
                 body_pos=body_pos,
+                tracer=tracer,
+                pool_priority=pool_priority,
                 **response_kw,
             )
 
-        # Handle redirect?
-        redirect_location = redirect and response.get_redirect_location()
-        if redirect_location:
-            if response.status == 303:
-                method = "GET"
-
-            try:
-                retries = retries.increment(method, url, response=response, _pool=self)
-            except MaxRetryError:
-                if retries.raise_on_redirect:
-                    response.drain_conn()
-                    raise
-                return response
-
+        # Handle redirects and retries of the response.
+        try:
+            follow_up = _follow_up(self, method, url, response, retries, redirect)
+        except MaxRetryError:
             response.drain_conn()
-            retries.sleep_for_retry(response)
-            log.debug("Redirecting %s -> %s", url, redirect_location)
-            return self.urlopen(
-                method,
-                redirect_location,
-                body,
-                headers,
-                retries=retries,
-                redirect=redirect,
-                assert_same_host=assert_same_host,
-                timeout=timeout,
-                pool_timeout=pool_timeout,
-                release_conn=release_conn,
-                chunked=chunked,
-                body_pos=body_pos,
-                **response_kw,
-            )
-
-        # Check if we should retry the HTTP response.
-        has_retry_after = bool(response.getheader("Retry-After"))
-        if retries.is_retry(method, response.status, has_retry_after):
-            try:
-                retries = retries.increment(method, url, response=response, _pool=self)
-            except MaxRetryError:
-                if retries.raise_on_status:
-                    response.drain_conn()
-                    raise
-                return response
+            raise
+        if follow_up is None:
+            return response
 
-            response.drain_conn()
-            retries.sleep(response)
+        response.drain_conn()
+        if follow_up.is_redirect:
+            follow_up.retries.sleep_for_retry(response)
+            log.debug("Redirecting %s -> %s", url, follow_up.url)
+        else:
+            follow_up.retries.sleep(response)
             log.debug("Retry: %s", url)
-            return self.urlopen(
-                method,
-                url,
-                body,
-                headers,
-                retries=retries,
-                redirect=redirect,
-                assert_same_host=assert_same_host,
-                timeout=timeout,
-                pool_timeout=pool_timeout,
-                release_conn=release_conn,
-                chunked=chunked,
-                body_pos=body_pos,
-                **response_kw,
-            )
-
-        return response
+        return self.urlopen(
+            follow_up.method,
+            follow_up.url,
+            body,
+            headers,
+            retries=follow_up.retries,
+            redirect=redirect,
+            assert_same_host=assert_same_host,
+            timeout=timeout,
+            pool_timeout=pool_timeout,
+            release_conn=release_conn,
+            chunked=chunked,
+            body_pos=body_pos,
+            tracer=tracer,
+            pool_priority=pool_priority,
+            **response_kw,
+        )
 
 
 class HTTPSConnectionPool(HTTPConnectionPool):
@@ -873,6 +1347,18 @@ class HTTPSConnectionPool(HTTPConnectionPool):
     ``ca_cert_dir``, ``ssl_version``, ``key_password`` are only used if :mod:`ssl`
     is available and are fed into :meth:`urllib3.util.ssl_wrap_socket` to upgrade
     the connection socket into an SSL socket.
+
+    Unless an ``ssl_context`` is given, the context built from these parameters
+    is stored in ``ssl_context_cache`` and shared by every connection of the
+    pool. Pass the same :class:`urllib3.util.ssl_.SSLContextCache` to several
+    pools to share contexts between them, as :class:`.PoolManager` does.
+
+    TLS session resumption is enabled by passing an
+    :class:`urllib3.util.ssl_.SSLSessionCache` as ``ssl_session_cache``. New
+    connections then offer the session of an earlier connection to the same
+    host, which lets the server skip the full handshake. ``stats.tls_handshakes``
+    and ``stats.tls_resumptions`` count the handshakes made by the pool and how
+    many of them resumed a session.
     """
 
     scheme = "https"
@@ -898,6 +1384,8 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         assert_hostname: Optional[Union[str, "Literal[False]"]] = None,
         assert_fingerprint: Optional[str] = None,
         ca_cert_dir: Optional[str] = None,
+        ssl_context_cache: Optional[SSLContextCache] = None,
+        ssl_session_cache: Optional[SSLSessionCache] = None,
         **conn_kw: Any,
     ) -> None:
 
@@ -923,6 +1411,10 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         self.ssl_version = ssl_version
         self.assert_hostname = assert_hostname
         self.assert_fingerprint = assert_fingerprint
+        if ssl_context_cache is None:
+            ssl_context_cache = SSLContextCache()
+        self.ssl_context_cache = ssl_context_cache
+        self.ssl_session_cache = ssl_session_cache
 
     def _prepare_conn(self, conn: HTTPSConnection) -> HTTPConnection:
         """
@@ -942,6 +1434,8 @@ class HTTPSConnectionPool(HTTPConnectionPool):
                 assert_fingerprint=self.assert_fingerprint,
             )
             conn.ssl_version = self.ssl_version
+            conn.ssl_context_cache = self.ssl_context_cache
+            conn.ssl_session_cache = self.ssl_session_cache
         return conn
 
     def _prepare_proxy(self, conn: HTTPSConnection) -> None:  # type: ignore
@@ -958,12 +1452,18 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             conn.tls_in_tls_required = True
 
         conn.connect()
+        self._count_tls_handshake(conn)
+
+    def _count_tls_handshake(self, conn: HTTPSConnection) -> None:
+        self.stats.incr("tls_handshakes")
+        if conn.ssl_session_reused:
+            self.stats.incr("tls_resumptions")
 
     def _new_conn(self) -> HTTPConnection:
         """
         Return a fresh :class:`urllib3.connection.HTTPConnection`.
         """
-        self.num_connections += 1
+        self.stats.incr("connections_created")
         log.debug(
             "Starting new HTTPS connection (%d): %s:%s",
             self.num_connections,
@@ -991,6 +1491,8 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             key_password=self.key_password,
             **self.conn_kw,
         )
+        conn.pool_stats = self.stats
+        conn.connection_limit = self.connection_limit
 
         return self._prepare_conn(conn)
 
@@ -1003,6 +1505,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         # Force connect early to allow us to validate the connection.
         if not conn.sock:
             conn.connect()
+            self._count_tls_handshake(conn)  # type: ignore
 
         if not conn.is_verified:
             warnings.warn(
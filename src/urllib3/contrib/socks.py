@@ -55,6 +55,7 @@ except ImportError:
     )
     raise
 
+import time
 from socket import timeout as SocketTimeout
 
 from ..connection import HTTPConnection, HTTPSConnection
@@ -82,6 +83,9 @@ class SOCKSConnection(HTTPConnection):
         """
         Establish a new connection via the SOCKS proxy.
         """
+        if self.tracer is not None:
+            self.tracer.event("connect_start", time.monotonic())
+
         extra_kw = {}
         if self.source_address:
             extra_kw["source_address"] = self.source_address
@@ -89,6 +93,9 @@ class SOCKSConnection(HTTPConnection):
         if self.socket_options:
             extra_kw["socket_options"] = self.socket_options
 
+        if self.connection_limit is not None:
+            self._acquire_connection_slot(self.connection_limit)
+
         try:
             conn = socks.create_connection(
                 (self.host, self.port),
@@ -103,12 +110,14 @@ class SOCKSConnection(HTTPConnection):
             )
 
         except SocketTimeout:
+            self._release_connection_slot()
             raise ConnectTimeoutError(
                 self,
                 f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
             )
 
         except socks.ProxyError as e:
+            self._release_connection_slot()
             # This is fragile as hell, but it seems to be the only way to raise
             # useful errors here.
             if e.socket_err:
@@ -128,8 +137,12 @@ class SOCKSConnection(HTTPConnection):
                 )
 
         except OSError as e:  # Defensive: PySocks should catch all these.
+            self._release_connection_slot()
             raise NewConnectionError(self, f"Failed to establish a new connection: {e}")
 
+        self.connected_at = time.monotonic()
+        if self.tracer is not None:
+            self.tracer.event("connect_end", self.connected_at)
         return conn
 
 
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 if TYPE_CHECKING:
     from email.errors import MessageDefect
 
+    from urllib3.connection import HTTPConnection
     from urllib3.connectionpool import ConnectionPool
     from urllib3.response import HTTPResponse
     from urllib3.util.retry import Retry
@@ -117,6 +118,35 @@ class MaxRetryError(RequestError):
         super().__init__(pool, url, message)
 
 
+class RetryBudgetExhaustedError(MaxRetryError):
+    """Raised when a retry is refused by the
+    :class:`~urllib3.util.retry.RetryBudget` of the request's retries.
+
+    :param pool: The connection pool
+    :type pool: :class:`~urllib3.connectionpool.HTTPConnectionPool`
+    :param string url: The requested Url
+    :param exceptions.Exception reason: The error that would have been retried
+
+    """
+
+    def __init__(
+        self, pool: "ConnectionPool", url: str, reason: Optional[Exception] = None
+    ) -> None:
+        self.reason = reason
+
+        message = f"Retry budget exhausted with url: {url} (Caused by {reason!r})"
+
+        RequestError.__init__(self, pool, url, message)
+
+
+class CircuitOpenError(RequestError):
+    """Raised by a :class:`~urllib3.PoolManager` without sending the request,
+    while the :class:`~urllib3.util.circuit_breaker.CircuitBreaker` circuit
+    of the host is open."""
+
+    pass
+
+
 class HostChangedError(RequestError):
     """Raised when an existing pool gets a request for a foreign host."""
 
@@ -172,6 +202,23 @@ class EmptyPoolError(PoolError):
     pass
 
 
+class ConnectionLimitError(HTTPError):
+    """Raised when a connection can't be opened within the connect timeout
+    because all connections allowed by its
+    :class:`~urllib3.util.ConnectionLimit` are in use. Unlike connect errors,
+    it isn't retried."""
+
+    conn: "HTTPConnection"
+
+    def __init__(self, conn: "HTTPConnection", message: str) -> None:
+        self.conn = conn
+        super().__init__(f"{conn}: {message}")
+
+    def __reduce__(self) -> ReduceResult:
+        # For pickling purposes.
+        return self.__class__, (None, None)
+
+
 class FullPoolError(PoolError):
     """Raised when we try to add a connection to a full pool in blocking mode."""
 
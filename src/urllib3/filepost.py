@@ -1,13 +1,11 @@
 import binascii
-import codecs
+import io
 import os
-from io import BytesIO
-from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+import stat
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .fields import _TYPE_FIELD_VALUE_TUPLE, RequestField
 
-writer = codecs.lookup("utf-8")[3]
-
 _TYPE_FIELDS_SEQUENCE = Sequence[
     Union[Tuple[str, _TYPE_FIELD_VALUE_TUPLE], RequestField]
 ]
@@ -46,11 +44,41 @@ def iter_field_objects(fields: _TYPE_FIELDS) -> Iterable[RequestField]:
             yield RequestField.from_tuples(*field)
 
 
-def encode_multipart_formdata(
-    fields: _TYPE_FIELDS, boundary: Optional[str] = None
-) -> Tuple[bytes, str]:
+def _file_size(fileobj: IO[bytes]) -> Optional[int]:
     """
-    Encode a dictionary of ``fields`` using the multipart/form-data MIME format.
+    Return the number of bytes from the position of ``fileobj`` to its end, or
+    ``None`` if it can't be determined without reading it.
+    """
+    try:
+        st = os.fstat(fileobj.fileno())
+        if stat.S_ISREG(st.st_mode):
+            return max(st.st_size - fileobj.tell(), 0)
+    except (AttributeError, OSError):
+        pass
+    try:
+        pos = fileobj.tell()
+        end = fileobj.seek(0, io.SEEK_END)
+        fileobj.seek(pos)
+    except (AttributeError, OSError):
+        return None
+    return max(end - pos, 0)
+
+
+class MultipartEncoder:
+    """
+    Encode ``fields`` using the multipart/form-data MIME format as a readable
+    file-like object, which reads the data of file fields only when it's sent.
+
+    Fields are the same as for :func:`encode_multipart_formdata`, but their
+    data may also be a binary file object, which is sent from its current
+    position to its end. Files whose size can't be determined, such as pipes,
+    are read into memory up front.
+
+    The length of the encoded body is known up front, and the encoder can be
+    rewound with :meth:`seek` to retry a request. Pass it as ``body`` with its
+    :attr:`content_type` and :attr:`content_length` as headers, which
+    :meth:`~urllib3.request.RequestMethods.request_encode_body` does for
+    fields which contain files.
 
     :param fields:
         Dictionary of fields or list of (key, :class:`~urllib3.fields.RequestField`).
@@ -59,28 +87,135 @@ def encode_multipart_formdata(
         If not specified, then a random boundary will be generated using
         :func:`urllib3.filepost.choose_boundary`.
     """
-    body = BytesIO()
-    if boundary is None:
-        boundary = choose_boundary()
-
-    for field in iter_field_objects(fields):
-        body.write(f"--{boundary}\r\n".encode("latin-1"))
-
-        writer(body).write(field.render_headers())
-        data = field.data
-
-        if isinstance(data, int):
-            data = str(data)  # Backwards compatibility
 
-        if isinstance(data, str):
-            writer(body).write(data)
+    def __init__(self, fields: _TYPE_FIELDS, boundary: Optional[str] = None) -> None:
+        if boundary is None:
+            boundary = choose_boundary()
+        #: Value of the Content-Type header of the body.
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        # Bytes, or files with their start position and length to send.
+        self._parts: List[Union[bytes, Tuple[IO[bytes], int, int]]] = []
+        for field in iter_field_objects(fields):
+            self._add(f"--{boundary}\r\n".encode("latin-1"))
+            self._add(field.render_headers().encode("utf-8"))
+            data: Any = field.data
+
+            if isinstance(data, int):
+                data = str(data)  # Backwards compatibility
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+
+            if hasattr(data, "read"):
+                size = _file_size(data)
+                if size is None:
+                    self._add(data.read())
+                elif size:
+                    self._parts.append((data, data.tell(), size))
+            else:
+                self._add(data)
+
+            self._add(b"\r\n")
+        self._add(f"--{boundary}--\r\n".encode("latin-1"))
+
+        #: Length of the body in bytes, the value of its Content-Length header.
+        self.content_length = sum(
+            len(part) if isinstance(part, bytes) else part[2] for part in self._parts
+        )
+        self._pos = 0
+        # Part at self._pos and the position within it.
+        self._index = 0
+        self._offset = 0
+
+    def _add(self, data: bytes) -> None:
+        if self._parts and isinstance(self._parts[-1], bytes):
+            self._parts[-1] += data
         else:
-            body.write(data)
+            self._parts.append(data)
+
+    def __len__(self) -> int:
+        return self.content_length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.content_length
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+
+        self._pos = offset
+        self._index = 0
+        for part in self._parts:
+            length = len(part) if isinstance(part, bytes) else part[2]
+            if offset < length:
+                break
+            offset -= length
+            self._index += 1
+        self._offset = offset
+        return self._pos
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read up to ``size`` bytes of the body, or the rest of it if ``size``
+        is negative or ``None``.
+        """
+        if size is None or size < 0:
+            size = self.content_length
+        chunks = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                length = len(part)
+                data = part[self._offset : self._offset + size]
+            else:
+                fileobj, start, length = part
+                # The position of the file may have changed since the last read.
+                fileobj.seek(start + self._offset)
+                n = min(size, length - self._offset)
+                data = fileobj.read(n)
+                if len(data) < n:
+                    raise ValueError(
+                        f"File ended {length - self._offset - len(data)} bytes "
+                        "before the size it had when the body was encoded"
+                    )
+
+            chunks.append(data)
+            size -= len(data)
+            self._pos += len(data)
+            self._offset += len(data)
+            if self._offset == length:
+                self._index += 1
+                self._offset = 0
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
 
-        body.write(b"\r\n")
 
-    body.write(f"--{boundary}--\r\n".encode("latin-1"))
+def encode_multipart_formdata(
+    fields: _TYPE_FIELDS, boundary: Optional[str] = None
+) -> Tuple[bytes, str]:
+    """
+    Encode a dictionary of ``fields`` using the multipart/form-data MIME format.
+
+    :param fields:
+        Dictionary of fields or list of (key, :class:`~urllib3.fields.RequestField`).
 
-    content_type = f"multipart/form-data; boundary={boundary}"
+    :param boundary:
+        If not specified, then a random boundary will be generated using
+        :func:`urllib3.filepost.choose_boundary`.
 
-    return body.getvalue(), content_type
+    File objects in ``fields`` are read into memory, use
+    :class:`MultipartEncoder` to stream them instead.
+    """
+    encoder = MultipartEncoder(fields, boundary=boundary)
+    return encoder.read(), encoder.content_type
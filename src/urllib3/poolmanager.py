@@ -1,11 +1,18 @@
+import collections
 import functools
 import logging
+import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import (
     TYPE_CHECKING,
     Any,
+    Deque,
     Dict,
     FrozenSet,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -20,9 +27,12 @@ from .connection import ProxyConfig
 from .connectionpool import (  # type: ignore
     HTTPConnectionPool,
     HTTPSConnectionPool,
+    PrewarmResult,
+    _deposit_retry_budget,
     port_by_scheme,
 )
 from .exceptions import (
+    CircuitOpenError,
     LocationValueError,
     MaxRetryError,
     ProxySchemeUnknown,
@@ -30,10 +40,16 @@ from .exceptions import (
 )
 from .request import RequestMethods
 from .response import BaseHTTPResponse
+from .util.circuit_breaker import CircuitBreaker
 from .util.connection import SocketOptions
+from .util.connection_limit import ConnectionLimit
 from .util.proxy import connection_requires_http_tunnel
+from .util.resolver import Resolver
 from .util.retry import Retry
+from .util.ssl_ import SSLContextCache, SSLSessionCache
+from .util.stats import PoolStats
 from .util.timeout import Timeout
+from .util.trace import Tracer
 from .util.url import Url, parse_url
 
 if TYPE_CHECKING:
@@ -55,6 +71,7 @@ SSL_KEYWORDS = (
     "ca_cert_dir",
     "ssl_context",
     "key_password",
+    "ssl_session_cache",
 )
 
 
@@ -87,10 +104,19 @@ class PoolKey(NamedTuple):
     key__proxy_headers: Optional[FrozenSet[Tuple[str, str]]]
     key__proxy_config: Optional[ProxyConfig]
     key_socket_options: Optional[SocketOptions]
+    key_happy_eyeballs_delay: Optional[float]
+    key_resolver: Optional[Resolver]
+    key_max_idle_time: Optional[float]
+    key_max_connection_age: Optional[float]
+    key_reap_interval: Optional[float]
+    key_tracer: Optional[Tracer]
     key__socks_options: Optional[FrozenSet[Tuple[str, str]]]
     key_assert_hostname: Optional[Union[bool, str]]
     key_assert_fingerprint: Optional[str]
     key_server_hostname: Optional[str]
+    key_ssl_session_cache: Optional[SSLSessionCache]
+    key_blocksize: Optional[int]
+    key_connection_limit: Optional[ConnectionLimit]
 
 
 def _default_key_normalizer(
@@ -155,6 +181,48 @@ key_fn_by_scheme = {
 
 pool_classes_by_scheme = {"http": HTTPConnectionPool, "https": HTTPSConnectionPool}
 
+_TYPE_BATCH_REQUEST = Union[Tuple[str, str], Mapping[str, Any]]
+_HostKey = Tuple[str, str, Optional[int]]
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of one request of :meth:`PoolManager.request_many`.
+    """
+
+    #: Position of the request in the ``requests`` given to ``request_many``.
+    index: int
+    #: The response, or ``None`` if the request raised an error.
+    response: Optional[BaseHTTPResponse]
+    #: The error raised by the request, such as a
+    #: :class:`~urllib3.exceptions.MaxRetryError`, or ``None``.
+    error: Optional[Exception]
+
+
+def _parse_batch_request(
+    request: _TYPE_BATCH_REQUEST,
+) -> Tuple[str, str, Dict[str, Any]]:
+    if isinstance(request, Mapping):
+        kw = dict(request)
+        return kw.pop("method"), kw.pop("url"), kw
+    method, url = request
+    return method, url, {}
+
+
+def _discard_response(response: BaseHTTPResponse) -> None:
+    # Close the connection first, its unread body makes it unusable.
+    response.close()
+    response.release_conn()
+
+
+def _discard_future_response(future: "Future[BaseHTTPResponse]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        _discard_response(future.result())
+
+
+def _pool_eviction_rank(pool: HTTPConnectionPool) -> int:
+    return pool._eviction_rank()
+
 
 class PoolManager(RequestMethods):
     """
@@ -163,12 +231,28 @@ class PoolManager(RequestMethods):
 
     :param num_pools:
         Number of connection pools to cache before discarding the least
-        recently used pool.
+        recently used pool. Pools without open connections are discarded
+        first, and pools with connections in use last. Those are only closed
+        once their connections are released, and are put back if they are
+        needed again before that.
 
     :param headers:
         Headers to include with all requests, unless other headers are given
         explicitly.
 
+    :param circuit_breaker:
+        A :class:`~urllib3.util.circuit_breaker.CircuitBreaker` which makes
+        :meth:`urlopen` raise :class:`~urllib3.exceptions.CircuitOpenError`
+        without connecting to hosts which keep failing. It can be shared by
+        several managers.
+
+    :param max_total_connections:
+        If set, the pools share a :class:`~urllib3.util.ConnectionLimit` so
+        that no more than this many connections are open at the same time
+        across all of them. Idle connections of other pools are closed to
+        make room, otherwise opening a connection waits for one to be
+        released, up to the connect timeout.
+
     :param \\**connection_pool_kw:
         Additional parameters are used to create fresh
         :class:`urllib3.connectionpool.ConnectionPool` instances.
@@ -197,16 +281,39 @@ class PoolManager(RequestMethods):
         self,
         num_pools: int = 10,
         headers: Optional[Mapping[str, str]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_total_connections: Optional[int] = None,
         **connection_pool_kw: Any,
     ) -> None:
         super().__init__(headers)
         self.connection_pool_kw = connection_pool_kw
+        self.circuit_breaker = circuit_breaker
+
+        self.connection_limit: Optional[ConnectionLimit] = None
+        if max_total_connections is not None:
+            self.connection_limit = ConnectionLimit(max_total_connections)
+
+        # Counters of the pools which were discarded, so that the totals
+        # returned by stats() don't go down.
+        self._retired_stats = PoolStats()
 
         def dispose_func(p: Any) -> None:
             p.close()
+            self._retired_stats.merge(p.stats)
 
         self.pools: RecentlyUsedContainer[PoolKey, HTTPConnectionPool]
-        self.pools = RecentlyUsedContainer(num_pools, dispose_func=dispose_func)
+        self.pools = RecentlyUsedContainer(
+            num_pools,
+            dispose_func=dispose_func,
+            eviction_rank=_pool_eviction_rank,
+            evict_func=self._evict_pool,
+        )
+        # Evicted pools which are closed once their connections are released,
+        # guarded by self.pools.lock.
+        self._draining: Dict[PoolKey, HTTPConnectionPool] = {}
+
+        # HTTPS pools with the same TLS configuration share an SSLContext.
+        self.ssl_context_cache = SSLContextCache(maxsize=num_pools)
 
         # Locally set the pool classes and keys so other PoolManagers can
         # override them.
@@ -253,6 +360,11 @@ class PoolManager(RequestMethods):
         if scheme == "http":
             for kw in SSL_KEYWORDS:
                 request_context.pop(kw, None)
+        elif issubclass(pool_cls, HTTPSConnectionPool):
+            request_context.setdefault("ssl_context_cache", self.ssl_context_cache)
+
+        if self.connection_limit is not None:
+            request_context.setdefault("connection_limit", self.connection_limit)
 
         return pool_cls(host, port, **request_context)
 
@@ -264,6 +376,29 @@ class PoolManager(RequestMethods):
         re-used after completion.
         """
         self.pools.clear()
+        with self.pools.lock:
+            draining = list(self._draining.values())
+            self._draining.clear()
+        for pool in draining:
+            pool.close()
+            self._retired_stats.merge(pool.stats)
+
+    def _evict_pool(self, pool_key: PoolKey, pool: HTTPConnectionPool) -> None:
+        pool.stats.incr("pool_evictions")
+        if pool.close_when_idle():
+            self._retired_stats.merge(pool.stats)
+            return
+        pool.stats.incr("pool_evictions_deferred")
+        with self.pools.lock:
+            self._retire_drained_pools()
+            self._draining[pool_key] = pool
+
+    def _retire_drained_pools(self) -> None:
+        # Must be called with self.pools.lock held.
+        for pool_key, pool in list(self._draining.items()):
+            if pool.pool is None:
+                del self._draining[pool_key]
+                self._retired_stats.merge(pool.stats)
 
     def connection_from_host(
         self,
@@ -336,11 +471,21 @@ class PoolManager(RequestMethods):
             if pool:
                 return pool
 
-            # Make a fresh ConnectionPool of the desired type
-            scheme = request_context["scheme"]
-            host = request_context["host"]
-            port = request_context["port"]
-            pool = self._new_pool(scheme, host, port, request_context=request_context)
+            # Put back an evicted pool if it wasn't closed yet.
+            pool = self._draining.pop(pool_key, None)
+            if pool is not None and pool._cancel_close():
+                pool.stats.incr("pool_revivals")
+            else:
+                if pool is not None:
+                    self._retired_stats.merge(pool.stats)
+
+                # Make a fresh ConnectionPool of the desired type
+                scheme = request_context["scheme"]
+                host = request_context["host"]
+                port = request_context["port"]
+                pool = self._new_pool(
+                    scheme, host, port, request_context=request_context
+                )
             self.pools[pool_key] = pool
 
         return pool
@@ -363,6 +508,249 @@ class PoolManager(RequestMethods):
             u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
         )
 
+    def prewarm(
+        self,
+        urls: Iterable[str],
+        per_host: Optional[int] = None,
+        parallel: bool = False,
+    ) -> PrewarmResult:
+        """
+        Open connections to the hosts of ``urls`` ahead of time with
+        :meth:`urllib3.HTTPConnectionPool.prewarm`, creating their pools if
+        needed.
+
+        Only the ``num_pools`` most recently used pools are kept, so prewarming
+        more hosts than that closes the connections of the first ones again.
+
+        :param urls:
+            URLs of the hosts to connect to. Several URLs of the same host only
+            prewarm its pool once.
+
+        :param per_host:
+            Number of connections to open to each host, by default the
+            ``maxsize`` of its pool.
+
+        :param parallel:
+            Prewarm all hosts, and the connections to each host, at the same
+            time from separate threads.
+
+        :returns:
+            A :class:`urllib3.connectionpool.PrewarmResult` with the totals of
+            all hosts.
+        """
+        start = time.monotonic()
+        pools: List[HTTPConnectionPool] = []
+        for url in urls:
+            pool = self.connection_from_url(url)
+            if not any(pool is p for p in pools):
+                pools.append(pool)
+
+        def prewarm_pool(pool: HTTPConnectionPool) -> PrewarmResult:
+            return pool.prewarm(per_host, parallel=parallel)
+
+        if parallel and len(pools) > 1:
+            with ThreadPoolExecutor(max_workers=len(pools)) as executor:
+                results = list(executor.map(prewarm_pool, pools))
+        else:
+            results = [prewarm_pool(pool) for pool in pools]
+
+        return PrewarmResult(
+            succeeded=sum(result.succeeded for result in results),
+            failed=sum(result.failed for result in results),
+            elapsed=time.monotonic() - start,
+        )
+
+    def request_many(
+        self,
+        requests: Iterable[_TYPE_BATCH_REQUEST],
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Make many requests concurrently from a pool of ``concurrency`` threads
+        and yield a :class:`urllib3.poolmanager.BatchResult` for each of them.
+
+        Each host gets at most as many requests at the same time as its pool
+        has connections (``maxsize``), the other requests to that host wait
+        for one of them to finish. This way every request gets a pooled
+        connection: no connections are opened only to be discarded, and
+        pools with ``block=True`` never raise
+        :class:`~urllib3.exceptions.EmptyPoolError`. Requests to other hosts
+        are made in the meantime.
+
+        Example::
+
+            http = urllib3.PoolManager(maxsize=4)
+            requests = [("GET", url) for url in urls]
+            for result in http.request_many(requests, concurrency=16):
+                if result.error is None:
+                    print(urls[result.index], result.response.status)
+
+        :param requests:
+            The requests, either ``(method, url)`` tuples or mappings with
+            ``method`` and ``url`` keys and any other keyword arguments of
+            :meth:`request`, such as ``fields``, ``headers``, ``retries`` or
+            ``timeout``. The iterable is consumed lazily, as threads become
+            free.
+
+        :param concurrency:
+            Number of requests to make at the same time, across all hosts.
+
+        :param ordered:
+            Yield the results in the order of ``requests`` instead of as soon
+            as each request finishes.
+
+        Errors of a request, including those of an invalid URL, don't stop the
+        batch but are returned in its ``error``. A request counts
+        towards the limit of its host until it returns, so with
+        ``preload_content=False`` the connection of a response stays taken
+        until it is released, and further requests to that host may have to
+        open new connections.
+
+        If the caller stops iterating early, requests which weren't started
+        are cancelled and the responses which weren't yielded are closed.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        pending = iter(enumerate(requests))
+        num_read = 0
+        exhausted = False
+        # Requests are limited per (scheme, host, port) rather than per pool
+        # object, so that the limit holds when a pool is discarded and created
+        # again during the batch.
+        waiting: Dict[_HostKey, Deque[Tuple[int, str, str, Dict[str, Any]]]]
+        waiting = collections.OrderedDict()
+        num_waiting = 0
+        in_flight: Dict[_HostKey, int] = collections.Counter()
+        limits: Dict[_HostKey, int] = {}
+        running: Dict["Future[BaseHTTPResponse]", Tuple[int, _HostKey]] = {}
+        finished: List[BatchResult] = []
+        next_index = 0
+        done_by_index: Dict[int, BatchResult] = {}
+
+        def has_room(host: _HostKey) -> bool:
+            return in_flight[host] < limits[host]
+
+        def submit(
+            host: _HostKey,
+            index: int,
+            method: str,
+            url: str,
+            kw: Dict[str, Any],
+        ) -> None:
+            future = executor.submit(self.request, method, url, **kw)
+            running[future] = (index, host)
+            in_flight[host] += 1
+
+        def fill() -> None:
+            nonlocal exhausted, num_read, num_waiting
+            # Requests which waited for their host come first.
+            for host, queue in list(waiting.items()):
+                while queue and len(running) < concurrency and has_room(host):
+                    submit(host, *queue.popleft())
+                    num_waiting -= 1
+                if not queue:
+                    del waiting[host]
+
+            # Read ahead at most ``concurrency`` requests which have to wait,
+            # so that a long iterable isn't buffered completely when a single
+            # host is busy. When ordered, results after a slow request are
+            # kept until it finishes, so also read at most ``2 * concurrency``
+            # requests past the first one which wasn't yielded.
+            while not exhausted and len(running) < concurrency:
+                if num_waiting >= concurrency:
+                    break
+                if ordered and num_read - next_index >= 2 * concurrency:
+                    break
+                try:
+                    index, request = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                num_read += 1
+                try:
+                    method, url, kw = _parse_batch_request(request)
+                    pool = self.connection_from_url(url)
+                except Exception as e:
+                    finished.append(BatchResult(index, None, e))
+                    continue
+                host = (pool.scheme, pool.host, pool.port)
+                if host not in limits:
+                    maxsize = pool.pool.maxsize if pool.pool is not None else 1
+                    limits[host] = max(maxsize, 1)
+                if host in waiting or not has_room(host):
+                    waiting.setdefault(host, collections.deque()).append(
+                        (index, method, url, kw)
+                    )
+                    num_waiting += 1
+                else:
+                    submit(host, index, method, url, kw)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            fill()
+            while running or finished:
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, host = running.pop(future)
+                        in_flight[host] -= 1
+                        try:
+                            response = future.result()
+                        except Exception as e:
+                            finished.append(BatchResult(index, None, e))
+                        else:
+                            finished.append(BatchResult(index, response, None))
+                    # Keep the threads busy while the caller handles the
+                    # results.
+                    fill()
+
+                if not ordered:
+                    results, finished = finished, []
+                    yield from results
+                    continue
+
+                for result in finished:
+                    done_by_index[result.index] = result
+                finished = []
+                while next_index in done_by_index:
+                    yield done_by_index.pop(next_index)
+                    next_index += 1
+                # Yielding made room for reading ahead.
+                fill()
+        finally:
+            # The caller may stop iterating early: don't start the requests
+            # which are queued, don't wait for the others, and give back the
+            # connections of the responses which won't be yielded.
+            for future in running:
+                if not future.cancel():
+                    future.add_done_callback(_discard_future_response)
+            executor.shutdown(wait=False)
+            for result in finished + list(done_by_index.values()):
+                if result.response is not None:
+                    _discard_response(result.response)
+
+    def stats(self) -> PoolStats:
+        """
+        Return the :class:`urllib3.util.stats.PoolStats` of all pools added
+        up, including the pools which were already discarded.
+
+        ``in_flight`` only counts the connections of the current pools and of
+        the evicted pools which are waiting for them to be released.
+        """
+        with self.pools.lock:
+            self._retire_drained_pools()
+            draining = list(self._draining.values())
+        stats = PoolStats()
+        stats.merge(self._retired_stats)
+        stats.in_flight = 0
+        for pool in self.pools.values():
+            stats.merge(pool.stats)
+        for pool in draining:
+            stats.merge(pool.stats)
+        return stats
+
     def _merge_pool_kwargs(self, override: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Merge a dictionary of override values for self.connection_pool_kw.
@@ -417,15 +805,96 @@ class PoolManager(RequestMethods):
         if "headers" not in kw:
             kw["headers"] = self.headers.copy()  # type: ignore
 
-        if self._proxy_requires_url_absolute_form(u):
-            response = conn.urlopen(method, url, **kw)
-        else:
-            response = conn.urlopen(method, u.request_uri, **kw)
+        request_url = url
+        if not self._proxy_requires_url_absolute_form(u):
+            request_url = u.request_uri
+
+        circuit = self._allow_request(conn, url)
+        try:
+            response = conn.urlopen(method, request_url, **kw)
+        except Exception as e:
+            self._record_outcome(circuit, error=e)
+            raise
+        self._record_outcome(circuit, response=response)
 
-        redirect_location = redirect and response.get_redirect_location()
-        if not redirect_location:
+        try:
+            follow_up = self._follow_redirect(conn, method, url, response, redirect, kw)
+        except MaxRetryError:
+            response.drain_conn()
+            raise
+        if follow_up is None:
             return response
 
+        method, redirect_location = follow_up
+        log.info("Redirecting %s -> %s", url, redirect_location)
+
+        response.drain_conn()
+        return self.urlopen(method, redirect_location, **kw)
+
+    def _allow_request(
+        self, conn: Any, url: str
+    ) -> Optional[Tuple[str, str, Optional[int]]]:
+        """
+        Return the circuit of the host of ``conn``, or ``None`` without a
+        circuit breaker. The outcome of the request must be passed to
+        :meth:`_record_outcome`.
+
+        Raises :class:`~urllib3.exceptions.CircuitOpenError` if the circuit
+        is open.
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return None
+        circuit = (conn.scheme, conn.host, conn.port)
+        if not breaker.allow_request(circuit):
+            conn.stats.incr("circuit_breaker_rejected")
+            raise CircuitOpenError(conn, url, "Circuit breaker is open")
+        return circuit
+
+    def _record_outcome(
+        self,
+        circuit: Optional[Tuple[str, str, Optional[int]]],
+        response: Optional[BaseHTTPResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        breaker = self.circuit_breaker
+        if circuit is None or breaker is None:
+            return
+        if error is not None:
+            if breaker.is_failure(error):
+                breaker.record_failure(circuit)
+            else:
+                breaker.release(circuit)
+        elif response is not None and response.status >= 500:
+            breaker.record_failure(circuit)
+        else:
+            breaker.record_success(circuit)
+
+    def _follow_redirect(
+        self,
+        conn: Any,
+        method: str,
+        url: str,
+        response: BaseHTTPResponse,
+        redirect: bool,
+        kw: Dict[str, Any],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Decide whether ``response`` is redirected by :meth:`urlopen`, shared
+        with :class:`~urllib3.AsyncPoolManager`. Returns the method and URL of
+        the redirect and updates the keyword arguments of the request in
+        ``kw``, or returns ``None`` if the response is returned.
+
+        Raises :class:`~urllib3.exceptions.MaxRetryError` if no retries are
+        left and ``retries`` says to raise, the response must be drained then.
+        """
+        redirect_location = response.get_redirect_location()
+        if not redirect_location or not redirect:
+            # The pool left the deposit of redirects to us.
+            if redirect_location and isinstance(response.retries, Retry):
+                _deposit_retry_budget(response, response.retries)
+            return None
+
         # Support relative URLs for redirecting.
         redirect_location = urljoin(url, redirect_location)
 
@@ -433,7 +902,11 @@ class PoolManager(RequestMethods):
         if response.status == 303:
             method = "GET"
 
+        # Without retries of the request, the pool used its own, which hold
+        # the retry budget.
         retries = kw.get("retries")
+        if retries is None:
+            retries = response.retries
         if not isinstance(retries, Retry):
             retries = Retry.from_int(retries, redirect=redirect)
 
@@ -449,20 +922,15 @@ class PoolManager(RequestMethods):
                     kw["headers"].pop(header, None)
 
         try:
-            retries = retries.increment(method, url, response=response, _pool=conn)  # type: ignore
+            retries = retries.increment(method, url, response=response, _pool=conn)
         except MaxRetryError:
             if retries.raise_on_redirect:
-                response.drain_conn()
                 raise
-            return response
+            return None
 
         kw["retries"] = retries
         kw["redirect"] = redirect
-
-        log.info("Redirecting %s -> %s", url, redirect_location)
-
-        response.drain_conn()
-        return self.urlopen(method, redirect_location, **kw)
+        return method, redirect_location
 
 
 class ProxyManager(PoolManager):
@@ -2,7 +2,12 @@ from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
 from urllib.parse import urlencode
 
 from .connection import HTTPBody
-from .filepost import _TYPE_FIELDS, encode_multipart_formdata
+from .filepost import (
+    _TYPE_FIELDS,
+    MultipartEncoder,
+    encode_multipart_formdata,
+    iter_field_objects,
+)
 from .response import BaseHTTPResponse
 
 __all__ = ["RequestMethods"]
@@ -163,6 +168,11 @@ class RequestMethods:
         When uploading a file, providing a filename (the first parameter of the
         tuple) is optional but recommended to best mimic behavior of browsers.
 
+        The data may also be a file object opened in binary mode. Its contents
+        aren't read into memory but sent by a
+        :class:`~urllib3.filepost.MultipartEncoder`, with a Content-Length
+        computed from the file sizes.
+
         Note that if ``headers`` are supplied, the 'Content-Type' header will
         be overwritten because it depends on the dynamic random boundary string
         which is used to compose the body of the request. The random boundary
@@ -172,7 +182,7 @@ class RequestMethods:
             headers = self.headers
 
         extra_kw: Dict[str, Any] = {"headers": {}}
-        body: Union[bytes, str]
+        body: Union[bytes, str, MultipartEncoder]
 
         if fields:
             if "body" in urlopen_kw:
@@ -180,7 +190,14 @@ class RequestMethods:
                     "request got values for both 'fields' and 'body', can only specify one."
                 )
 
-            if encode_multipart:
+            if encode_multipart and any(
+                hasattr(field.data, "read") for field in iter_field_objects(fields)
+            ):
+                # Stream the files instead of reading them into memory.
+                body = MultipartEncoder(fields, boundary=multipart_boundary)
+                content_type = body.content_type
+                extra_kw["headers"]["Content-Length"] = str(body.content_length)
+            elif encode_multipart:
                 body, content_type = encode_multipart_formdata(
                     fields, boundary=multipart_boundary
                 )
@@ -191,7 +208,7 @@ class RequestMethods:
                 )
 
             extra_kw["body"] = body
-            extra_kw["headers"] = {"Content-Type": content_type}
+            extra_kw["headers"]["Content-Type"] = content_type
 
         extra_kw["headers"].update(headers)
         extra_kw.update(urlopen_kw)
@@ -1,11 +1,20 @@
+import collections
 import io
 import logging
+import os
+import re
+import socket
+import stat
+import time
 import typing
+import warnings
 import zlib
 from contextlib import contextmanager
 from http.client import HTTPResponse as _HttplibHTTPResponse
+from http.client import IncompleteRead as httplib_IncompleteRead
+from http.client import LineTooLong
 from socket import timeout as SocketTimeout
-from typing import Any, Type
+from typing import Any, Callable, Deque, Dict, List, Tuple, Type, Union
 
 try:
     try:
@@ -15,6 +24,17 @@ try:
 except ImportError:
     brotli = None
 
+try:
+    import zstandard as zstd
+except (AttributeError, ImportError, ValueError):  # Defensive:
+    zstd = None
+else:
+    # The decompressobj() of older versions doesn't have the 'eof' attribute
+    # needed to decode frames which are split across reads.
+    _zstd_version = re.search(r"^([0-9]+)\.([0-9]+)", zstd.__version__)
+    if not _zstd_version or tuple(map(int, _zstd_version.groups())) < (0, 18):
+        zstd = None
+
 from ._collections import HTTPHeaderDict
 from .connection import BaseSSLError, HTTPException
 from .exceptions import (
@@ -30,6 +50,7 @@ from .exceptions import (
     SSLError,
 )
 from .util.response import is_fp_closed, is_response_to_head
+from .util.wait import wait_for_read
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Literal
@@ -38,9 +59,22 @@ log = logging.getLogger(__name__)
 
 
 class ContentDecoder:
-    def decompress(self, data: bytes) -> bytes:
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        """
+        Decode ``data``. If ``max_length`` is positive, decoders which support
+        it return at most ``max_length`` bytes and keep the rest of the input
+        for the following calls, see :attr:`has_unconsumed_tail`.
+        """
         raise NotImplementedError()
 
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        """
+        Whether input of an earlier :meth:`decompress` call wasn't decoded
+        because of its ``max_length``.
+        """
+        return False
+
     def flush(self) -> bytes:
         raise NotImplementedError()
 
@@ -50,17 +84,29 @@ class DeflateDecoder(ContentDecoder):
         self._first_try = True
         self._data = b""
         self._obj = zlib.decompressobj()
+        self._unconsumed_tail = b""
+
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return bool(self._unconsumed_tail)
 
-    def decompress(self, data):
+    def _decompress(self, data: bytes, max_length: int) -> bytes:
+        # zlib reads a max_length of 0 as unlimited.
+        decompressed = self._obj.decompress(data, max(max_length, 0))
+        self._unconsumed_tail = self._obj.unconsumed_tail
+        return decompressed
+
+    def decompress(self, data, max_length=-1):
+        data = self._unconsumed_tail + data
         if not data:
             return data
 
         if not self._first_try:
-            return self._obj.decompress(data)
+            return self._decompress(data, max_length)
 
         self._data += data
         try:
-            decompressed = self._obj.decompress(data)
+            decompressed = self._decompress(data, max_length)
             if decompressed:
                 self._first_try = False
                 self._data = None
@@ -68,8 +114,9 @@ class DeflateDecoder(ContentDecoder):
         except zlib.error:
             self._first_try = False
             self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            self._unconsumed_tail = b""
             try:
-                return self.decompress(self._data)
+                return self.decompress(self._data, max_length)
             finally:
                 self._data = None
 
@@ -88,14 +135,24 @@ class GzipDecoder(ContentDecoder):
     def __init__(self):
         self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
         self._state = GzipDecoderState.FIRST_MEMBER
+        self._unconsumed_tail = b""
+
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return bool(self._unconsumed_tail)
 
-    def decompress(self, data):
+    def decompress(self, data, max_length=-1):
         ret = bytearray()
+        data = self._unconsumed_tail + data
+        self._unconsumed_tail = b""
         if self._state == GzipDecoderState.SWALLOW_DATA or not data:
             return bytes(ret)
         while True:
             try:
-                ret += self._obj.decompress(data)
+                # zlib reads a max_length of 0 as unlimited.
+                ret += self._obj.decompress(
+                    data, max(max_length - len(ret), 0) if max_length > 0 else 0
+                )
             except zlib.error:
                 previous_state = self._state
                 # Ignore data after the first error
@@ -104,28 +161,101 @@ class GzipDecoder(ContentDecoder):
                     # Allow trailing garbage acceptable in other gzip clients
                     return bytes(ret)
                 raise
+            if self._obj.unconsumed_tail:
+                self._unconsumed_tail = self._obj.unconsumed_tail
+                return bytes(ret)
             data = self._obj.unused_data
             if not data:
                 return bytes(ret)
             self._state = GzipDecoderState.OTHER_MEMBERS
             self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if 0 < max_length <= len(ret):
+                self._unconsumed_tail = data
+                return bytes(ret)
 
     def flush(self) -> bytes:
         return self._obj.flush()
 
 
+def _decompress_bounded(
+    decompress: Callable[[memoryview], bytes],
+    data: bytes,
+    max_length: int,
+    step: int,
+) -> Tuple[bytes, memoryview]:
+    """
+    Feed ``data`` to ``decompress`` ``step`` bytes at a time until it returned
+    at least ``max_length`` bytes, for decoders whose output can't be limited.
+    Returns the output and the input which wasn't fed yet.
+    """
+    view = memoryview(data)
+    parts = []
+    size = 0
+    pos = 0
+    while pos < len(view) and size < max_length:
+        part = decompress(view[pos : pos + step])
+        pos += step
+        parts.append(part)
+        size += len(part)
+    return b"".join(parts), view[pos:]
+
+
 if brotli is not None:
 
     class BrotliDecoder(ContentDecoder):
+        # Brotli expands up to about 600000 times, so without an output limit
+        # a step of 8 input bytes yields at most about 5 MiB.
+        _INPUT_STEP = 8
+
         # Supports both 'brotlipy' and 'Brotli' packages
         # since they share an import name. The top branches
         # are for 'brotlipy' and bottom branches for 'Brotli'
         def __init__(self):
             self._obj = brotli.Decompressor()
             if hasattr(self._obj, "decompress"):
-                self.decompress = self._obj.decompress
+                self._decompress = self._obj.decompress
             else:
-                self.decompress = self._obj.process
+                self._decompress = self._obj.process
+            # Brotli and brotlicffi 1.2 can limit the size of their output.
+            self._can_limit = hasattr(self._obj, "can_accept_more_data")
+            # Input which wasn't passed to the decompressor yet.
+            self._tail = memoryview(b"")
+            # Whether the decompressor may hold more output.
+            self._output_limited = False
+
+        @property
+        def has_unconsumed_tail(self) -> bool:
+            return bool(self._tail) or self._output_limited
+
+        def decompress(self, data, max_length=-1):
+            if self._tail:
+                data = bytes(self._tail) + data
+                self._tail = memoryview(b"")
+
+            if max_length <= 0:
+                self._output_limited = False
+                if not self._can_limit:
+                    return self._decompress(data)
+                # Input may only be passed once the output held back by an
+                # earlier limit was returned.
+                parts = []
+                while not self._obj.can_accept_more_data():
+                    parts.append(self._decompress(b""))
+                parts.append(self._decompress(data))
+                return b"".join(parts)
+
+            if not self._can_limit:
+                ret, self._tail = _decompress_bounded(
+                    self._decompress, data, max_length, self._INPUT_STEP
+                )
+                return ret
+
+            if data and not self._obj.can_accept_more_data():
+                self._tail = memoryview(data)
+                data = b""
+            ret = self._decompress(data, output_buffer_limit=max_length)
+            self._output_limited = len(ret) >= max_length
+            return ret
 
         def flush(self):
             if hasattr(self._obj, "flush"):
@@ -133,6 +263,120 @@ if brotli is not None:
             return b""
 
 
+if zstd is not None:
+
+    class ZstdDecoder(ContentDecoder):
+        # zstandard can't limit the size of its output. Zstandard expands up
+        # to about 32000 times, so a step of 64 input bytes yields at most
+        # about 2 MiB.
+        _INPUT_STEP = 64
+
+        def __init__(self) -> None:
+            self._obj = zstd.ZstdDecompressor().decompressobj()
+            # Input which wasn't passed to the decompressor yet.
+            self._tail = memoryview(b"")
+
+        @property
+        def has_unconsumed_tail(self) -> bool:
+            return bool(self._tail)
+
+        def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+            if self._tail:
+                data = bytes(self._tail) + data
+                self._tail = memoryview(b"")
+            if max_length <= 0:
+                return self._decompress(data)
+            ret, self._tail = _decompress_bounded(
+                self._decompress, data, max_length, self._INPUT_STEP
+            )
+            return ret
+
+        def _decompress(self, data: Union[bytes, memoryview]) -> bytes:
+            if not data:
+                return b""
+            data_parts = [self._obj.decompress(data)]
+            # A response may consist of several frames.
+            while self._obj.eof and self._obj.unused_data:
+                unused_data = self._obj.unused_data
+                self._obj = zstd.ZstdDecompressor().decompressobj()
+                data_parts.append(self._obj.decompress(unused_data))
+            return b"".join(data_parts)
+
+        def flush(self) -> bytes:
+            ret = self._obj.flush()
+            if not self._obj.eof:
+                raise DecodeError("Zstandard data is incomplete")
+            return ret
+
+
+# Content-codings which responses can decode, in the order they were
+# registered, mapped to a factory of their decoder and the errors it raises on
+# invalid data.
+_content_decoders: Dict[
+    str, Tuple[Callable[[], ContentDecoder], Tuple[Type[Exception], ...]]
+] = {}
+
+
+def register_content_decoder(
+    encoding: str,
+    factory: Callable[[], ContentDecoder],
+    error_classes: Tuple[Type[Exception], ...] = (),
+) -> None:
+    """
+    Decode response bodies with the content-coding ``encoding`` using a new
+    decoder returned by ``factory`` for each response. Replaces the decoder
+    already registered for ``encoding``, if any.
+
+    Registered encodings are sent in the ``Accept-Encoding`` header of
+    :func:`urllib3.util.make_headers` with ``accept_encoding=True``.
+
+    :param encoding:
+        Content-coding as it appears in the ``Content-Encoding`` header, such
+        as ``"zstd"``. Matched case-insensitively.
+
+    :param factory:
+        Callable returning a :class:`ContentDecoder`, for example the decoder
+        class itself. Its ``decompress()`` is passed a ``max_length`` which it
+        may ignore.
+
+    :param error_classes:
+        Exceptions raised by the decoder on invalid data, which responses
+        raise as :class:`~urllib3.exceptions.DecodeError`.
+    """
+    _content_decoders[encoding.lower()] = (factory, tuple(error_classes))
+    _update_decoder_errors()
+
+
+def unregister_content_decoder(encoding: str) -> None:
+    """
+    Stop decoding and advertising the content-coding ``encoding``. Does
+    nothing if no decoder is registered for it.
+    """
+    _content_decoders.pop(encoding.lower(), None)
+    _update_decoder_errors()
+
+
+def registered_content_encodings() -> List[str]:
+    """
+    Return the content-codings which responses can decode, in the order they
+    were registered.
+    """
+    return list(_content_decoders)
+
+
+# Errors raised by the registered decoders, kept up to date by
+# register_content_decoder() and unregister_content_decoder().
+_decoder_errors: Tuple[Type[Exception], ...] = ()
+
+
+def _update_decoder_errors() -> None:
+    global _decoder_errors
+    error_classes: Tuple[Type[Exception], ...] = ()
+    for _, errors in _content_decoders.values():
+        error_classes += errors
+    _decoder_errors = error_classes
+
+
 class MultiDecoder(ContentDecoder):
     """
     From RFC7231:
@@ -145,12 +389,16 @@ class MultiDecoder(ContentDecoder):
     def __init__(self, modes):
         self._decoders = [_get_decoder(m.strip()) for m in modes.split(",")]
 
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return any(d.has_unconsumed_tail for d in self._decoders)
+
     def flush(self):
         return self._decoders[0].flush()
 
-    def decompress(self, data):
+    def decompress(self, data, max_length=-1):
         for d in reversed(self._decoders):
-            data = d.decompress(data)
+            data = d.decompress(data, max_length)
         return data
 
 
@@ -158,24 +406,43 @@ def _get_decoder(mode: str) -> ContentDecoder:
     if "," in mode:
         return MultiDecoder(mode)
 
-    if mode == "gzip":
-        return GzipDecoder()
-
-    if brotli is not None and mode == "br":
-        return BrotliDecoder()
+    decoder = _content_decoders.get(mode)
+    if decoder is not None:
+        return decoder[0]()
 
     return DeflateDecoder()
 
 
+register_content_decoder("gzip", GzipDecoder, (zlib.error,))
+register_content_decoder("deflate", DeflateDecoder, (zlib.error,))
+if brotli is not None:
+    register_content_decoder("br", BrotliDecoder, (brotli.error,))
+if zstd is not None:
+    register_content_decoder("zstd", ZstdDecoder, (zstd.ZstdError,))
+
+
+class _DeprecatedContentDecoders:
+    def __get__(self, obj: object, objtype: object = None) -> List[str]:
+        warnings.warn(
+            "'CONTENT_DECODERS' is deprecated and will be removed in urllib3 "
+            "v3.0.0. Use urllib3.response.registered_content_encodings() "
+            "instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return registered_content_encodings()
+
+
 class BaseHTTPResponse(io.IOBase):
-    CONTENT_DECODERS = ["gzip", "deflate"]
-    if brotli is not None:
-        CONTENT_DECODERS += ["br"]
+    #: The registered content-codings.
+    #:
+    #: .. deprecated:: 2.0.0
+    #:     Use :func:`registered_content_encodings` instead.
+    CONTENT_DECODERS = _DeprecatedContentDecoders()
     REDIRECT_STATUSES = [301, 302, 303, 307, 308]
 
-    DECODER_ERROR_CLASSES = (IOError, zlib.error)
-    if brotli is not None:
-        DECODER_ERROR_CLASSES += (brotli.error,)
+    # Errors of the registered decoders are added to these.
+    DECODER_ERROR_CLASSES: Tuple[Type[Exception], ...] = (IOError, zlib.error)
 
     def __init__(
         self,
@@ -261,6 +528,58 @@ class BaseHTTPResponse(io.IOBase):
     def close(self) -> None:
         raise NotImplementedError()
 
+    def _init_length(self, request_method):
+        """
+        Set initial length value for Response content if available.
+        """
+        length = self.headers.get("content-length")
+
+        if length is not None:
+            if self.chunked:
+                # This Response will fail with an IncompleteRead if it can't be
+                # received as chunked. This method falls back to attempt reading
+                # the response before raising an exception.
+                log.warning(
+                    "Received response with both Content-Length and "
+                    "Transfer-Encoding set. This is expressly forbidden "
+                    "by RFC 7230 sec 3.3.2. Ignoring Content-Length and "
+                    "attempting to process response as Transfer-Encoding: "
+                    "chunked."
+                )
+                return None
+
+            try:
+                # RFC 7230 section 3.3.2 specifies multiple content lengths can
+                # be sent in a single Content-Length header
+                # (e.g. Content-Length: 42, 42). This line ensures the values
+                # are all valid ints and that as long as the `set` length is 1,
+                # all values are the same. Otherwise, the header is invalid.
+                lengths = {int(val) for val in length.split(",")}
+                if len(lengths) > 1:
+                    raise InvalidHeader(
+                        "Content-Length contained multiple "
+                        "unmatching values (%s)" % length
+                    )
+                length = lengths.pop()
+            except ValueError:
+                length = None
+            else:
+                if length < 0:
+                    length = None
+
+        # Convert status to int for comparison
+        # In some cases, httplib returns a status of "_UNKNOWN"
+        try:
+            status = int(self.status)
+        except ValueError:
+            status = 0
+
+        # Check for responses that shouldn't include a body
+        if status in (204, 304) or 100 <= status < 200 or request_method == "HEAD":
+            length = 0
+
+        return length
+
     def _init_decoder(self) -> None:
         """
         Set-up the _decoder attribute if necessary.
@@ -269,28 +588,36 @@ class BaseHTTPResponse(io.IOBase):
         # Section 3.2
         content_encoding = self.headers.get("content-encoding", "").lower()
         if self._decoder is None:
-            if content_encoding in self.CONTENT_DECODERS:
+            if content_encoding in _content_decoders:
                 self._decoder = _get_decoder(content_encoding)
             elif "," in content_encoding:
                 encodings = [
                     e.strip()
                     for e in content_encoding.split(",")
-                    if e.strip() in self.CONTENT_DECODERS
+                    if e.strip() in _content_decoders
                 ]
                 if encodings:
                     self._decoder = _get_decoder(content_encoding)
 
-    def _decode(self, data: bytes, decode_content: bool, flush_decoder: bool) -> bytes:
+    def _decode(
+        self,
+        data: bytes,
+        decode_content: bool,
+        flush_decoder: bool,
+        max_length: int = -1,
+    ) -> bytes:
         """
-        Decode the data passed in and potentially flush the decoder.
+        Decode the data passed in and potentially flush the decoder. A positive
+        ``max_length`` limits the output of decoders which support it, see
+        :meth:`ContentDecoder.decompress`.
         """
         if not decode_content:
             return data
 
         try:
             if self._decoder:
-                data = self._decoder.decompress(data)
-        except self.DECODER_ERROR_CLASSES as e:
+                data = self._decoder.decompress(data, max_length)
+        except self.DECODER_ERROR_CLASSES + _decoder_errors as e:
             content_encoding = self.headers.get("content-encoding", "").lower()
             raise DecodeError(
                 "Received response with content-encoding: %s, but "
@@ -340,6 +667,275 @@ class BaseHTTPResponse(io.IOBase):
         return self.url
 
 
+class BytesQueueBuffer:
+    """
+    Queue of decoded bytes, from which :meth:`HTTPResponse.read` returns
+    exactly the requested amount.
+
+    Data is only copied when it's returned, and not at all when a whole
+    queued ``bytes`` object is returned.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: Deque[bytes] = collections.deque()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, data: bytes) -> None:
+        if data:
+            self._buffer.append(data)
+            self._size += len(data)
+
+    def get(self, n: int) -> bytes:
+        """
+        Remove and return the first ``n`` bytes, or all of them if there are
+        fewer.
+        """
+        if n <= 0:
+            return b""
+        if n >= self._size:
+            return self.get_all()
+        parts = []
+        left = n
+        while left:
+            data = self._buffer.popleft()
+            if len(data) > left:
+                self._buffer.appendleft(data[left:])
+                data = data[:left]
+            parts.append(data)
+            left -= len(data)
+        self._size -= n
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def get_all(self) -> bytes:
+        """Remove and return all bytes."""
+        buffer = self._buffer
+        data = buffer.popleft() if len(buffer) == 1 else b"".join(buffer)
+        buffer.clear()
+        self._size = 0
+        return data
+
+
+class _InvalidChunkSize(Exception):
+    def __init__(self, line: bytes) -> None:
+        super().__init__(line)
+        self.line = line
+
+
+class _ChunkedReader:
+    """
+    Decodes a body with the chunked transfer-coding read from ``fp``.
+
+    Chunk-size lines, chunk data and trailers are parsed from a buffer which
+    is filled with whatever ``fp`` has available, instead of reading each line,
+    chunk and CRLF separately. Large chunks are read from ``fp`` directly, so
+    that their data isn't copied through the buffer.
+    """
+
+    SIZE = 0
+    DATA = 1
+    DATA_END = 2
+    TRAILER = 3
+    DONE = 4
+
+    #: Bytes to read from ``fp`` at once, also the maximum length of a line.
+    buffer_size = 64 * 1024
+    #: Chunks of at least this size are read from ``fp`` directly.
+    large_chunk_size = 16 * 1024
+
+    def __init__(self, fp: typing.BinaryIO) -> None:
+        self._fp = fp
+        self._read1 = getattr(fp, "read1", fp.read)
+        # The unparsed data is self._buffer[self._pos:].
+        self._buffer = b""
+        self._pos = 0
+        # While the chunks are large, also their size lines and CRLFs are read
+        # from fp directly instead of filling the buffer with data.
+        self._large_chunks = False
+        self.state = self.SIZE
+        self.chunk_left: typing.Optional[int] = None
+
+    def _fill(self) -> bool:
+        """
+        Add what's available from ``fp`` to the unparsed data. Returns False at
+        the end of ``fp``.
+        """
+        data = self._read1(self.buffer_size)
+        if not data:
+            return False
+        self._buffer = (
+            self._buffer[self._pos :] + data if self._pos < len(self._buffer) else data
+        )
+        self._pos = 0
+        return True
+
+    def _readline(self, block: bool) -> typing.Optional[bytes]:
+        """
+        Return the next line including its line break, the remaining data at
+        the end of ``fp``, or ``None`` if it isn't buffered and ``block`` is
+        false.
+        """
+        if self._large_chunks and self._pos == len(self._buffer) and block:
+            line = self._fp.readline(self.buffer_size + 1)
+            if len(line) > self.buffer_size:
+                raise LineTooLong("chunked transfer-coding line")
+            return line
+
+        while True:
+            end = self._buffer.find(b"\n", self._pos)
+            if end != -1:
+                line = self._buffer[self._pos : end + 1]
+                self._pos = end + 1
+                return line
+            if not block:
+                return None
+            if len(self._buffer) - self._pos >= self.buffer_size:
+                raise LineTooLong("chunked transfer-coding line")
+            if not self._fill():
+                line = self._buffer[self._pos :]
+                self._pos = len(self._buffer)
+                return line
+
+    def _read_buffered_chunks(
+        self, parts: List[bytes], amt: typing.Optional[int]
+    ) -> int:
+        """
+        Append the data of the following chunks which are buffered completely,
+        including their CRLF, to ``parts`` while they fit in ``amt``. Returns
+        the number of bytes appended.
+
+        This is the fast path of :meth:`read` for many small chunks, anything
+        else is left to its state machine.
+        """
+        buffer = self._buffer
+        end = len(buffer)
+        pos = self._pos
+        size = 0
+        while True:
+            line_end = buffer.find(b"\n", pos)
+            if line_end == -1:
+                break
+            try:
+                chunk_size = int(buffer[pos:line_end], 16)
+            except ValueError:
+                # Chunk extensions or an invalid line.
+                break
+            start = line_end + 1
+            stop = start + chunk_size
+            if (
+                chunk_size <= 0
+                or stop + 2 > end
+                or (amt is not None and size + chunk_size > amt)
+            ):
+                break
+            parts.append(buffer[start:stop])
+            size += chunk_size
+            pos = stop + 2
+        self._pos = pos
+        return size
+
+    def read(self, amt: typing.Optional[int] = None) -> bytes:
+        """
+        Return the data of the next chunks, ``b""`` once the body was read.
+
+        Blocks until ``amt`` bytes or the end of the current chunk were read,
+        ``amt=None`` reads the whole chunk. Following chunks which were already
+        received are added up to ``amt`` bytes, so many small chunks are
+        returned at once.
+        """
+        parts: List[bytes] = []
+        size = 0
+        while self.state != self.DONE and (amt is None or size < amt):
+            if self.state == self.DATA:
+                assert self.chunk_left is not None
+                n = self.chunk_left if amt is None else min(self.chunk_left, amt - size)
+                buffered = len(self._buffer) - self._pos
+                if buffered >= n:
+                    data = self._buffer[self._pos : self._pos + n]
+                    self._pos += n
+                elif parts:
+                    break
+                elif n - buffered < self.large_chunk_size:
+                    if not self._fill():
+                        raise httplib_IncompleteRead(
+                            self._buffer[self._pos :], n - buffered
+                        )
+                    continue
+                else:
+                    data = self._buffer[self._pos :]
+                    self._buffer = b""
+                    self._pos = 0
+                    rest = self._fp.read(n - buffered)
+                    if len(rest) < n - buffered:
+                        raise httplib_IncompleteRead(
+                            data + rest, n - buffered - len(rest)
+                        )
+                    data = data + rest if data else rest
+
+                parts.append(data)
+                size += n
+                self.chunk_left -= n
+                if not self.chunk_left:
+                    self.chunk_left = None
+                    self.state = self.DATA_END
+
+            elif self.state == self.DATA_END:
+                # Toss the CRLF at the end of the chunk.
+                if len(self._buffer) - self._pos >= 2:
+                    self._pos += 2
+                elif parts:
+                    break
+                elif self._large_chunks and self._pos == len(self._buffer):
+                    crlf = self._fp.read(2)
+                    if len(crlf) < 2:
+                        raise httplib_IncompleteRead(crlf, 2 - len(crlf))
+                else:
+                    if not self._fill():
+                        raise httplib_IncompleteRead(
+                            self._buffer[self._pos :], 2 - len(self._buffer) + self._pos
+                        )
+                    continue
+                self.state = self.SIZE
+
+            else:
+                if self.state == self.SIZE:
+                    size += self._read_buffered_chunks(
+                        parts, None if amt is None else amt - size
+                    )
+                    if amt is not None and size >= amt:
+                        break
+
+                line = self._readline(block=not parts)
+                if line is None:
+                    break
+
+                if self.state == self.SIZE:
+                    size_line = line.split(b";", 1)[0]
+                    try:
+                        chunk_size = int(size_line, 16)
+                    except ValueError:
+                        raise _InvalidChunkSize(size_line) from None
+                    if chunk_size < 0:
+                        raise _InvalidChunkSize(size_line)
+                    self._large_chunks = chunk_size >= self.large_chunk_size
+                    if chunk_size:
+                        self.chunk_left = chunk_size
+                        self.state = self.DATA
+                    else:
+                        self.state = self.TRAILER
+
+                # Trailer fields are discarded. Some sites don't end the body
+                # with a CRLF.
+                elif not line or line == b"\r\n":
+                    self.state = self.DONE
+
+        if len(parts) == 1:
+            return parts[0]
+        return b"".join(parts)
+
+
 class HTTPResponse(BaseHTTPResponse):
     """
     HTTP Response container.
@@ -371,6 +967,10 @@ class HTTPResponse(BaseHTTPResponse):
     :param enforce_content_length:
         Enforce content length checking. Body returned by server must match
         value of Content-Length header, if present. Otherwise, raise error.
+
+    :param tracer:
+        The :class:`urllib3.util.trace.Tracer` of the request, which receives
+        a ``response_end`` event once the body was read.
     """
 
     def __init__(
@@ -391,6 +991,7 @@ class HTTPResponse(BaseHTTPResponse):
         request_method=None,
         request_url=None,
         auto_close=True,
+        tracer=None,
     ):
         super().__init__(
             headers=headers,
@@ -416,12 +1017,15 @@ class HTTPResponse(BaseHTTPResponse):
 
         self._pool = pool
         self._connection = connection
+        self._tracer = tracer
 
         if hasattr(body, "read"):
             self._fp = body
 
-        # Are we using the chunked-style of transfer encoding?
-        self.chunk_left = None
+        # Decoder of the chunked transfer-coding, see read_chunked().
+        self._chunked_reader = None
+        # Decoded data not returned yet by read(amt) and read_chunked(amt).
+        self._decoded_buffer = BytesQueueBuffer()
 
         # Determine length of response
         self.length_remaining = self._init_length(request_method)
@@ -472,57 +1076,16 @@ class HTTPResponse(BaseHTTPResponse):
         """
         return self._fp_bytes_read
 
-    def _init_length(self, request_method):
-        """
-        Set initial length value for Response content if available.
-        """
-        length = self.headers.get("content-length")
-
-        if length is not None:
-            if self.chunked:
-                # This Response will fail with an IncompleteRead if it can't be
-                # received as chunked. This method falls back to attempt reading
-                # the response before raising an exception.
-                log.warning(
-                    "Received response with both Content-Length and "
-                    "Transfer-Encoding set. This is expressly forbidden "
-                    "by RFC 7230 sec 3.3.2. Ignoring Content-Length and "
-                    "attempting to process response as Transfer-Encoding: "
-                    "chunked."
-                )
-                return None
+    def _trace_end(self):
+        tracer = self._tracer
+        if tracer is not None:
+            # The body is only read once, later reads return nothing.
+            self._tracer = None
+            tracer.event("response_end", time.monotonic())
 
-            try:
-                # RFC 7230 section 3.3.2 specifies multiple content lengths can
-                # be sent in a single Content-Length header
-                # (e.g. Content-Length: 42, 42). This line ensures the values
-                # are all valid ints and that as long as the `set` length is 1,
-                # all values are the same. Otherwise, the header is invalid.
-                lengths = {int(val) for val in length.split(",")}
-                if len(lengths) > 1:
-                    raise InvalidHeader(
-                        "Content-Length contained multiple "
-                        "unmatching values (%s)" % length
-                    )
-                length = lengths.pop()
-            except ValueError:
-                length = None
-            else:
-                if length < 0:
-                    length = None
-
-        # Convert status to int for comparison
-        # In some cases, httplib returns a status of "_UNKNOWN"
-        try:
-            status = int(self.status)
-        except ValueError:
-            status = 0
-
-        # Check for responses that shouldn't include a body
-        if status in (204, 304) or 100 <= status < 200 or request_method == "HEAD":
-            length = 0
-
-        return length
+    def _count_bytes_received(self, amount):
+        if self._pool is not None:
+            self._pool.stats.incr("bytes_received", amount)
 
     @contextmanager
     def _error_catcher(self):
@@ -580,44 +1143,18 @@ class HTTPResponse(BaseHTTPResponse):
             if self._original_response and self._original_response.isclosed():
                 self.release_conn()
 
-    def read(self, amt=None, decode_content=None, cache_content=False):
+    def _raw_read(self, amt=None):
         """
-        Similar to :meth:`http.client.HTTPResponse.read`, but with two additional
-        parameters: ``decode_content`` and ``cache_content``.
-
-        :param amt:
-            How much of the content to read. If specified, caching is skipped
-            because it doesn't make sense to cache partial content as the full
-            response.
-
-        :param decode_content:
-            If True, will attempt to decode the body based on the
-            'content-encoding' header.
-
-        :param cache_content:
-            If True, will save the returned data such that the same result is
-            returned despite of the state of the underlying file object. This
-            is useful if you want the ``.data`` property to continue working
-            after having ``.read()`` the file object. (Overridden if ``amt`` is
-            set.)
+        Read up to ``amt`` bytes of the body from the connection, or all of it
+        if ``amt`` is ``None``, without decoding it.
         """
-        self._init_decoder()
-        if decode_content is None:
-            decode_content = self.decode_content
-
-        if self._fp is None:
-            return
-
-        flush_decoder = False
         fp_closed = getattr(self._fp, "closed", False)
 
         with self._error_catcher():
             if amt is None:
                 # cStringIO doesn't like amt=None
                 data = self._fp.read() if not fp_closed else b""
-                flush_decoder = True
             else:
-                cache_content = False
                 data = self._fp.read(amt) if not fp_closed else b""
                 if (
                     amt != 0 and not data
@@ -630,7 +1167,6 @@ class HTTPResponse(BaseHTTPResponse):
                     # not properly close the connection in all cases. There is
                     # no harm in redundantly calling close.
                     self._fp.close()
-                    flush_decoder = True
                     if self.enforce_content_length and self.length_remaining not in (
                         0,
                         None,
@@ -642,18 +1178,145 @@ class HTTPResponse(BaseHTTPResponse):
                         # Content-Length are caught.
                         raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
 
+        if self._tracer is not None and (
+            amt is None or amt != 0 and not data or is_fp_closed(self._fp)
+        ):
+            self._trace_end()
+
         if data:
-            self._fp_bytes_read += len(data)
-            if self.length_remaining is not None:
-                self.length_remaining -= len(data)
+            self._update_length(len(data))
+
+        return data
+
+    def read(self, amt=None, decode_content=None, cache_content=False):
+        """
+        Similar to :meth:`http.client.HTTPResponse.read`, but with two additional
+        parameters: ``decode_content`` and ``cache_content``.
+
+        :param amt:
+            How much of the content to read. If specified, caching is skipped
+            because it doesn't make sense to cache partial content as the full
+            response. Decoded content is returned in exactly ``amt`` bytes
+            until the end of the body.
 
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param cache_content:
+            If True, will save the returned data such that the same result is
+            returned despite of the state of the underlying file object. This
+            is useful if you want the ``.data`` property to continue working
+            after having ``.read()`` the file object. (Overridden if ``amt`` is
+            set.)
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        if self._fp is None:
+            return
+
+        if amt is not None:
+            cache_content = False
+            if decode_content and self._decoder is not None:
+                return self._read_decoded(amt)
+
+        data = self._raw_read(amt)
+        flush_decoder = amt is None or (amt != 0 and not data)
+
+        # Earlier read(amt) calls may have left input in the decoder after
+        # the whole body was read.
+        if data or (flush_decoder and self._has_decoder_tail(decode_content)):
             data = self._decode(data, decode_content, flush_decoder)
+        if self._decoded_buffer:
+            # Left over from read(amt) calls with another decode_content.
+            self._decoded_buffer.put(data)
+            data = self._decoded_buffer.get_all()
 
-            if cache_content:
-                self._body = data
+        if cache_content and data:
+            self._body = data
 
         return data
 
+    def _has_decoder_tail(self, decode_content):
+        """
+        Whether the decoder holds input of earlier ``read(amt)`` calls which
+        a read with ``decode_content`` would still decode.
+        """
+        if decode_content is None:
+            decode_content = self.decode_content
+        return (
+            decode_content
+            and self._decoder is not None
+            and self._decoder.has_unconsumed_tail
+        )
+
+    def _read_decoded(self, amt):
+        """
+        Read and decode until ``amt`` decoded bytes are buffered or the body
+        ends, and return up to ``amt`` of them.
+
+        The decoder is asked for no more than the missing bytes at once, so
+        that a highly compressed body doesn't expand into memory all at once.
+        """
+        buffer = self._decoded_buffer
+        while len(buffer) < amt:
+            if self._decoder.has_unconsumed_tail:
+                data = b""
+            else:
+                data = self._raw_read(amt)
+                if not data:
+                    buffer.put(self._decode(data, True, flush_decoder=True))
+                    break
+            buffer.put(self._decode(data, True, False, max_length=amt - len(buffer)))
+        return buffer.get(amt)
+
+    def readinto(self, b):
+        """
+        Read up to ``len(b)`` bytes of the body into the writable buffer ``b``
+        and return the number of bytes read, 0 at the end of the body.
+
+        Unless the body is decoded, the bytes are read from the connection
+        straight into ``b``, also for chunked responses, without creating an
+        intermediate ``bytes`` object per call.
+        """
+        self._init_decoder()
+        if self._fp is None:
+            return 0
+
+        if (self.decode_content and self._decoder is not None) or not hasattr(
+            self._fp, "readinto"
+        ):
+            return super().readinto(b)
+
+        size = len(b)
+        fp_closed = getattr(self._fp, "closed", False)
+
+        with self._error_catcher():
+            n = self._fp.readinto(b) if not fp_closed and size else 0
+            if size and not n:
+                # Same as read(), see there.
+                self._fp.close()
+                if self.enforce_content_length and self.length_remaining not in (
+                    0,
+                    None,
+                ):
+                    raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+        if self._tracer is not None and ((size and not n) or is_fp_closed(self._fp)):
+            self._trace_end()
+
+        if n:
+            self._update_length(n)
+        return n
+
+    def _update_length(self, amount):
+        self._fp_bytes_read += amount
+        self._count_bytes_received(amount)
+        if self.length_remaining is not None:
+            self.length_remaining -= amount
+
     def stream(self, amt=2 ** 16, decode_content=None):
         """
         A generator wrapper for the read() method. A call will block until
@@ -662,9 +1325,9 @@ class HTTPResponse(BaseHTTPResponse):
 
         :param amt:
             How much of the content to read. The generator will return up to
-            much data per iteration, but may return less. This is particularly
-            likely when using compressed data. However, the empty string will
-            never be returned.
+            much data per iteration, but may return less. Decoded content is
+            returned in exactly ``amt`` bytes until the end of the body.
+            However, the empty string will never be returned.
 
         :param decode_content:
             If True, will attempt to decode the body based on the
@@ -673,12 +1336,128 @@ class HTTPResponse(BaseHTTPResponse):
         if self.chunked and self.supports_chunked_reads():
             yield from self.read_chunked(amt, decode_content=decode_content)
         else:
-            while not is_fp_closed(self._fp):
+            # The connection may be closed while decoded data or undecoded
+            # input of earlier read(amt) calls is left.
+            while (
+                not is_fp_closed(self._fp)
+                or self._decoded_buffer
+                or self._has_decoder_tail(decode_content)
+            ):
                 data = self.read(amt=amt, decode_content=decode_content)
 
                 if data:
                     yield data
 
+    def save_to(self, target):
+        """
+        Write the rest of the body to ``target`` and return the number of bytes
+        written. Decodes the body like :meth:`read`.
+
+        :param target:
+            A path of the file to create, or a writable binary file object.
+
+        On Linux, a body with a Content-Length that isn't decoded and is
+        received over plain HTTP is moved from the socket to a regular file by
+        the kernel with :func:`os.splice`. Otherwise the body is read with
+        :meth:`readinto` into a reused buffer of :attr:`save_buffer_size`
+        bytes.
+        """
+        if isinstance(target, (str, bytes, os.PathLike)):
+            with open(target, "wb") as f:
+                return self.save_to(f)
+
+        self._init_decoder()
+        if self._fp is None:
+            return 0
+
+        written = 0
+        sock = self._splice_socket(target)
+        if sock is not None:
+            written = self._splice_to(sock, target)
+            if is_fp_closed(self._fp):
+                return written
+
+        buffer = memoryview(bytearray(self.save_buffer_size))
+        while True:
+            n = self.readinto(buffer)
+            if not n:
+                return written
+            target.write(buffer[:n])
+            written += n
+
+    #: Size of the buffer :meth:`save_to` reads into when it can't splice.
+    save_buffer_size = 1024 * 1024
+
+    def _splice_socket(self, target):
+        """
+        Return the socket to splice the body from to ``target``, or ``None``
+        if :meth:`save_to` can't splice.
+        """
+        if not hasattr(os, "splice") or not self.length_remaining:
+            return None
+        if self.chunked or (self.decode_content and self._decoder is not None):
+            return None
+        # Data read by TLS sockets can't be moved by the kernel.
+        sock = getattr(self._connection, "sock", None)
+        if type(sock) is not socket.socket or not hasattr(self._fp, "fp"):
+            return None
+        try:
+            fd = target.fileno()
+        except (AttributeError, OSError):
+            return None
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        return sock
+
+    def _splice_to(self, sock, target):
+        """
+        Move the body from ``sock`` to the regular file ``target`` through a
+        pipe, with :func:`os.splice`. Returns the number of bytes written.
+        """
+        written = 0
+        with self._error_catcher():
+            # Body data which http.client already buffered.
+            data = self._fp.read1(min(self.length_remaining, self.save_buffer_size))
+            if data:
+                target.write(data)
+                written += len(data)
+                self._update_length(len(data))
+            target.flush()
+
+            fd = target.fileno()
+            read_fd, write_fd = os.pipe()
+            try:
+                while self.length_remaining and not is_fp_closed(self._fp):
+                    try:
+                        # Never more than the capacity of the pipe.
+                        n = os.splice(
+                            sock.fileno(), write_fd, min(self.length_remaining, 65536)
+                        )
+                    except BlockingIOError:
+                        # Sockets with a timeout are non-blocking.
+                        if not wait_for_read(sock, timeout=sock.gettimeout()):
+                            raise SocketTimeout("Read timed out.")
+                        continue
+                    if not n:
+                        break
+                    left = n
+                    while left:
+                        left -= os.splice(read_fd, fd, left)
+                    written += n
+                    self._update_length(n)
+                    # http.client counts the body bytes left, too.
+                    self._fp.length -= n
+            finally:
+                os.close(read_fd)
+                os.close(write_fd)
+            # Writes to the file descriptor bypassed the position of target.
+            target.seek(os.lseek(fd, 0, os.SEEK_CUR))
+
+        # Close the response, or raise IncompleteRead if the body is cut short
+        # and enforce_content_length is set.
+        self._raw_read(1)
+        return written
+
     @classmethod
     def from_httplib(
         ResponseCls: Type["HTTPResponse"], r: _HttplibHTTPResponse, **response_kw: Any
@@ -758,41 +1537,15 @@ class HTTPResponse(BaseHTTPResponse):
         """
         return hasattr(self._fp, "fp")
 
-    def _update_chunk_length(self):
-        # First, we'll figure out length of a chunk and then
-        # we'll try to read it from socket.
-        if self.chunk_left is not None:
-            return
-        line = self._fp.fp.readline()
-        line = line.split(b";", 1)[0]
-        try:
-            self.chunk_left = int(line, 16)
-        except ValueError:
-            # Invalid chunked protocol response, abort.
-            self.close()
-            raise InvalidChunkLength(self, line)
-
-    def _handle_chunk(self, amt):
-        returned_chunk = None
-        if amt is None:
-            chunk = self._fp._safe_read(self.chunk_left)
-            returned_chunk = chunk
-            self._fp._safe_read(2)  # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-        elif amt < self.chunk_left:
-            value = self._fp._safe_read(amt)
-            self.chunk_left = self.chunk_left - amt
-            returned_chunk = value
-        elif amt == self.chunk_left:
-            value = self._fp._safe_read(amt)
-            self._fp._safe_read(2)  # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-            returned_chunk = value
-        else:  # amt > self.chunk_left
-            returned_chunk = self._fp._safe_read(self.chunk_left)
-            self._fp._safe_read(2)  # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-        return returned_chunk
+    @property
+    def chunk_left(self):
+        """
+        Bytes left to read of the current chunk when reading a chunked
+        response with :meth:`read_chunked`, otherwise ``None``.
+        """
+        if self._chunked_reader is None:
+            return None
+        return self._chunked_reader.chunk_left
 
     def read_chunked(self, amt=None, decode_content=None):
         """
@@ -802,14 +1555,14 @@ class HTTPResponse(BaseHTTPResponse):
         :param amt:
             How much of the content to read. If specified, caching is skipped
             because it doesn't make sense to cache partial content as the full
-            response.
+            response. Small chunks which were received together are yielded
+            together, up to ``amt`` bytes.
 
         :param decode_content:
             If True, will attempt to decode the body based on the
             'content-encoding' header.
         """
         self._init_decoder()
-        # FIXME: Rewrite this method and make it a class with a better structured logic.
         if not self.chunked:
             raise ResponseNotChunked(
                 "Response is not chunked. "
@@ -832,33 +1585,54 @@ class HTTPResponse(BaseHTTPResponse):
             if self._fp.fp is None:
                 return
 
+            if self._chunked_reader is None:
+                self._chunked_reader = _ChunkedReader(self._fp.fp)
+            reader = self._chunked_reader
+
+            # Decoded content is yielded in exactly amt bytes.
+            buffer = self._decoded_buffer
+            exact = bool(amt) and decode_content and self._decoder is not None
+
             while True:
-                self._update_chunk_length()
-                if self.chunk_left == 0:
-                    break
-                chunk = self._handle_chunk(amt)
-                decoded = self._decode(
-                    chunk, decode_content=decode_content, flush_decoder=False
+                if exact and self._decoder.has_unconsumed_tail:
+                    chunk = b""
+                else:
+                    try:
+                        chunk = reader.read(amt)
+                    except _InvalidChunkSize as e:
+                        # Invalid chunked protocol response, abort.
+                        self.close()
+                        raise InvalidChunkLength(self, e.line) from None
+                    if not chunk:
+                        break
+                    self._count_bytes_received(len(chunk))
+                if not exact:
+                    decoded = self._decode(
+                        chunk, decode_content=decode_content, flush_decoder=False
+                    )
+                    if decoded:
+                        yield decoded
+                    continue
+
+                buffer.put(
+                    self._decode(chunk, True, False, max_length=amt - len(buffer))
                 )
-                if decoded:
-                    yield decoded
+                while len(buffer) >= amt:
+                    yield buffer.get(amt)
 
             if decode_content:
                 # On CPython and PyPy, we should never need to flush the
                 # decoder. However, on Jython we *might* need to, so
                 # lets defensively do it anyway.
                 decoded = self._flush_decoder()
-                if decoded:  # Platform-specific: Jython.
+                if exact:
+                    buffer.put(decoded)
+                    while buffer:
+                        yield buffer.get(amt)
+                elif decoded:  # Platform-specific: Jython.
                     yield decoded
 
-            # Chunk content ends with \r\n: discard it.
-            while True:
-                line = self._fp.fp.readline()
-                if not line:
-                    # Some sites may not end with '\r\n'.
-                    break
-                if line == b"\r\n":
-                    break
+            self._trace_end()
 
             # We read everything; close the "file".
             if self._original_response:
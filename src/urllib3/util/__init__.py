@@ -1,20 +1,27 @@
 # For backwards compatibility, provide imports that used to be here.
+from .circuit_breaker import CircuitBreaker
 from .connection import is_connection_dropped
+from .connection_limit import ConnectionLimit
 from .request import SKIP_HEADER, SKIPPABLE_HEADERS, make_headers
+from .resolver import CachingResolver, Resolver
 from .response import is_fp_closed
-from .retry import Retry
+from .retry import Retry, RetryBudget
 from .ssl_ import (
     ALPN_PROTOCOLS,
     HAS_SNI,
     IS_PYOPENSSL,
     IS_SECURETRANSPORT,
     SSLContext,
+    SSLContextCache,
+    SSLSessionCache,
     assert_fingerprint,
     resolve_cert_reqs,
     resolve_ssl_version,
     ssl_wrap_socket,
 )
+from .stats import PoolStats
 from .timeout import Timeout
+from .trace import TimingTracer, Tracer
 from .url import Url, parse_url
 from .wait import wait_for_read, wait_for_write
 
@@ -23,9 +30,19 @@ __all__ = (
     "IS_PYOPENSSL",
     "IS_SECURETRANSPORT",
     "SSLContext",
+    "SSLContextCache",
+    "SSLSessionCache",
     "ALPN_PROTOCOLS",
+    "CachingResolver",
+    "CircuitBreaker",
+    "ConnectionLimit",
+    "PoolStats",
+    "Resolver",
     "Retry",
+    "RetryBudget",
     "Timeout",
+    "TimingTracer",
+    "Tracer",
     "Url",
     "assert_fingerprint",
     "is_connection_dropped",
@@ -0,0 +1,197 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+from ..exceptions import ConnectTimeoutError, MaxRetryError, ProxyError, ResponseError
+
+__all__ = ["CircuitBreaker"]
+
+_TYPE_STATE_HOOK = Callable[[Hashable, str, str], None]
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker which makes a :class:`~urllib3.PoolManager`
+    fail fast for hosts which keep failing, instead of tying up the calling
+    thread with connect attempts, timeouts and retry backoff every time.
+
+    Every ``(scheme, host, port)`` has its own circuit, which starts out
+    closed. After ``failure_threshold`` consecutive failures the circuit
+    opens and requests to the host raise
+    :class:`~urllib3.exceptions.CircuitOpenError` right away. Once
+    ``recovery_timeout`` seconds have passed the circuit is half-open and
+    lets up to ``half_open_probes`` requests through at a time: a successful
+    probe closes the circuit, a failed one opens it again.
+
+    A request fails if it couldn't connect to the host, after all its
+    retries, if it ran out of retries for error responses, or if the response
+    has a 5xx status. Other errors, such as read
+    timeouts, neither count as a failure nor as a success.
+
+    Usage::
+
+        def log_state(key, old, new):
+            log.warning("Circuit for %s went from %s to %s", key, old, new)
+
+        breaker = CircuitBreaker(failure_threshold=3, on_state_change=log_state)
+        http = urllib3.PoolManager(circuit_breaker=breaker)
+
+    :param failure_threshold:
+        Number of consecutive failures which open the circuit of a host.
+
+    :param recovery_timeout:
+        Number of seconds a circuit stays open before letting probe requests
+        through.
+
+    :param half_open_probes:
+        Maximum number of concurrent requests while a circuit is half-open.
+
+    :param on_state_change:
+        Called with the key of the circuit, the old and the new state, one of
+        :attr:`CLOSED`, :attr:`OPEN` and :attr:`HALF_OPEN`, whenever a
+        circuit changes state. It is called without holding the lock of the
+        breaker, from the thread making the request.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        on_state_change: Optional[_TYPE_STATE_HOOK] = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+        if half_open_probes < 1:
+            raise ValueError("half_open_probes must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.on_state_change = on_state_change
+
+        # Only circuits which aren't closed or have failures are kept.
+        self._circuits: Dict[Hashable, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout}, "
+            f"half_open_probes={self.half_open_probes})"
+        )
+
+    def state(self, key: Hashable) -> str:
+        """
+        Return the state of the circuit of ``key``, without changing it.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else self.CLOSED
+
+    def allow_request(self, key: Hashable) -> bool:
+        """
+        Return whether a request may be sent to ``key``. If it returns
+        ``True`` the outcome must be reported with :meth:`record_success`,
+        :meth:`record_failure` or :meth:`release`.
+        """
+        old = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == self.CLOSED:
+                return True
+            if circuit.state == self.OPEN:
+                if time.monotonic() - circuit.opened_at < self.recovery_timeout:
+                    return False
+                old = circuit.state
+                circuit.state = self.HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_probes:
+                return False
+            circuit.probes += 1
+        if old is not None:
+            self._notify(key, old, self.HALF_OPEN)
+        return True
+
+    def record_success(self, key: Hashable) -> None:
+        """
+        Report a successful request to ``key``, which closes its circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.pop(key, None)
+        if circuit is not None and circuit.state != self.CLOSED:
+            self._notify(key, circuit.state, self.CLOSED)
+
+    def record_failure(self, key: Hashable) -> None:
+        """
+        Report a failed request to ``key``, which opens its circuit if it
+        was half-open or after ``failure_threshold`` consecutive failures.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            old = circuit.state
+            circuit.failures += 1
+            if old == self.HALF_OPEN:
+                circuit.probes -= 1
+            elif old != self.CLOSED or circuit.failures < self.failure_threshold:
+                return
+            circuit.state = self.OPEN
+            circuit.opened_at = time.monotonic()
+        self._notify(key, old, self.OPEN)
+
+    def release(self, key: Hashable) -> None:
+        """
+        Report a request to ``key`` which neither failed nor succeeded,
+        freeing its probe slot if the circuit is half-open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == self.HALF_OPEN:
+                circuit.probes -= 1
+
+    def reset(self) -> None:
+        """
+        Close all circuits, without calling ``on_state_change``.
+        """
+        with self._lock:
+            self._circuits.clear()
+
+    def is_failure(self, error: Exception) -> bool:
+        """
+        Return whether ``error``, raised by a request, means the host could
+        not be reached or kept returning error responses which were retried,
+        such as the statuses of ``status_forcelist``. Override it to count
+        other errors as failures.
+        """
+        if isinstance(error, MaxRetryError) and error.reason is not None:
+            error = error.reason
+            # Running out of redirects isn't a failure of the host.
+            if isinstance(error, ResponseError):
+                return str(error) != "too many redirects"
+        if isinstance(error, ProxyError):
+            error = error.original_error
+        # NewConnectionError, raised for refused connections, is a
+        # ConnectTimeoutError too.
+        return isinstance(error, ConnectTimeoutError)
+
+    def _notify(self, key: Hashable, old: str, new: str) -> None:
+        if self.on_state_change is not None:
+            self.on_state_change(key, old, new)
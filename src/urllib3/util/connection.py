@@ -1,12 +1,33 @@
+import errno
+import itertools
+import os
+import selectors
 import socket
-from typing import Optional, Sequence, Tuple, Union
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from urllib3.exceptions import LocationParseError
 
 from .wait import wait_for_read
 
+try:  # Compiled with SSL?
+    import ssl
+except ImportError:  # Platform-specific: No SSL.
+    ssl = None  # type: ignore
+
+if TYPE_CHECKING:
+    from .resolver import Resolver
+
 SOCKET_GLOBAL_DEFAULT_TIMEOUT = socket._GLOBAL_DEFAULT_TIMEOUT  # type: ignore
 SocketOptions = Sequence[Tuple[int, int, Union[int, bytes]]]
+_AddrInfo = Tuple[Any, ...]
+
+# connect_ex() return values meaning a non-blocking connect is in progress.
+_CONNECT_IN_PROGRESS = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+}
 
 
 def is_connection_dropped(conn: socket.socket) -> bool:  # Platform-specific
@@ -20,7 +41,30 @@ def is_connection_dropped(conn: socket.socket) -> bool:  # Platform-specific
     if sock is None:  # Connection already closed (such as by httplib).
         return True
     # Returns True if readable, which here means it's been dropped
-    return wait_for_read(sock, timeout=0.0)
+    if not wait_for_read(sock, timeout=0.0):
+        return False
+    if ssl is not None and isinstance(sock, ssl.SSLSocket):
+        return _is_tls_connection_dropped(sock)
+    return True
+
+
+def _is_tls_connection_dropped(sock: "ssl.SSLSocket") -> bool:
+    # TLS 1.3 servers send session tickets after the handshake, which makes
+    # the socket of a connection that was never used readable. Reading
+    # processes those records and only fails if there is no application data.
+    timeout = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        sock.recv(1)
+    except ssl.SSLWantReadError:
+        return False
+    except OSError:
+        pass
+    finally:
+        sock.settimeout(timeout)
+    # Either the connection was closed or the server sent data nobody asked
+    # for, neither leaves the connection usable.
+    return True
 
 
 # This function is copied from socket.py in the Python 2.7 standard
@@ -32,6 +76,8 @@ def create_connection(
     timeout: Optional[float] = SOCKET_GLOBAL_DEFAULT_TIMEOUT,
     source_address: Optional[Tuple[str, int]] = None,
     socket_options: Optional[SocketOptions] = None,
+    happy_eyeballs_delay: Optional[float] = None,
+    resolver: Optional["Resolver"] = None,
 ) -> socket.socket:
     """Connect to *address* and return the socket object.
 
@@ -43,6 +89,17 @@ def create_connection(
     is used.  If *source_address* is set it must be a tuple of (host, port)
     for the socket to bind as a source address before making the connection.
     An host of '' or port 0 tells the OS to use the default.
+
+    If *happy_eyeballs_delay* is set, the addresses are tried as described in
+    :rfc:`8305` ("Happy Eyeballs"): address families are interleaved and a new
+    non-blocking connection attempt is started every *happy_eyeballs_delay*
+    seconds, or as soon as the previous attempt fails, while the earlier
+    attempts keep running. The first connection to succeed is returned and the
+    others are closed. *timeout* then limits the time for all attempts
+    together. RFC 8305 recommends a delay of 0.25 seconds.
+
+    *resolver* is the :class:`urllib3.util.resolver.Resolver` used to look up
+    the addresses of *host*, by default :func:`socket.getaddrinfo` is called.
     """
 
     host, port = address
@@ -60,7 +117,20 @@ def create_connection(
     except UnicodeError:
         raise LocationParseError(f"'{host}', label empty or too long") from None
 
-    for res in socket.getaddrinfo(host, port, family, socket.SOCK_STREAM):
+    if resolver is None:
+        addrinfos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+    else:
+        addrinfos = resolver.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+    if happy_eyeballs_delay is not None and addrinfos:
+        return _happy_eyeballs_connect(
+            _interleave_addrinfos(addrinfos),
+            timeout,
+            source_address,
+            socket_options,
+            happy_eyeballs_delay,
+        )
+
+    for res in addrinfos:
         af, socktype, proto, canonname, sa = res
         sock = None
         try:
@@ -88,6 +158,94 @@ def create_connection(
     raise OSError("getaddrinfo returns an empty list")
 
 
+def _interleave_addrinfos(addrinfos: Sequence[_AddrInfo]) -> List[_AddrInfo]:
+    """
+    Reorder *addrinfos* so that address families alternate, starting with the
+    family of the first address, as recommended by :rfc:`8305#section-4`.
+    """
+    by_family: Dict[int, List[_AddrInfo]] = {}
+    for addrinfo in addrinfos:
+        by_family.setdefault(addrinfo[0], []).append(addrinfo)
+    return [
+        addrinfo
+        for addrinfo in itertools.chain.from_iterable(
+            itertools.zip_longest(*by_family.values())
+        )
+        if addrinfo is not None
+    ]
+
+
+def _happy_eyeballs_connect(
+    addrinfos: List[_AddrInfo],
+    timeout: Optional[float],
+    source_address: Optional[Tuple[str, int]],
+    socket_options: Optional[SocketOptions],
+    delay: float,
+) -> socket.socket:
+    if timeout is SOCKET_GLOBAL_DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    pending = list(reversed(addrinfos))
+    attempts: List[socket.socket] = []
+    next_attempt_at = time.monotonic()
+    err: Optional[OSError] = None
+
+    with selectors.DefaultSelector() as selector:
+        try:
+            while pending or attempts:
+                now = time.monotonic()
+                if pending and (not attempts or now >= next_attempt_at):
+                    af, socktype, proto, canonname, sa = pending.pop()
+                    next_attempt_at = now + delay
+                    sock = socket.socket(af, socktype, proto)
+                    try:
+                        _set_socket_options(sock, socket_options)
+                        sock.setblocking(False)
+                        if source_address:
+                            sock.bind(source_address)
+                        result = sock.connect_ex(sa)
+                        if result == 0:
+                            sock.settimeout(timeout)
+                            return sock
+                        if result not in _CONNECT_IN_PROGRESS:
+                            raise OSError(result, os.strerror(result))
+                    except OSError as e:
+                        err = e
+                        sock.close()
+                        # Start the next attempt right away.
+                        next_attempt_at = now
+                        continue
+                    attempts.append(sock)
+                    selector.register(sock, selectors.EVENT_WRITE)
+                    continue
+
+                wait = next_attempt_at - now if pending else None
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise socket.timeout("timed out")
+                    wait = remaining if wait is None else min(wait, remaining)
+
+                for key, _ in selector.select(wait):
+                    sock = key.fileobj  # type: ignore
+                    selector.unregister(sock)
+                    attempts.remove(sock)
+                    result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if result == 0:
+                        sock.settimeout(timeout)
+                        return sock
+                    err = OSError(result, os.strerror(result))
+                    sock.close()
+                    next_attempt_at = time.monotonic()
+        finally:
+            for sock in attempts:
+                sock.close()
+
+    assert err is not None
+    raise err
+
+
 def _set_socket_options(sock: socket.socket, options: Optional[SocketOptions]) -> None:
     if options is None:
         return
@@ -0,0 +1,151 @@
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..connection import HTTPConnection
+    from ..connectionpool import HTTPConnectionPool
+
+__all__ = ["ConnectionLimit"]
+
+
+class ConnectionLimit:
+    """
+    Thread-safe limit on the number of connections open at the same time,
+    shared by several :class:`~urllib3.HTTPConnectionPool`.
+
+    A connection takes one of the ``max_connections`` slots when it connects
+    and gives it back when it is closed. When all slots are taken, the idle
+    connection which has been unused the longest in any of the pools is
+    closed to make room. If all connections are in use, connecting waits
+    until one is closed or returned to its pool, up to the connect timeout,
+    and raises :class:`~urllib3.exceptions.ConnectionLimitError` after that.
+
+    :class:`~urllib3.PoolManager` creates one for its
+    ``max_total_connections``. To limit pools created separately, pass the
+    same instance as ``connection_limit`` to each of them::
+
+        limit = ConnectionLimit(100)
+        pool1 = HTTPConnectionPool("example.com", connection_limit=limit)
+        pool2 = HTTPConnectionPool("example.org", connection_limit=limit)
+
+    :param max_connections:
+        Maximum number of connections open at the same time.
+    """
+
+    def __init__(self, max_connections: int) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+
+        self.max_connections = max_connections
+        self._open = 0
+        # Incremented whenever a connection becomes idle, so that waiters
+        # know to look for one to close again.
+        self._idle_generation = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._pools: "weakref.WeakSet[HTTPConnectionPool]" = weakref.WeakSet()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_connections={self.max_connections}, "
+            f"open={self._open})"
+        )
+
+    @property
+    def open_connections(self) -> int:
+        """Number of slots taken by open connections."""
+        return self._open
+
+    def add_pool(self, pool: "HTTPConnectionPool") -> None:
+        """
+        Let idle connections of ``pool`` be closed to make room for others.
+        Pools add themselves when they are given the limit.
+        """
+        self._pools.add(pool)
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take a slot for a new connection, closing an idle connection if
+        needed. Returns whether a slot was taken, which is always the case if
+        ``blocking`` is true and ``timeout`` is ``None``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                if self._open < self.max_connections:
+                    self._open += 1
+                    return True
+                generation = self._idle_generation
+
+            # Don't hold the lock while closing a connection, which calls
+            # release().
+            if self._close_idle_connection():
+                continue
+            if not blocking:
+                return False
+
+            with self._cond:
+                if (
+                    self._open >= self.max_connections
+                    and generation == self._idle_generation
+                ):
+                    if deadline is None:
+                        self._cond.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._cond.wait(remaining)
+
+    def release(self) -> None:
+        """
+        Give back the slot of a closed connection.
+        """
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    def notify_idle(self) -> None:
+        """
+        Tell a waiter that a connection was returned to its pool, so that it
+        can be closed to make room.
+        """
+        with self._cond:
+            self._idle_generation += 1
+            self._cond.notify()
+
+    def _close_idle_connection(self) -> bool:
+        """
+        Close the open connection which has been idle the longest in any of
+        the pools. Returns whether one was closed.
+        """
+        oldest: Optional[Tuple[float, "HTTPConnectionPool", "HTTPConnection"]] = None
+        for pool in list(self._pools):
+            q = pool.pool
+            if q is None:
+                continue
+            with q.mutex:
+                for conn in q.queue:
+                    if conn is None or conn.sock is None:
+                        continue
+                    idle_since = conn.idle_since or 0.0
+                    if oldest is None or idle_since < oldest[0]:
+                        oldest = (idle_since, pool, conn)
+        if oldest is None:
+            return False
+
+        _, pool, conn = oldest
+        q = pool.pool
+        if q is None:
+            return False
+        with q.mutex:
+            # The connection may have been checked out in the meantime.
+            for i, queued in enumerate(q.queue):
+                if queued is conn:
+                    q.queue[i] = pool._reset_conn(conn)
+                    break
+            else:
+                return False
+        pool.stats.incr("connections_evicted")
+        return True
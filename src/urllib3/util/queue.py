@@ -0,0 +1,89 @@
+import heapq
+import itertools
+import queue
+import threading
+from typing import Any, List, Optional, Tuple
+
+__all__ = ["FairLifoQueue"]
+
+
+class _Waiter:
+    __slots__ = ("event", "item", "served")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.item: Any = None
+        self.served = False
+
+
+class FairLifoQueue(queue.LifoQueue):  # type: ignore[type-arg]
+    """
+    :class:`queue.LifoQueue` whose blocked :meth:`get` calls are served in
+    order, used by :class:`~urllib3.HTTPConnectionPool` to hold its
+    connections.
+
+    Items are still handed out last in, first out, so that the most recently
+    used connections are reused and idle ones can expire. But while threads
+    are waiting, :meth:`put` hands the item directly to the waiter with the
+    highest ``priority`` which has waited the longest, instead of waking all
+    of them to race for it with threads which just arrived.
+
+    :meth:`put` never blocks, it raises :class:`queue.Full` right away if
+    ``maxsize`` items are queued.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._waiters: List[Tuple[int, int, _Waiter]] = []
+        self._arrivals = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Number of threads blocked in :meth:`get`."""
+        return len(self._waiters)
+
+    def get(
+        self, block: bool = True, timeout: Optional[float] = None, priority: int = 0
+    ) -> Any:
+        """
+        Remove and return an item, waiting up to ``timeout`` seconds for one
+        if ``block`` is true. Waiters with a higher ``priority`` are served
+        first, waiters with the same priority in the order they arrived.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        with self.mutex:
+            if self._qsize():
+                return self._get()
+            if not block:
+                raise queue.Empty
+            waiter = _Waiter()
+            entry = (-priority, next(self._arrivals), waiter)
+            heapq.heappush(self._waiters, entry)
+
+        if not waiter.event.wait(timeout):
+            with self.mutex:
+                # put() may have served the waiter after the wait timed out.
+                if not waiter.served:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    raise queue.Empty
+        return waiter.item
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Hand ``item`` to the next waiter, or queue it if there is none.
+        """
+        with self.mutex:
+            if self._waiters:
+                waiter = heapq.heappop(self._waiters)[2]
+                waiter.item = item
+                waiter.served = True
+                waiter.event.set()
+                return
+            if 0 < self.maxsize <= self._qsize():
+                raise queue.Full
+            self._put(item)
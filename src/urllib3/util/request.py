@@ -1,3 +1,6 @@
+import sys
+import types
+import warnings
 from base64 import b64encode
 from typing import IO, Any, AnyStr, Dict, List, Optional, Union
 
@@ -10,20 +13,30 @@ from ..exceptions import UnrewindableBodyError
 SKIP_HEADER = "@@@SKIP_HEADER@@@"
 SKIPPABLE_HEADERS = frozenset(["accept-encoding", "host", "user-agent"])
 
-ACCEPT_ENCODING = "gzip,deflate"
-try:
-    try:
-        import brotlicffi as _unused_module_brotli  # type: ignore # noqa: F401
-    except ImportError:
-        import brotli as _unused_module_brotli  # type: ignore # noqa: F401
-except ImportError:
-    pass
-else:
-    ACCEPT_ENCODING += ",br"
-
 _FAILEDTELL = object()
 
 
+class _RequestModule(types.ModuleType):
+    # A module subclass rather than a module __getattr__(), which needs
+    # Python 3.7.
+    @property
+    def ACCEPT_ENCODING(self) -> str:
+        # Imported here because urllib3.response imports this module.
+        from ..response import registered_content_encodings
+
+        warnings.warn(
+            "'ACCEPT_ENCODING' is deprecated and will be removed in urllib3 "
+            "v3.0.0. Use urllib3.response.registered_content_encodings() "
+            "instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return ",".join(registered_content_encodings())
+
+
+sys.modules[__name__].__class__ = _RequestModule
+
+
 def make_headers(
     keep_alive: Optional[bool] = None,
     accept_encoding: Optional[Union[bool, List[str], str]] = None,
@@ -40,8 +53,10 @@ def make_headers(
 
     :param accept_encoding:
         Can be a boolean, list, or string.
-        ``True`` translates to 'gzip,deflate'.  If either the ``brotli`` or
-        ``brotlicffi`` package is installed 'gzip,deflate,br' is used instead.
+        ``True`` translates to the content-codings registered with
+        :func:`urllib3.response.register_content_decoder`: 'gzip,deflate',
+        followed by 'br' if either the ``brotli`` or ``brotlicffi`` package is
+        installed and 'zstd' if the ``zstandard`` package is installed.
         List will get joined by comma.
         String will be used as provided.
 
@@ -78,7 +93,10 @@ def make_headers(
         elif isinstance(accept_encoding, list):
             accept_encoding = ",".join(accept_encoding)
         else:
-            accept_encoding = ACCEPT_ENCODING
+            # Imported here because urllib3.response imports this module.
+            from ..response import registered_content_encodings
+
+            accept_encoding = ",".join(registered_content_encodings())
         headers["accept-encoding"] = accept_encoding
 
     if user_agent:
@@ -0,0 +1,186 @@
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .._collections import RecentlyUsedContainer
+from .connection import allowed_gai_family
+
+AddrInfo = Tuple[Any, ...]
+_CacheKey = Tuple[str, Union[None, int, str], int, int, int, int]
+# Failed lookups are cached as the arguments of their socket.gaierror, so that
+# a new exception is raised each time instead of one which keeps the
+# tracebacks of all its callers.
+_CacheEntry = Tuple[float, Optional[List[AddrInfo]], Tuple[Any, ...]]
+
+__all__ = ["Resolver", "CachingResolver"]
+
+
+class Resolver:
+    """
+    Resolves host names for new connections using :func:`socket.getaddrinfo`.
+
+    Pass an instance as ``resolver`` to :class:`~urllib3.PoolManager`,
+    :class:`~urllib3.HTTPConnectionPool` or
+    :func:`urllib3.util.connection.create_connection`. Subclass it and
+    override :meth:`getaddrinfo` to use a different resolver.
+    """
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: Union[None, int, str],
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> List[AddrInfo]:
+        """
+        Same as :func:`socket.getaddrinfo`, which is called by default.
+        """
+        return socket.getaddrinfo(host, port, family, type, proto, flags)
+
+
+class _PendingLookup:
+    __slots__ = ("done", "result", "error_args")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[List[AddrInfo]] = None
+        self.error_args: Optional[Tuple[Any, ...]] = None
+
+
+class CachingResolver(Resolver):
+    """
+    Thread-safe :class:`Resolver` which caches the results of another
+    resolver, so that connections to the same host don't block on a DNS lookup
+    every time. Threads which miss the cache for the same lookup at the same
+    time wait for a single lookup.
+
+    Usage::
+
+        resolver = CachingResolver(ttl=60)
+        resolver.preresolve([("example.com", 443)])
+
+        http = urllib3.PoolManager(resolver=resolver)
+
+    :param resolver:
+        The :class:`Resolver` used on cache misses, by default one calling
+        :func:`socket.getaddrinfo`.
+
+    :param ttl:
+        Number of seconds a successful lookup is cached for. The system
+        resolver doesn't report record TTLs, so the same value is used for
+        every host.
+
+    :param negative_ttl:
+        Number of seconds a failed lookup is cached for. Until it expires a
+        :class:`socket.gaierror` with the same arguments is raised again
+        without asking the resolver. Set to 0 to disable negative caching.
+
+    :param maxsize:
+        Maximum number of lookups to cache. The least recently used lookup is
+        discarded beyond this.
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[Resolver] = None,
+        ttl: float = 60,
+        negative_ttl: float = 5,
+        maxsize: int = 1000,
+    ) -> None:
+        self.resolver = resolver or Resolver()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._cache: RecentlyUsedContainer[
+            _CacheKey, _CacheEntry
+        ] = RecentlyUsedContainer(maxsize)
+        # Lookups in progress, guarded by _lock.
+        self._pending: Dict[_CacheKey, _PendingLookup] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: Union[None, int, str],
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> List[AddrInfo]:
+        key = (host, port, family, type, proto, flags)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return _lookup_result(entry[1], entry[2])
+            pending = self._pending.get(key)
+            waiting = pending is not None
+            if pending is None:
+                pending = self._pending[key] = _PendingLookup()
+
+        if waiting:
+            pending.done.wait()
+            if pending.result is not None or pending.error_args is not None:
+                return _lookup_result(pending.result, pending.error_args or ())
+            # The lookup failed with another error, try again.
+            return self.resolver.getaddrinfo(host, port, family, type, proto, flags)
+
+        try:
+            result = self.resolver.getaddrinfo(host, port, family, type, proto, flags)
+        except socket.gaierror as e:
+            pending.error_args = e.args
+            if self.negative_ttl > 0:
+                expires = time.monotonic() + self.negative_ttl
+                self._cache[key] = (expires, None, e.args)
+            raise
+        else:
+            pending.result = result
+            self._cache[key] = (time.monotonic() + self.ttl, result, ())
+            return list(result)
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+
+    def preresolve(
+        self,
+        addresses: Sequence[Tuple[str, Union[None, int, str]]],
+        family: Optional[int] = None,
+        type: int = socket.SOCK_STREAM,
+    ) -> int:
+        """
+        Resolve ``(host, port)`` pairs ahead of time so that the first
+        connections to them don't wait for DNS.
+
+        ``family`` and ``type`` must match the lookups made when connecting,
+        the defaults match those of
+        :func:`urllib3.util.connection.create_connection`.
+
+        :returns: The number of addresses that could be resolved.
+        """
+        if family is None:
+            family = allowed_gai_family()
+        resolved = 0
+        for host, port in addresses:
+            try:
+                self.getaddrinfo(host, port, family, type)
+            except socket.gaierror:
+                continue
+            resolved += 1
+        return resolved
+
+    def clear(self) -> None:
+        """Discard all cached lookups."""
+        self._cache.clear()
+
+
+def _lookup_result(
+    result: Optional[List[AddrInfo]], error_args: Tuple[Any, ...]
+) -> List[AddrInfo]:
+    if result is None:
+        raise socket.gaierror(*error_args)
+    return list(result)
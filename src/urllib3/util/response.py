@@ -1,8 +1,20 @@
 import http.client as httplib
+import io
+import re
 from email.errors import MultipartInvariantViolationDefect, StartBoundaryNotFoundDefect
+from typing import IO, List, Optional, Union
 
+from .._collections import HTTPHeaderDict
 from ..exceptions import HeaderParsingError
 
+# Same limits as http.client.
+_MAXLINE = 65536
+_MAXHEADERS = 100
+
+# Field names the email parser of http.client accepts: printable ASCII without
+# the colon.
+_FIELD_NAME_RE = re.compile(r"[\x21-\x39\x3b-\x7e]+\Z")
+
 
 def is_fp_closed(obj: object) -> bool:
     """
@@ -35,19 +47,80 @@ def is_fp_closed(obj: object) -> bool:
     raise ValueError("Unable to determine whether fp is closed.")
 
 
-def assert_header_parsing(headers: httplib.HTTPMessage) -> None:
+def parse_headers(fp: IO[bytes]) -> Union[HTTPHeaderDict, httplib.HTTPMessage]:
+    """
+    Reads the header block of a response from ``fp``.
+
+    Unlike :func:`http.client.parse_headers` this doesn't go through the
+    :mod:`email` parser and builds the :class:`~urllib3._collections.HTTPHeaderDict`
+    the response ends up with directly. Blocks with malformed lines are still
+    handed to :func:`http.client.parse_headers`, so that
+    :func:`assert_header_parsing` can report what is wrong with them.
+
+    :param fp: File of the response, positioned after the status line.
+    """
+    lines = []
+    while True:
+        line = fp.readline(_MAXLINE + 1)
+        if len(line) > _MAXLINE:
+            raise httplib.LineTooLong("header line")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        lines.append(line)
+        if len(lines) > _MAXHEADERS:
+            raise httplib.HTTPException(f"got more than {_MAXHEADERS} headers")
+
+    headers = _parse_header_lines(lines)
+    if headers is None:
+        return httplib.parse_headers(io.BytesIO(b"".join(lines) + b"\r\n"))
+    return headers
+
+
+def _parse_header_lines(lines: List[bytes]) -> Optional[HTTPHeaderDict]:
+    """
+    Returns the fields of the header ``lines``, with the values the email
+    parser would give them, or None if a line is malformed.
+    """
+    headers = HTTPHeaderDict()
+    name = value = None
+    for raw_line in lines:
+        line = raw_line.decode("iso-8859-1")
+        if line[0] in " \t":
+            # Obsolete line folding, kept in the value like the email parser does.
+            if value is None:
+                return None
+            value += line
+            continue
+        if name is not None:
+            headers.add(name, value.rstrip("\r\n"))  # type: ignore[union-attr]
+        name, sep, value = line.partition(":")
+        if not sep or not _FIELD_NAME_RE.match(name):
+            return None
+        value = value.lstrip(" \t")
+    if name is not None:
+        headers.add(name, value.rstrip("\r\n"))  # type: ignore[union-attr]
+    return headers
+
+
+def assert_header_parsing(headers: Union[httplib.HTTPMessage, HTTPHeaderDict]) -> None:
     """
     Asserts whether all headers have been successfully parsed.
     Extracts encountered errors from the result of parsing headers.
 
     Only works on Python 3.
 
-    :param http.client.HTTPMessage headers: Headers to verify.
+    :param headers:
+        Headers to verify, as returned by :func:`parse_headers` or
+        :func:`http.client.parse_headers`.
 
     :raises urllib3.exceptions.HeaderParsingError:
         If parsing errors are found.
     """
 
+    # parse_headers() only returns an HTTPHeaderDict for well-formed headers.
+    if isinstance(headers, HTTPHeaderDict):
+        return
+
     # This will fail silently if we pass in the wrong kind of parameter.
     # To make debugging easier add an explicit check.
     if not isinstance(headers, httplib.HTTPMessage):
@@ -1,6 +1,8 @@
 import email
 import logging
+import random
 import re
+import threading
 import time
 from collections import namedtuple
 from itertools import takewhile
@@ -15,6 +17,7 @@ from ..exceptions import (
     ProxyError,
     ReadTimeoutError,
     ResponseError,
+    RetryBudgetExhaustedError,
 )
 from .util import reraise
 
@@ -31,6 +34,88 @@ RequestHistory = namedtuple(
 )
 
 
+class RetryBudget:
+    """
+    Token bucket which limits retries to a fraction of the requests that
+    succeeded, so that retries don't multiply the load on a server which is
+    already struggling.
+
+    A budget is shared by all requests whose :class:`Retry` has it as
+    ``budget``, for example all requests of a pool manager:
+
+    .. code-block:: python
+
+        budget = RetryBudget(ratio=0.1)
+        http = PoolManager(retries=Retry(3, budget=budget))
+
+    Each request which didn't need a retry and whose response isn't an error
+    (status below 400) deposits ``ratio`` tokens, and each retry withdraws
+    one. Retries are refused with
+    :class:`~urllib3.exceptions.RetryBudgetExhaustedError` while there's less
+    than one token. Redirects don't count as retries.
+
+    :param float ratio:
+        Tokens deposited per successful request, roughly the allowed ratio of
+        retries to successful requests.
+
+    :param float min_per_second:
+        Tokens added every second regardless of traffic, so that a few retries
+        are possible while there are few requests.
+
+    :param float max_tokens:
+        Most tokens the bucket holds, which it starts with. This is the
+        largest burst of retries it allows.
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, min_per_second: float = 1.0, max_tokens: float = 10.0
+    ) -> None:
+        if ratio < 0 or min_per_second < 0 or max_tokens < 1:
+            raise ValueError(
+                "ratio and min_per_second must not be negative, "
+                "and max_tokens must be at least 1"
+            )
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(ratio={self.ratio}, "
+            f"min_per_second={self.min_per_second}, max_tokens={self.max_tokens})"
+        )
+
+    def _add(self, tokens: float) -> None:
+        now = time.monotonic()
+        tokens += (now - self._updated) * self.min_per_second
+        self._updated = now
+        self._tokens = min(self._tokens + tokens, self.max_tokens)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket."""
+        with self._lock:
+            self._add(0)
+            return self._tokens
+
+    def deposit(self) -> None:
+        """Record a request which succeeded without a retry."""
+        with self._lock:
+            self._add(self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry, returns whether there was one."""
+        with self._lock:
+            self._add(0)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
 class Retry:
     """Retry configuration.
 
@@ -146,6 +231,22 @@ class Retry:
 
         By default, backoff is disabled (set to 0).
 
+    :param str backoff_jitter:
+        Randomizes the backoff so that clients which failed at the same time
+        don't retry in lockstep, see :attr:`Retry.BACKOFF_JITTERS`.
+
+        ``"full"`` sleeps for a random time between 0 and the backoff above.
+        ``"decorrelated"`` sleeps for a random time between ``backoff_factor``
+        and three times the previous sleep, capped at :attr:`Retry.BACKOFF_MAX`.
+
+        By default, the backoff isn't randomized (set to ``None``).
+
+    :param RetryBudget budget:
+        A :class:`RetryBudget` which must allow each retry, other than
+        redirects. Share it between requests, for example by setting it on
+        the ``retries`` of a pool or pool manager, to limit the retries of
+        all of them.
+
     :param bool raise_on_redirect: Whether, if the number of redirects is
         exhausted, to raise a MaxRetryError, or to return a response with a
         response code in the 3xx range.
@@ -183,6 +284,9 @@ class Retry:
     #: Maximum backoff time.
     BACKOFF_MAX = 120
 
+    #: Supported values of ``backoff_jitter``.
+    BACKOFF_JITTERS = frozenset(["full", "decorrelated"])
+
     def __init__(
         self,
         total: Optional[Union[bool, int]] = 10,
@@ -201,6 +305,8 @@ class Retry:
         remove_headers_on_redirect: Collection[
             str
         ] = DEFAULT_REMOVE_HEADERS_ON_REDIRECT,
+        backoff_jitter: Optional[str] = None,
+        budget: Optional[RetryBudget] = None,
     ) -> None:
         self.total = total
         self.connect = connect
@@ -223,6 +329,15 @@ class Retry:
         self.remove_headers_on_redirect = frozenset(
             [h.lower() for h in remove_headers_on_redirect]
         )
+        if backoff_jitter is not None and backoff_jitter not in self.BACKOFF_JITTERS:
+            raise ValueError(
+                f"backoff_jitter must be one of {sorted(self.BACKOFF_JITTERS)} or None, "
+                f"not {backoff_jitter!r}"
+            )
+        self.backoff_jitter = backoff_jitter
+        self.budget = budget
+        # Previous decorrelated backoff, carried over by new().
+        self._last_backoff = 0.0
 
     def new(self, **kw: Any) -> "Retry":
         params = dict(
@@ -240,10 +355,14 @@ class Retry:
             history=self.history,
             remove_headers_on_redirect=self.remove_headers_on_redirect,
             respect_retry_after_header=self.respect_retry_after_header,
+            backoff_jitter=self.backoff_jitter,
+            budget=self.budget,
         )
 
         params.update(kw)
-        return type(self)(**params)  # type: ignore
+        new_retry = type(self)(**params)  # type: ignore
+        new_retry._last_backoff = self._last_backoff
+        return new_retry
 
     @classmethod
     def from_int(
@@ -267,6 +386,8 @@ class Retry:
     def get_backoff_time(self) -> float:
         """Formula for computing the current backoff
 
+        With ``backoff_jitter`` each call returns a new random backoff.
+
         :rtype: float
         """
         # We want to consider only the last consecutive errors sequence (Ignore redirects).
@@ -278,8 +399,17 @@ class Retry:
         if consecutive_errors_len <= 1:
             return 0
 
+        if self.backoff_jitter == "decorrelated":
+            previous = max(self._last_backoff, self.backoff_factor)
+            backoff_value = random.uniform(self.backoff_factor, previous * 3)
+            self._last_backoff = min(self.BACKOFF_MAX, backoff_value)
+            return float(self._last_backoff)
+
         backoff_value = self.backoff_factor * (2 ** (consecutive_errors_len - 1))
-        return float(min(self.BACKOFF_MAX, backoff_value))
+        backoff_value = min(self.BACKOFF_MAX, backoff_value)
+        if self.backoff_jitter == "full":
+            backoff_value = random.uniform(0, backoff_value)
+        return float(backoff_value)
 
     def parse_retry_after(self, retry_after: str) -> float:
         seconds: float
@@ -491,6 +621,16 @@ class Retry:
         if new_retry.is_exhausted():
             raise MaxRetryError(_pool, url, error or ResponseError(cause))  # type: ignore
 
+        if (
+            self.budget is not None
+            and redirect_location is None
+            and not self.budget.withdraw()
+        ):
+            stats = getattr(_pool, "stats", None)
+            if stats is not None:
+                stats.incr("retry_budget_exhausted")
+            raise RetryBudgetExhaustedError(_pool, url, error or ResponseError(cause))  # type: ignore
+
         log.debug("Incremented Retry for (url='%s'): %r", url, new_retry)
 
         return new_retry
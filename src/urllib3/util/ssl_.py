@@ -5,8 +5,9 @@ import sys
 import warnings
 from binascii import unhexlify
 from hashlib import md5, sha1, sha256
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union, cast, overload
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union, cast, overload
 
+from .._collections import RecentlyUsedContainer
 from ..exceptions import ProxySchemeUnsupported, SNIMissingWarning, SSLError
 from .url import _BRACELESS_IPV6_ADDRZ_RE, _IPV4_RE
 
@@ -291,6 +292,191 @@ def create_urllib3_context(
     return context
 
 
+class SSLContextCache:
+    """
+    Thread-safe cache of verified :class:`ssl.SSLContext` objects, one per
+    distinct TLS configuration.
+
+    Creating a context and loading the system's CA certificates into it is
+    expensive, so :class:`~urllib3.HTTPSConnectionPool` and
+    :class:`~urllib3.PoolManager` build each context once and share it
+    between all the connections they create which don't supply their own
+    ``ssl_context``.
+
+    Certificate files are only read when a context is first built. Call
+    :meth:`clear` after changing them on disk.
+
+    :param maxsize:
+        Maximum number of contexts to retain. The least recently used context
+        is discarded beyond this.
+    """
+
+    def __init__(self, maxsize: int = 10) -> None:
+        self._contexts: RecentlyUsedContainer[
+            Tuple[Any, ...], "ssl.SSLContext"
+        ] = RecentlyUsedContainer(maxsize)
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def get_context(
+        self,
+        ssl_version: Union[None, int, str] = None,
+        cert_reqs: Union[None, int, str] = None,
+        ca_certs: Optional[str] = None,
+        ca_cert_dir: Optional[str] = None,
+        ca_cert_data: Union[None, str, bytes] = None,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None,
+        key_password: Optional[str] = None,
+        session_tickets: bool = False,
+    ) -> "ssl.SSLContext":
+        """
+        Return the context for the given TLS configuration, building it on
+        first use. All arguments have the same meaning as for
+        :func:`ssl_wrap_socket`. The returned context already has its verify
+        locations and client certificate loaded.
+
+        :param session_tickets:
+            Build the context without ``ssl.OP_NO_TICKET`` so that TLS 1.2
+            servers can hand out session tickets, see :class:`SSLSessionCache`.
+        """
+        ssl_version = resolve_ssl_version(ssl_version)
+        cert_reqs = resolve_cert_reqs(cert_reqs)
+        # SSLContext is part of the key so that contexts created before
+        # pyOpenSSL was injected or extracted are never handed out again.
+        key = (
+            SSLContext,
+            ssl_version,
+            cert_reqs,
+            ca_certs,
+            ca_cert_dir,
+            ca_cert_data,
+            certfile,
+            keyfile,
+            key_password,
+            session_tickets,
+        )
+
+        with self._contexts.lock:
+            try:
+                return self._contexts[key]
+            except KeyError:
+                pass
+
+            context = create_urllib3_context(
+                ssl_version=ssl_version, cert_reqs=cert_reqs
+            )
+            # Hostnames are verified by HTTPSConnection.connect(), see there.
+            context.check_hostname = False
+            if session_tickets:
+                context.options &= ~OP_NO_TICKET
+            _load_context_certs(
+                context,
+                ca_certs,
+                ca_cert_dir,
+                ca_cert_data,
+                certfile,
+                keyfile,
+                key_password,
+            )
+            self._contexts[key] = context
+
+        return context
+
+    def clear(self) -> None:
+        """Discard all cached contexts."""
+        self._contexts.clear()
+
+
+class SSLSessionCache:
+    """
+    Thread-safe cache of the most recent :class:`ssl.SSLSession` per
+    ``(host, port)``, used to resume TLS sessions instead of doing a full
+    handshake on every new connection.
+
+    Session resumption is opt-in: pass an instance as ``ssl_session_cache`` to
+    :class:`~urllib3.HTTPSConnectionPool` or :class:`~urllib3.PoolManager`.
+    A session can only be resumed with the :class:`ssl.SSLContext` it was
+    created with, so sessions are stored together with their context and only
+    offered to connections using that same context.
+
+    :param maxsize:
+        Maximum number of hosts to retain sessions for. The session of the
+        least recently used host is discarded beyond this.
+    """
+
+    def __init__(self, maxsize: int = 100) -> None:
+        self._sessions: RecentlyUsedContainer[
+            Tuple[str, Optional[int]], Tuple["ssl.SSLContext", "ssl.SSLSession"]
+        ] = RecentlyUsedContainer(maxsize)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(
+        self, host: str, port: Optional[int], context: "ssl.SSLContext"
+    ) -> Optional["ssl.SSLSession"]:
+        """
+        Return the session stored for ``host:port`` if it was created with
+        ``context``, otherwise ``None``.
+        """
+        try:
+            session_context, session = self._sessions[(host, port)]
+        except KeyError:
+            return None
+        if session_context is not context:
+            return None
+        return session
+
+    def put(
+        self,
+        host: str,
+        port: Optional[int],
+        context: "ssl.SSLContext",
+        session: "ssl.SSLSession",
+    ) -> None:
+        """Store ``session``, created with ``context``, for ``host:port``."""
+        self._sessions[(host, port)] = (context, session)
+
+    def clear(self) -> None:
+        """Discard all cached sessions."""
+        self._sessions.clear()
+
+
+def _load_context_certs(
+    context: "ssl.SSLContext",
+    ca_certs: Optional[str],
+    ca_cert_dir: Optional[str],
+    ca_cert_data: Union[None, str, bytes],
+    certfile: Optional[str],
+    keyfile: Optional[str],
+    key_password: Optional[str],
+    load_default_certs: bool = True,
+) -> None:
+    if ca_certs or ca_cert_dir or ca_cert_data:
+        try:
+            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
+        except OSError as e:
+            raise SSLError(e)
+
+    elif load_default_certs and hasattr(context, "load_default_certs"):
+        # try to load OS default certs; works well on Windows (require Python3.4+)
+        context.load_default_certs()
+
+    # Attempt to detect if we get the goofy behavior of the
+    # keyfile being encrypted and OpenSSL asking for the
+    # passphrase via the terminal and instead error out.
+    if keyfile and key_password is None and _is_key_file_encrypted(keyfile):
+        raise SSLError("Client private key is encrypted, password is required")
+
+    if certfile:
+        if key_password is None:
+            context.load_cert_chain(certfile, keyfile)
+        else:
+            context.load_cert_chain(certfile, keyfile, key_password)
+
+
 @overload
 def ssl_wrap_socket(
     sock: socket.socket,
@@ -306,6 +492,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = ...,
     ca_cert_data: Union[None, str, bytes] = ...,
     tls_in_tls: "Literal[False]" = ...,
+    session: Optional["ssl.SSLSession"] = ...,
 ) -> "ssl.SSLSocket":
     ...
 
@@ -325,6 +512,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = ...,
     ca_cert_data: Union[None, str, bytes] = ...,
     tls_in_tls: bool = ...,
+    session: Optional["ssl.SSLSession"] = ...,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]:
     ...
 
@@ -343,6 +531,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = None,
     ca_cert_data: Union[None, str, bytes] = None,
     tls_in_tls: bool = False,
+    session: Optional["ssl.SSLSession"] = None,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]:
     """
     All arguments except for server_hostname, ssl_context, and ca_cert_dir have
@@ -366,6 +555,9 @@ def ssl_wrap_socket(
         passing as the cadata parameter to SSLContext.load_verify_locations()
     :param tls_in_tls:
         Use SSLTransport to wrap the existing socket.
+    :param session:
+        A :class:`ssl.SSLSession` from an earlier connection made with the
+        same ``ssl_context`` to attempt to resume. Ignored with ``tls_in_tls``.
     """
     context = ssl_context
     if context is None:
@@ -373,27 +565,16 @@ def ssl_wrap_socket(
         # We should consider deprecating and removing this code.
         context = create_urllib3_context(ssl_version, cert_reqs, ciphers=ciphers)
 
-    if ca_certs or ca_cert_dir or ca_cert_data:
-        try:
-            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
-        except OSError as e:
-            raise SSLError(e)
-
-    elif ssl_context is None and hasattr(context, "load_default_certs"):
-        # try to load OS default certs; works well on Windows (require Python3.4+)
-        context.load_default_certs()
-
-    # Attempt to detect if we get the goofy behavior of the
-    # keyfile being encrypted and OpenSSL asking for the
-    # passphrase via the terminal and instead error out.
-    if keyfile and key_password is None and _is_key_file_encrypted(keyfile):
-        raise SSLError("Client private key is encrypted, password is required")
-
-    if certfile:
-        if key_password is None:
-            context.load_cert_chain(certfile, keyfile)
-        else:
-            context.load_cert_chain(certfile, keyfile, key_password)
+    _load_context_certs(
+        context,
+        ca_certs,
+        ca_cert_dir,
+        ca_cert_data,
+        certfile,
+        keyfile,
+        key_password,
+        load_default_certs=ssl_context is None,
+    )
 
     try:
         if hasattr(context, "set_alpn_protocols"):
@@ -413,7 +594,9 @@ def ssl_wrap_socket(
             SNIMissingWarning,
         )
 
-    ssl_sock = _ssl_wrap_socket_impl(sock, context, tls_in_tls, server_hostname)
+    ssl_sock = _ssl_wrap_socket_impl(
+        sock, context, tls_in_tls, server_hostname, session
+    )
     return ssl_sock
 
 
@@ -446,6 +629,7 @@ def _ssl_wrap_socket_impl(
     ssl_context: "ssl.SSLContext",
     tls_in_tls: bool,
     server_hostname: Optional[str] = None,
+    session: Optional["ssl.SSLSession"] = None,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]:
     if tls_in_tls:
         if not SSLTransport:
@@ -457,4 +641,8 @@ def _ssl_wrap_socket_impl(
         SSLTransport._validate_ssl_context_for_tls_in_tls(ssl_context)
         return SSLTransport(sock, ssl_context, server_hostname)
 
+    if session is not None:
+        return ssl_context.wrap_socket(
+            sock, server_hostname=server_hostname, session=session
+        )
     return ssl_context.wrap_socket(sock, server_hostname=server_hostname)
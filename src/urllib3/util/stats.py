@@ -0,0 +1,177 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+__all__ = ["PoolStats", "CHECKOUT_WAIT_BUCKETS"]
+
+#: Upper bounds in seconds of the buckets of
+#: :attr:`PoolStats.checkout_wait_histogram`.
+CHECKOUT_WAIT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.001,
+    0.01,
+    0.1,
+    1.0,
+    10.0,
+    float("inf"),
+)
+
+
+class PoolStats:
+    """
+    Counters describing how a connection pool is used, available as
+    ``pool.stats``. :meth:`urllib3.PoolManager.stats` adds up the counters of
+    all its pools.
+
+    Counters only ever grow, except ``in_flight`` and ``waiting``. Updating
+    them takes a lock but no system calls, so they are always collected.
+
+    Usage::
+
+        pool = urllib3.HTTPConnectionPool("example.com", maxsize=10)
+        ...
+        print(pool.stats.snapshot())
+
+    - ``connections_created``: Connections opened by the pool.
+    - ``connections_reused``: Checkouts which reused an open connection.
+    - ``connections_dropped``: Pooled connections found closed by the server
+      when checked out, which had to be reopened.
+    - ``connections_discarded``: Connections closed when returned because the
+      pool was already full. If this keeps growing ``maxsize`` is too low.
+    - ``connections_expired``: Connections closed because they exceeded
+      ``max_idle_time`` or ``max_connection_age``.
+    - ``connections_evicted``: Idle connections closed to make room for a
+      connection of another pool under a shared
+      :class:`~urllib3.util.ConnectionLimit`.
+    - ``connection_limit_waits``: Connections which had to wait for another
+      connection to be closed or released because the
+      :class:`~urllib3.util.ConnectionLimit` was reached.
+    - ``dropped_checks_skipped``: Checkouts which trusted a connection to be
+      alive because ``max_idle_time`` was set, without polling its socket.
+    - ``tls_handshakes``: TLS handshakes made by the pool.
+    - ``tls_resumptions``: TLS handshakes which resumed a previous session.
+    - ``pool_evictions``: Times the pool was evicted by a
+      :class:`~urllib3.PoolManager` to stay within ``num_pools``. If this
+      keeps growing ``num_pools`` is too low.
+    - ``pool_evictions_deferred``: Evictions of the pool while connections
+      were in use, which only closed it once they were released.
+    - ``pool_revivals``: Times the pool was requested again after it was
+      evicted but before it was closed, and was put back.
+    - ``requests``: Requests sent, including retries and redirects.
+    - ``retry_budget_exhausted``: Retries refused by the
+      :class:`~urllib3.util.retry.RetryBudget` of the request's retries.
+    - ``circuit_breaker_rejected``: Requests which failed fast because the
+      :class:`~urllib3.util.circuit_breaker.CircuitBreaker` circuit of the
+      host was open.
+    - ``in_flight``: Connections currently checked out of the pool.
+    - ``bytes_sent``: Bytes of requests written to connections, including
+      headers.
+    - ``bytes_received``: Bytes of response bodies read from connections,
+      before they are decoded.
+    - ``checkouts``: Connections requested from the pool.
+    - ``checkouts_waited``: Checkouts which had to wait for a connection to
+      be released, because all the connections of a ``block=True`` pool were
+      in use.
+    - ``waiting``: Checkouts currently waiting for a connection to be
+      released, the length of the queue of a ``block=True`` pool.
+    - ``checkout_wait_total``: Seconds spent waiting for connections, summed
+      over all checkouts.
+    - ``checkout_wait_histogram``: Number of checkouts by how long they
+      waited for a connection, one count per bucket of
+      :data:`CHECKOUT_WAIT_BUCKETS`.
+    """
+
+    #: Names of the integer counters.
+    COUNTERS: Tuple[str, ...] = (
+        "connections_created",
+        "connections_reused",
+        "connections_dropped",
+        "connections_discarded",
+        "connections_expired",
+        "connections_evicted",
+        "connection_limit_waits",
+        "dropped_checks_skipped",
+        "tls_handshakes",
+        "tls_resumptions",
+        "pool_evictions",
+        "pool_evictions_deferred",
+        "pool_revivals",
+        "requests",
+        "retry_budget_exhausted",
+        "circuit_breaker_rejected",
+        "in_flight",
+        "bytes_sent",
+        "bytes_received",
+        "checkouts",
+        "checkouts_waited",
+        "waiting",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.connections_dropped = 0
+        self.connections_discarded = 0
+        self.connections_expired = 0
+        self.connections_evicted = 0
+        self.connection_limit_waits = 0
+        self.dropped_checks_skipped = 0
+        self.tls_handshakes = 0
+        self.tls_resumptions = 0
+        self.pool_evictions = 0
+        self.pool_evictions_deferred = 0
+        self.pool_revivals = 0
+        self.requests = 0
+        self.retry_budget_exhausted = 0
+        self.circuit_breaker_rejected = 0
+        self.in_flight = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.checkouts = 0
+        self.checkouts_waited = 0
+        self.waiting = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_histogram: List[int] = [0] * len(CHECKOUT_WAIT_BUCKETS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.snapshot()!r})"
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to the counter ``name``."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def record_checkout(self, wait: float) -> None:
+        """Count a checkout which waited ``wait`` seconds for a connection."""
+        bucket = bisect_left(CHECKOUT_WAIT_BUCKETS, wait)
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait
+            self.checkout_wait_histogram[bucket] += 1
+
+    def merge(self, other: "PoolStats") -> None:
+        """Add the counters of ``other`` to these."""
+        snapshot = other.snapshot()
+        with self._lock:
+            for name in self.COUNTERS:
+                setattr(self, name, getattr(self, name) + snapshot[name])
+            self.checkout_wait_total += snapshot["checkout_wait_total"]
+            for i, count in enumerate(snapshot["checkout_wait_histogram"].values()):
+                self.checkout_wait_histogram[i] += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a consistent copy of the counters as a dictionary, for example
+        to export them to a monitoring system. The histogram maps the upper
+        bound of each bucket to its count.
+        """
+        with self._lock:
+            snapshot: Dict[str, Any] = {
+                name: getattr(self, name) for name in self.COUNTERS
+            }
+            snapshot["checkout_wait_total"] = self.checkout_wait_total
+            snapshot["checkout_wait_histogram"] = dict(
+                zip(CHECKOUT_WAIT_BUCKETS, self.checkout_wait_histogram)
+            )
+        return snapshot
@@ -0,0 +1,127 @@
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from .resolver import AddrInfo, Resolver
+
+__all__ = ["Tracer", "TimingTracer"]
+
+# Phases reported by TimingTracer.timings(), with the events they start and
+# end with. Connecting starts after DNS if the lookup was traced.
+_PHASES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    ("pool_wait", ("checkout_start",), "checkout_end"),
+    ("dns", ("dns_start",), "dns_end"),
+    ("connect", ("dns_end", "connect_start"), "connect_end"),
+    ("tls", ("tls_start",), "tls_end"),
+    ("send", ("request_start",), "request_end"),
+    ("wait", ("request_end",), "response_start"),
+    ("receive", ("response_start",), "response_end"),
+)
+
+
+class Tracer:
+    """
+    Receives the events marking the phases of requests, for example to find
+    out where the time of slow requests goes.
+
+    Pass an instance as ``tracer`` to :meth:`urllib3.HTTPConnectionPool.urlopen`
+    or :meth:`urllib3.PoolManager.request` to trace one request, or to
+    :class:`~urllib3.HTTPConnectionPool` and :class:`~urllib3.PoolManager` to
+    trace all of them. Without a tracer no events are created.
+
+    Subclass it and override :meth:`event`. The events of a request are, in
+    order:
+
+    - ``checkout_start``, ``checkout_end``: Waiting for a connection from the
+      pool.
+    - ``connect_start``, ``connect_end``: Opening a new connection, if the
+      connection from the pool wasn't open.
+    - ``dns_start``, ``dns_end``: Looking up the host, while connecting.
+    - ``tls_start``, ``tls_end``: The TLS handshake of a new HTTPS connection.
+    - ``request_start``, ``request_end``: Sending the request.
+    - ``response_start``: The headers of the response were received.
+    - ``response_end``: The body of the response was read completely.
+
+    Retries and redirects repeat the events.
+    """
+
+    def event(self, name: str, timestamp: float) -> None:
+        """
+        Called with the name of each event and the :func:`time.monotonic`
+        timestamp at which it happened. Does nothing by default.
+
+        This is called while the request is in progress, so it should return
+        quickly and must not raise.
+        """
+
+
+class TimingTracer(Tracer):
+    """
+    :class:`Tracer` recording the events of a request, to break down how long
+    each phase of the request took with :meth:`timings`.
+
+    Usage::
+
+        tracer = TimingTracer()
+        http.request("GET", "https://example.com", tracer=tracer)
+        print(tracer.timings())
+
+    Use a new instance for every request, the events of concurrent requests
+    traced with the same instance can't be told apart.
+    """
+
+    def __init__(self) -> None:
+        #: ``(name, timestamp)`` of the events, in the order they happened.
+        self.events: List[Tuple[str, float]] = []
+
+    def event(self, name: str, timestamp: float) -> None:
+        self.events.append((name, timestamp))
+
+    def timings(self) -> Dict[str, float]:
+        """
+        Return how many seconds were spent in each phase: ``pool_wait``,
+        ``dns``, ``connect``, ``tls``, ``send``, ``wait`` (the time to the
+        first byte of the response), ``receive`` and ``total``.
+
+        Phases which happened several times because of retries and redirects
+        are added up, phases which didn't happen are 0.
+        """
+        timings = {phase: 0.0 for phase, _, _ in _PHASES}
+        started: Dict[str, float] = {}
+        for name, timestamp in self.events:
+            for phase, starts, end in _PHASES:
+                if name != end:
+                    continue
+                start = next((started[s] for s in starts if s in started), None)
+                if start is not None:
+                    timings[phase] += timestamp - start
+                for s in starts:
+                    started.pop(s, None)
+            started[name] = timestamp
+
+        timings["total"] = (
+            self.events[-1][1] - self.events[0][1] if self.events else 0.0
+        )
+        return timings
+
+
+class _TracingResolver(Resolver):
+    """Wraps a :class:`Resolver` to send its lookups to a :class:`Tracer`."""
+
+    def __init__(self, resolver: Optional[Resolver], tracer: Tracer) -> None:
+        self.resolver = resolver or Resolver()
+        self.tracer = tracer
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: Union[None, int, str],
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> List[AddrInfo]:
+        self.tracer.event("dns_start", time.monotonic())
+        try:
+            return self.resolver.getaddrinfo(host, port, family, type, proto, flags)
+        finally:
+            self.tracer.event("dns_end", time.monotonic())
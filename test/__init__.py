@@ -16,6 +16,11 @@ try:
 except ImportError:
     brotli = None
 
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 import functools
 
 from urllib3 import util
@@ -123,6 +128,19 @@ def notBrotli():
     )
 
 
+def onlyZstd():
+    return pytest.mark.skipif(
+        zstd is None, reason="only run if a python-zstandard library is installed"
+    )
+
+
+def notZstd():
+    return pytest.mark.skipif(
+        zstd is not None,
+        reason="only run if a python-zstandard library is not installed",
+    )
+
+
 def onlySecureTransport(test):
     """Runs this test when SecureTransport is in use."""
 
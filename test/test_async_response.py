@@ -0,0 +1,86 @@
+import asyncio
+import zlib
+
+import pytest
+
+from urllib3.async_connection import AsyncHTTPConnection
+from urllib3.async_response import AsyncHTTPResponse
+from urllib3.exceptions import ProtocolError
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def make_response(body, headers, **kw):
+    conn = AsyncHTTPConnection("localhost")
+    conn.reader = asyncio.StreamReader()
+    conn.reader.feed_data(body)
+    conn.reader.feed_eof()
+    return AsyncHTTPResponse(headers=headers, status=200, connection=conn, **kw)
+
+
+class TestAsyncHTTPResponse:
+    def test_content_length(self):
+        async def go():
+            r = make_response(b"hello world", {"content-length": "5"})
+            assert await r.read(3) == b"hel"
+            assert await r.read() == b"lo"
+            assert r.closed
+            assert await r.read() == b""
+
+        run(go())
+
+    def test_chunked_with_trailers(self):
+        async def go():
+            r = make_response(
+                b"3\r\nabc\r\n5;ext=1\r\ndefgh\r\n0\r\nTrailer: x\r\n\r\n",
+                {"transfer-encoding": "chunked"},
+            )
+            assert [chunk async for chunk in r.stream(4)] == [b"abc", b"defg", b"h"]
+            assert r.closed
+            assert r.tell() == 8
+
+        run(go())
+
+    def test_invalid_chunk_length(self):
+        async def go():
+            r = make_response(b"X\r\nabc\r\n", {"transfer-encoding": "chunked"})
+            with pytest.raises(ProtocolError):
+                await r.read()
+            assert r.closed
+
+        run(go())
+
+    def test_read_until_eof(self):
+        async def go():
+            r = make_response(b"until closed", {})
+            assert await r.read(cache_content=True) == b"until closed"
+            assert r.data == b"until closed"
+
+        run(go())
+
+    def test_head_has_no_body(self):
+        async def go():
+            r = make_response(
+                b"", {"transfer-encoding": "chunked"}, request_method="HEAD"
+            )
+            assert await r.read() == b""
+            assert r.closed
+
+        run(go())
+
+    def test_decode_deflate(self):
+        async def go():
+            data = zlib.compress(b"foo" * 1000)
+            r = make_response(
+                data,
+                {"content-encoding": "deflate", "content-length": str(len(data))},
+            )
+            assert b"".join([chunk async for chunk in r.stream(10)]) == b"foo" * 1000
+
+        run(go())
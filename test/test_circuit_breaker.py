@@ -0,0 +1,129 @@
+from unittest import mock
+
+import pytest
+
+from urllib3.exceptions import (
+    ConnectionLimitError,
+    ConnectTimeoutError,
+    MaxRetryError,
+    NewConnectionError,
+    ProxyError,
+    ReadTimeoutError,
+    ResponseError,
+)
+from urllib3.util.circuit_breaker import CircuitBreaker
+
+KEY = ("http", "example.com", 80)
+
+
+class TestCircuitBreaker:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"failure_threshold": 0},
+            {"recovery_timeout": -1},
+            {"half_open_probes": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+    def test_opens_after_consecutive_failures(self):
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=3, on_state_change=lambda *args: changes.append(args)
+        )
+        for _ in range(2):
+            assert breaker.allow_request(KEY)
+            breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "closed"
+
+        # A success resets the count.
+        breaker.record_success(KEY)
+        for _ in range(2):
+            breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "closed"
+        assert changes == []
+
+        breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "open"
+        assert not breaker.allow_request(KEY)
+        assert changes == [(KEY, "closed", "open")]
+
+        # Other hosts aren't affected.
+        assert breaker.allow_request(("http", "example.org", 80))
+
+    @mock.patch("urllib3.util.circuit_breaker.time.monotonic")
+    def test_half_open(self, monotonic):
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=10,
+            half_open_probes=2,
+            on_state_change=lambda *args: changes.append(args[1:]),
+        )
+        monotonic.return_value = 100
+        breaker.record_failure(KEY)
+
+        monotonic.return_value = 109
+        assert not breaker.allow_request(KEY)
+        assert breaker.state(KEY) == "open"
+
+        monotonic.return_value = 110
+        assert breaker.allow_request(KEY)
+        assert breaker.allow_request(KEY)
+        assert not breaker.allow_request(KEY)
+        assert breaker.state(KEY) == "half_open"
+
+        # A probe which neither failed nor succeeded frees its slot.
+        breaker.release(KEY)
+        assert breaker.allow_request(KEY)
+
+        # A failed probe opens the circuit again.
+        breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "open"
+        assert not breaker.allow_request(KEY)
+
+        monotonic.return_value = 120
+        assert breaker.allow_request(KEY)
+        breaker.record_success(KEY)
+        assert breaker.state(KEY) == "closed"
+        assert breaker.allow_request(KEY)
+
+        assert changes == [
+            ("closed", "open"),
+            ("open", "half_open"),
+            ("half_open", "open"),
+            ("open", "half_open"),
+            ("half_open", "closed"),
+        ]
+
+    def test_reset(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure(KEY)
+        breaker.reset()
+        assert breaker.state(KEY) == "closed"
+        assert breaker.allow_request(KEY)
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (NewConnectionError(None, "refused"), True),
+            (ConnectTimeoutError(), True),
+            (MaxRetryError(None, "/", NewConnectionError(None, "refused")), True),
+            (ProxyError("proxy", ConnectTimeoutError()), True),
+            (ReadTimeoutError(None, "/", "timed out"), False),
+            (ConnectionLimitError(None, "connection limit"), False),
+            (MaxRetryError(None, "/", ReadTimeoutError(None, "/", "timed out")), False),
+            (MaxRetryError(None, "/"), False),
+            (
+                MaxRetryError(None, "/", ResponseError("too many 503 error responses")),
+                True,
+            ),
+            (MaxRetryError(None, "/", ResponseError("too many redirects")), False),
+            (ValueError(), False),
+        ],
+    )
+    def test_is_failure(self, error, expected):
+        assert CircuitBreaker().is_failure(error) is expected
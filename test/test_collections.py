@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from urllib3._collections import HTTPHeaderDict
@@ -116,6 +118,36 @@ class TestLRUContainer:
         d.clear()
         assert evicted_items == [0, 1, 2, 3, 4, 5]
 
+    def test_eviction_rank(self):
+        ranks = {0: 1, 1: 2, 2: 1, 3: 0, 4: 0}
+        d = Container(5, eviction_rank=ranks.get)
+        for i in range(5):
+            d[i] = i
+
+        # The least recently used item of the lowest rank goes first.
+        d[5] = ranks[5] = 2
+        assert 3 not in d
+        d[6] = ranks[6] = 2
+        assert 4 not in d
+        d[7] = 7
+        assert 0 not in d
+        assert list(d._container.keys()) == [1, 2, 5, 6, 7]
+
+    def test_evict_func(self):
+        evicted, disposed = [], []
+        d = Container(
+            2,
+            dispose_func=disposed.append,
+            evict_func=lambda key, value: evicted.append((key, value)),
+        )
+        d["a"] = 1
+        d["a"] = 2
+        d["b"] = 3
+        d["c"] = 4
+        del d["b"]
+        assert evicted == [("a", 2)]
+        assert disposed == [1, 3]
+
     def test_iter(self):
         d = Container()
 
@@ -259,6 +291,26 @@ class TestHTTPHeaderDict:
         assert d is not h
         assert d == h
 
+    def test_copy_is_independent(self, d):
+        h = d.copy()
+        h.add("cookie", "baz")
+        HTTPHeaderDict(d).add("cookie", "baz")
+        assert d.getlist("cookie") == ["foo", "bar"]
+        assert h.getlist("cookie") == ["foo", "bar", "baz"]
+
+    def test_extend_from_headerdict_is_independent(self, d):
+        h = HTTPHeaderDict()
+        h.extend(d)
+        h.add("cookie", "baz")
+        d.extend(HTTPHeaderDict(e="foofoo"))
+        assert d.getlist("cookie") == ["foo", "bar"]
+        assert h.getlist("cookie") == ["foo", "bar", "baz"]
+        assert "e" not in h
+
+    def test_slots(self, d):
+        assert not hasattr(d, "__dict__")
+        assert pickle.loads(pickle.dumps(d)) == d
+
     def test_getlist(self, d):
         assert d.getlist("cookie") == ["foo", "bar"]
         assert d.getlist("Cookie") == ["foo", "bar"]
@@ -5,8 +5,10 @@ from unittest import mock
 import pytest
 
 from urllib3.connection import (
+    DEFAULT_BLOCKSIZE,
     RECENT_DATE,
     CertificateError,
+    HTTPConnection,
     HTTPSConnection,
     _match_hostname,
 )
@@ -125,6 +127,103 @@ class TestConnection:
         two_years = datetime.timedelta(days=365 * 2)
         assert RECENT_DATE > (datetime.datetime.today() - two_years).date()
 
+    def test_blocksize(self):
+        assert HTTPSConnection("example.com").blocksize == DEFAULT_BLOCKSIZE
+        assert HTTPSConnection("example.com", blocksize=1024).blocksize == 1024
+
+    @staticmethod
+    def _send_request(send, max_sent=None):
+        """
+        Call ``send(conn)`` for a connection over a socket pair and return the
+        buffers of each sendmsg() call and the received data.
+        """
+        calls = []
+        sendmsg = socket.socket.sendmsg
+
+        def record_sendmsg(sock, buffers):
+            buffers = [bytes(data) for data in buffers]
+            calls.append(buffers)
+            if max_sent is not None:
+                buffers = [b"".join(buffers)[:max_sent]]
+            return sendmsg(sock, buffers)
+
+        conn = HTTPConnection("localhost")
+        conn.sock, peer = socket.socketpair()
+        with peer, mock.patch.object(socket.socket, "sendmsg", record_sendmsg):
+            send(conn)
+            conn.close()
+            data = b""
+            while True:
+                received = peer.recv(65536)
+                if not received:
+                    break
+                data += received
+        return calls, data
+
+    @pytest.mark.skipif(
+        not hasattr(socket.socket, "sendmsg"), reason="requires socket.sendmsg"
+    )
+    def test_request_chunked_sendmsg(self):
+        body = [b"a" * 40000, b"b" * 40000]
+        calls, data = self._send_request(
+            lambda conn: conn.request_chunked("POST", "/", body=body)
+        )
+        # Both chunks in one call without copying them, the last chunk is
+        # small enough to be joined.
+        assert len(calls) == 1
+        assert calls[0][1:] == [
+            b"9c40\r\n",
+            body[0],
+            b"\r\n",
+            b"9c40\r\n",
+            body[1],
+            b"\r\n",
+        ]
+        assert data.startswith(b"POST / HTTP/1.1\r\n")
+        assert data.endswith(
+            b"\r\n\r\n9c40\r\n%s\r\n9c40\r\n%s\r\n0\r\n\r\n" % tuple(body)
+        )
+
+    @pytest.mark.skipif(
+        not hasattr(socket.socket, "sendmsg"), reason="requires socket.sendmsg"
+    )
+    def test_request_sendmsg_partial(self):
+        body = bytes(range(256)) * 400
+        calls, data = self._send_request(
+            lambda conn: conn.request("POST", "/", body=body), max_sent=30000
+        )
+        assert len(calls) == 4
+        assert calls[0][-1] == body
+        assert b"\r\nContent-Length: 102400\r\n" in data
+        assert data.endswith(b"\r\n\r\n" + body)
+
+    def test_request_chunked_coalesces(self):
+        conn = HTTPConnection("localhost")
+        conn.sock = mock.Mock(spec=["sendall"])
+        conn.request_chunked("POST", "/", body=[b"foo", b"bar"])
+        # The headers and all chunks are joined into one write.
+        assert conn.sock.sendall.call_count == 1
+        (data,), _ = conn.sock.sendall.call_args
+        assert data.endswith(b"\r\n\r\n3\r\nfoo\r\n3\r\nbar\r\n0\r\n\r\n")
+
+    def test_request_chunked_iterator(self):
+        conn = HTTPConnection("localhost")
+        conn.sock = mock.Mock(spec=["sendall"])
+        conn.request_chunked("POST", "/", body=iter([b"foo", b"", "bär"]))
+        # The headers, then each chunk as it comes in, then the last chunk.
+        sent = [data for (data,), _ in conn.sock.sendall.call_args_list]
+        assert sent[1:] == [b"3\r\nfoo\r\n", b"4\r\nb\xc3\xa4r\r\n", b"0\r\n\r\n"]
+        assert sent[0].endswith(b"\r\nTransfer-Encoding: chunked\r\n\r\n")
+
+    def test_request_coalesces_body(self):
+        conn = HTTPConnection("localhost")
+        conn.sock = mock.Mock(spec=["sendall"])
+        conn.request("POST", "/", body="hello")
+        assert conn.sock.sendall.call_count == 1
+        (data,), _ = conn.sock.sendall.call_args
+        assert b"\r\nContent-Length: 5\r\n" in data
+        assert data.endswith(b"\r\n\r\nhello")
+
     def test_HTTPSConnection_default_socket_options(self):
         conn = HTTPSConnection("not.a.real.host", port=443)
         assert conn.socket_options == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
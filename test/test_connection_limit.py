@@ -0,0 +1,102 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from urllib3 import HTTPConnectionPool
+from urllib3.exceptions import ConnectionLimitError
+from urllib3.util import ConnectionLimit
+
+
+def open_conn(pool, idle_since):
+    """Check out a connection which pretends to be connected to a slot."""
+    conn = pool._get_conn()
+    assert pool.connection_limit.acquire(blocking=False)
+    conn._holds_connection_slot = True
+    conn.sock = Mock()
+    conn.idle_since = idle_since
+    return conn
+
+
+class TestConnectionLimit:
+    def test_invalid_max_connections(self):
+        with pytest.raises(ValueError):
+            ConnectionLimit(0)
+
+    def test_acquire_release(self):
+        limit = ConnectionLimit(2)
+        assert limit.acquire()
+        assert limit.acquire(blocking=False)
+        assert not limit.acquire(blocking=False)
+        assert not limit.acquire(timeout=0.01)
+        assert limit.open_connections == 2
+
+        limit.release()
+        assert limit.open_connections == 1
+        assert limit.acquire(blocking=False)
+
+    def test_release_wakes_waiter(self):
+        limit = ConnectionLimit(1)
+        limit.acquire()
+        timer = threading.Timer(0.01, limit.release)
+        timer.start()
+        assert limit.acquire(timeout=5)
+        timer.join()
+
+    def test_closes_oldest_idle_connection(self):
+        limit = ConnectionLimit(3)
+        pool1 = HTTPConnectionPool("localhost", maxsize=2, connection_limit=limit)
+        pool2 = HTTPConnectionPool("localhost", maxsize=2, connection_limit=limit)
+        newer = open_conn(pool1, idle_since=2)
+        older = open_conn(pool2, idle_since=1)
+        busy = open_conn(pool1, idle_since=0)
+        # _put_conn() would update idle_since.
+        pool1.pool.put(newer)
+        pool2.pool.put(older)
+
+        assert limit.acquire(blocking=False)
+        assert older.sock is None
+        assert newer.sock is not None
+        assert busy.sock is not None
+        assert pool2.stats.connections_evicted == 1
+        assert limit.open_connections == 3
+
+        # Only connections in use are left.
+        assert limit.acquire(blocking=False)
+        assert not limit.acquire(blocking=False)
+        assert pool1.stats.connections_evicted == 1
+
+    def test_returned_connection_wakes_waiter(self):
+        limit = ConnectionLimit(1)
+        pool = HTTPConnectionPool("localhost", maxsize=1, connection_limit=limit)
+        conn = open_conn(pool, idle_since=0)
+        timer = threading.Timer(0.01, pool._put_conn, args=(conn,))
+        timer.start()
+        assert limit.acquire(timeout=5)
+        timer.join()
+        assert conn.sock is None
+        assert pool.stats.connections_evicted == 1
+
+    def test_connect_waits_up_to_connect_timeout(self):
+        limit = ConnectionLimit(1)
+        pool = HTTPConnectionPool(
+            "localhost", maxsize=1, timeout=0.01, connection_limit=limit
+        )
+        open_conn(pool, idle_since=0)
+        conn = pool._new_conn()
+        start = time.monotonic()
+        with pytest.raises(ConnectionLimitError, match="connection limit") as e:
+            conn.connect()
+        assert e.value.conn is conn
+        assert time.monotonic() - start >= 0.01
+        assert pool.stats.connection_limit_waits == 1
+        assert not conn._holds_connection_slot
+
+    def test_close_releases_slot(self):
+        limit = ConnectionLimit(1)
+        pool = HTTPConnectionPool("localhost", maxsize=1, connection_limit=limit)
+        conn = open_conn(pool, idle_since=0)
+        conn.close()
+        conn.close()
+        assert limit.open_connections == 0
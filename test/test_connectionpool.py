@@ -1,5 +1,7 @@
 import http.client as httplib
 import ssl
+import threading
+import time
 from http.client import HTTPException
 from queue import Empty
 from socket import error as SocketError
@@ -225,6 +227,65 @@ class TestConnectionPool:
 
             assert pool.num_connections == 1
 
+    def test_blocking_checkout_wait_is_bounded(self):
+        hold = 0.005
+        waits = []
+
+        def worker():
+            for _ in range(5):
+                start = time.monotonic()
+                conn = pool._get_conn(timeout=5)
+                waits.append(time.monotonic() - start)
+                time.sleep(hold)
+                pool._put_conn(conn)
+
+        with HTTPConnectionPool(host="localhost", maxsize=2, block=True) as pool:
+            threads = [threading.Thread(target=worker) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # Waiters are served in order, so nobody waits much longer than it
+            # takes for all the others ahead of them to use a connection.
+            assert len(waits) == 80
+            assert max(waits) < 16 / 2 * hold * 10
+            assert pool.stats.checkouts == 80
+            assert pool.stats.checkouts_waited > 0
+            assert pool.stats.waiting == 0
+            assert pool.stats.in_flight == 0
+
+    def test_blocking_checkout_priority(self):
+        served = []
+
+        def get(name, priority):
+            conn = pool._get_conn(timeout=5, priority=priority)
+            served.append(name)
+            pool._put_conn(conn)
+
+        with HTTPConnectionPool(host="localhost", maxsize=1, block=True) as pool:
+            conn = pool._get_conn()
+            threads = []
+            for name, priority in [("batch", 0), ("batch 2", 0), ("interactive", 1)]:
+                threads.append(threading.Thread(target=get, args=(name, priority)))
+                threads[-1].start()
+                while pool.pool.waiting < len(threads):
+                    time.sleep(0.001)
+            pool._put_conn(conn)
+            for thread in threads:
+                thread.join()
+
+        assert served == ["interactive", "batch", "batch 2"]
+        assert pool.stats.checkouts_waited == 3
+
+    def test_urlopen_pool_priority(self):
+        with HTTPConnectionPool(host="localhost", maxsize=1, block=True) as pool:
+            error = EmptyPoolError(pool, "Pool is empty")
+            with patch.object(pool, "_get_conn", side_effect=error) as get_conn:
+                with pytest.raises(EmptyPoolError):
+                    pool.request("GET", "/", pool_timeout=0, pool_priority=5)
+            get_conn.assert_called_once_with(timeout=0, priority=5)
+
     def test_put_conn_when_pool_is_full_nonblocking(self):
         """
         If maxsize = n and we _put_conn n + 1 conns, the n + 1th conn will
@@ -285,6 +346,128 @@ class TestConnectionPool:
 
             assert conn1.close.called is True
 
+    def _put_open_conn(self, pool, now):
+        with patch("time.monotonic", return_value=now):
+            conn = pool._get_conn()
+            conn.sock = Mock()
+            conn.connected_at = now
+            conn.close = Mock()
+            pool._put_conn(conn)
+        return conn
+
+    def test_max_idle_time(self):
+        with HTTPConnectionPool(host="localhost", max_idle_time=10) as pool:
+            conn = self._put_open_conn(pool, now=100)
+
+            with patch("time.monotonic", return_value=109), patch(
+                "urllib3.connectionpool.is_connection_dropped"
+            ) as is_connection_dropped:
+                assert pool._get_conn() is conn
+                pool._put_conn(conn)
+            is_connection_dropped.assert_not_called()
+            conn.close.assert_not_called()
+            assert pool.stats.dropped_checks_skipped == 1
+
+            with patch("time.monotonic", return_value=119):
+                assert pool._get_conn() is conn
+            conn.close.assert_called_once_with()
+            assert pool.stats.connections_expired == 1
+
+    def test_max_connection_age(self):
+        with HTTPConnectionPool(host="localhost", max_connection_age=10) as pool:
+            conn = self._put_open_conn(pool, now=100)
+
+            with patch("time.monotonic", return_value=109), patch(
+                "urllib3.connectionpool.is_connection_dropped", return_value=False
+            ) as is_connection_dropped:
+                assert pool._get_conn() is conn
+                pool._put_conn(conn)
+            # Without max_idle_time connections are still checked.
+            is_connection_dropped.assert_called_once_with(conn)
+            conn.close.assert_not_called()
+
+            with patch("time.monotonic", return_value=110):
+                assert pool._get_conn() is conn
+            conn.close.assert_called_once_with()
+            assert pool.stats.connections_expired == 1
+            assert pool.stats.dropped_checks_skipped == 0
+
+    def test_reap_expired_conns(self):
+        with HTTPConnectionPool(host="localhost", maxsize=3, max_idle_time=10) as pool:
+            old_conn, new_conn = pool._get_conn(), pool._get_conn()
+            for conn, now in [(old_conn, 100), (new_conn, 105)]:
+                conn.sock = Mock()
+                conn.close = Mock()
+                with patch("time.monotonic", return_value=now):
+                    pool._put_conn(conn)
+
+            with patch("time.monotonic", return_value=110):
+                assert pool._reap_expired_conns() == 1
+            old_conn.close.assert_called_once_with()
+            new_conn.close.assert_not_called()
+            assert pool.stats.connections_expired == 1
+
+    def test_reaper_thread(self):
+        with HTTPConnectionPool(
+            host="localhost", max_idle_time=0.01, reap_interval=0.01
+        ) as pool:
+            conn = pool._get_conn()
+            conn.sock = Mock()
+            conn.close = Mock()
+            pool._put_conn(conn)
+
+            for _ in range(100):
+                if conn.close.called:
+                    break
+                time.sleep(0.01)
+            conn.close.assert_called_once_with()
+
+        assert pool._reaper_stop.is_set()
+
+    def test_stats(self):
+        with HTTPConnectionPool(host="localhost", maxsize=1) as pool:
+            conn1 = pool._get_conn()
+            conn2 = pool._get_conn()
+            assert pool.stats.in_flight == 2
+
+            conn1.sock = conn2.sock = Mock()
+            pool._put_conn(conn1)
+            pool._put_conn(conn2)
+            assert pool.stats.in_flight == 0
+            assert pool.stats.connections_discarded == 1
+
+            with patch(
+                "urllib3.connectionpool.is_connection_dropped", return_value=False
+            ):
+                assert pool._get_conn() is conn1
+            assert pool.stats.connections_reused == 1
+            pool._put_conn(conn1)
+
+            with patch(
+                "urllib3.connectionpool.is_connection_dropped", return_value=True
+            ):
+                assert pool._get_conn() is conn1
+            assert conn1.sock is None
+            assert pool.stats.connections_dropped == 1
+            assert pool.stats.connections_reused == 1
+
+            assert pool.stats.connections_created == pool.num_connections == 2
+            assert pool.stats.checkouts == 4
+            assert sum(pool.stats.checkout_wait_histogram) == 4
+
+    def test_stats_blocking_checkout(self):
+        with HTTPConnectionPool(host="localhost", maxsize=1, block=True) as pool:
+            pool._get_conn()
+            with patch("time.monotonic", side_effect=[100, 100.5]):
+                with pytest.raises(EmptyPoolError):
+                    pool._get_conn(timeout=SHORT_TIMEOUT)
+
+            snapshot = pool.stats.snapshot()
+            assert snapshot["checkouts"] == 2
+            assert snapshot["checkout_wait_total"] >= 0.5
+            assert snapshot["checkout_wait_histogram"][1.0] == 1
+            assert snapshot["in_flight"] == 1
+
     def test_exception_str(self):
         assert (
             str(EmptyPoolError(HTTPConnectionPool(host="localhost"), "Test."))
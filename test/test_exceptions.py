@@ -2,9 +2,12 @@ import pickle
 
 import pytest
 
+from urllib3.connection import HTTPConnection
 from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.exceptions import (
+    CircuitOpenError,
     ClosedPoolError,
+    ConnectionLimitError,
     ConnectTimeoutError,
     EmptyPoolError,
     HeaderParsingError,
@@ -13,6 +16,7 @@ from urllib3.exceptions import (
     LocationParseError,
     MaxRetryError,
     ReadTimeoutError,
+    RetryBudgetExhaustedError,
 )
 
 
@@ -30,8 +34,11 @@ class TestPickle:
             LocationParseError("fake location"),
             ClosedPoolError(HTTPConnectionPool("localhost"), None),
             EmptyPoolError(HTTPConnectionPool("localhost"), None),
+            ConnectionLimitError(HTTPConnection("localhost"), None),
             HostChangedError(HTTPConnectionPool("localhost"), "/", None),
             ReadTimeoutError(HTTPConnectionPool("localhost"), "/", None),
+            RetryBudgetExhaustedError(HTTPConnectionPool("localhost"), "/", None),
+            CircuitOpenError(HTTPConnectionPool("localhost"), "/", None),
         ],
     )
     def test_exceptions(self, exception):
@@ -1,7 +1,9 @@
+from io import BytesIO
+
 import pytest
 
 from urllib3.fields import RequestField
-from urllib3.filepost import encode_multipart_formdata
+from urllib3.filepost import MultipartEncoder, encode_multipart_formdata
 
 BOUNDARY = "!! test boundary !!"
 BOUNDARY_BYTES = BOUNDARY.encode()
@@ -112,3 +114,60 @@ class TestMultipartEncoding:
         )
 
         assert encoded == expected
+
+
+class TestMultipartEncoder:
+    def test_file_fields(self, tmp_path):
+        path = tmp_path / "somefile.txt"
+        path.write_bytes(b"skipped" + b"x" * 1000)
+        with open(path, "rb") as f:
+            f.seek(7)
+            fields = [("k", "v"), ("f", ("somefile.txt", f)), ("b", BytesIO(b"y"))]
+            encoder = MultipartEncoder(fields, boundary=BOUNDARY)
+            expected, content_type = encode_multipart_formdata(
+                [("k", "v"), ("f", ("somefile.txt", b"x" * 1000)), ("b", b"y")],
+                boundary=BOUNDARY,
+            )
+
+            assert encoder.content_type == content_type
+            assert encoder.content_length == len(encoder) == len(expected)
+            # The files aren't read until the body is.
+            assert f.tell() == 7
+
+            parts = iter(lambda: encoder.read(100), b"")
+            assert b"".join(parts) == expected
+            assert encoder.tell() == len(expected)
+            assert encoder.read() == b""
+
+    def test_seek(self):
+        f = BytesIO(b"foobar")
+        encoder = MultipartEncoder([("f", f)], boundary=BOUNDARY)
+        body = encoder.read()
+
+        for pos in (0, 10, len(body) - 60, len(body)):
+            assert encoder.seek(pos) == pos
+            # Moving the file doesn't matter.
+            f.seek(0)
+            assert encoder.read() == body[pos:]
+        assert encoder.seek(-3, 2) == len(body) - 3
+        assert encoder.read(1) == b"-"
+        with pytest.raises(ValueError):
+            encoder.seek(-1)
+
+    def test_unsized_file(self):
+        class Pipe:
+            def read(self):
+                return b"foobar"
+
+        encoder = MultipartEncoder([("f", Pipe())], boundary=BOUNDARY)
+        assert (
+            encoder.read()
+            == encode_multipart_formdata([("f", b"foobar")], boundary=BOUNDARY)[0]
+        )
+
+    def test_file_shrunk(self):
+        f = BytesIO(b"foobar")
+        encoder = MultipartEncoder([("f", f)], boundary=BOUNDARY)
+        f.truncate(3)
+        with pytest.raises(ValueError, match="File ended 3 bytes before"):
+            encoder.read()
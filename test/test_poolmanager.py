@@ -1,13 +1,31 @@
+import collections
 import socket
+import threading
+import time
 from test import resolvesLocalhostFQDN
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from urllib3 import connection_from_url
-from urllib3.exceptions import ClosedPoolError, LocationValueError
+from urllib3.exceptions import (
+    CircuitOpenError,
+    ClosedPoolError,
+    LocationValueError,
+    MaxRetryError,
+)
 from urllib3.poolmanager import PoolKey, PoolManager, key_fn_by_scheme
-from urllib3.util import retry, timeout
+from urllib3.util import (
+    CircuitBreaker,
+    ConnectionLimit,
+    Resolver,
+    SSLSessionCache,
+    Tracer,
+    retry,
+    timeout,
+)
+
+from .port_helpers import find_unused_port
 
 
 class TestPoolManager:
@@ -109,6 +127,10 @@ class TestPoolManager:
             "retries": retry.Retry(total=6, connect=2),
             "block": True,
             "source_address": "127.0.0.1",
+            "happy_eyeballs_delay": 0.25,
+            "resolver": Resolver(),
+            "tracer": Tracer(),
+            "connection_limit": ConnectionLimit(10),
         }
         p = PoolManager()
         conn_pools = [
@@ -362,6 +384,17 @@ class TestPoolManager:
         assert default_pool.conn_kw["socket_options"] == []
         assert override_pool.conn_kw["socket_options"] == override_opts
 
+    def test_pool_kwargs_blocksize(self):
+        p = PoolManager(blocksize=1024)
+        pool = p.connection_from_host("example.com", scheme="https")
+        assert pool._new_conn().blocksize == 1024
+        assert (
+            p.connection_from_host(
+                "example.com", scheme="https", pool_kwargs={"blocksize": 2048}
+            )
+            is not pool
+        )
+
     def test_merge_pool_kwargs(self):
         """Assert _merge_pool_kwargs works in the happy case"""
         p = PoolManager(retries=100)
@@ -393,3 +426,203 @@ class TestPoolManager:
         p = PoolManager()
         assert p._proxy_requires_url_absolute_form("http://example.com") is False
         assert p._proxy_requires_url_absolute_form("https://example.com") is False
+
+    def test_https_pools_share_ssl_context_cache(self):
+        p = PoolManager()
+        pool1 = p.connection_from_url("https://example.com/")
+        pool2 = p.connection_from_url("https://example.org/")
+        pool3 = p.connection_from_url("http://example.com/")
+
+        assert pool1.ssl_context_cache is p.ssl_context_cache
+        assert pool2.ssl_context_cache is p.ssl_context_cache
+        assert not hasattr(pool3, "ssl_context_cache")
+
+    def test_ssl_session_cache_only_passed_to_https_pools(self):
+        cache = SSLSessionCache()
+        p = PoolManager(ssl_session_cache=cache)
+        https_pool = p.connection_from_url("https://example.com/")
+        http_pool = p.connection_from_url("http://example.com/")
+
+        assert https_pool.ssl_session_cache is cache
+        assert not hasattr(http_pool, "ssl_session_cache")
+
+    def test_evicts_pools_without_connections_first(self):
+        p = PoolManager(num_pools=2)
+        pool1 = p.connection_from_url("http://example.com/")
+        pool2 = p.connection_from_url("http://example.org/")
+        conn = pool1._get_conn()
+        conn.sock = Mock()
+        pool1._put_conn(conn)
+
+        # pool1 is the least recently used pool, but has an idle connection.
+        p.connection_from_url("http://example.net/")
+        assert pool1.pool is not None
+        assert pool2.pool is None
+        assert p.stats().pool_evictions == 1
+
+    def test_busy_pool_eviction_is_deferred(self):
+        p = PoolManager(num_pools=1)
+        pool1 = p.connection_from_url("http://example.com/")
+        conn = pool1._get_conn()
+
+        pool2 = p.connection_from_url("http://example.org/")
+        assert len(p.pools) == 1
+        # The pool isn't closed while its connection is in use.
+        assert pool1.pool is not None
+        stats = p.stats()
+        assert stats.pool_evictions == 1
+        assert stats.pool_evictions_deferred == 1
+        assert stats.in_flight == 1
+
+        # Requesting it again puts it back.
+        assert p.connection_from_url("http://example.com/") is pool1
+        assert pool2.pool is None
+        assert p.stats().pool_revivals == 1
+
+        p.connection_from_url("http://example.org/")
+        assert pool1.pool is not None
+        pool1._put_conn(conn)
+        assert pool1.pool is None
+
+        stats = p.stats()
+        assert stats.pool_evictions == 3
+        assert stats.pool_evictions_deferred == 2
+        assert stats.in_flight == 0
+        assert stats.checkouts == 1
+
+        # Once closed, a new pool is created.
+        assert p.connection_from_url("http://example.com/") is not pool1
+
+    def test_deferred_close_races_release(self):
+        p = PoolManager(num_pools=1)
+        pool = p.connection_from_url("http://example.com/")
+        conn = pool._get_conn()
+
+        # close_when_idle() saw the connection in use while holding the lock,
+        # and the connection is released before it sets the flag.
+        with pool._close_lock:
+            t = threading.Thread(target=pool._put_conn, args=(conn,))
+            t.start()
+            while pool.stats.in_flight:
+                time.sleep(0.001)
+            pool._close_when_idle = True
+        t.join()
+        assert pool.pool is None
+
+    def test_clear_closes_busy_pools(self):
+        p = PoolManager(num_pools=1)
+        pool1 = p.connection_from_url("http://example.com/")
+        pool1._get_conn()
+        p.connection_from_url("http://example.org/")
+
+        p.clear()
+        assert pool1.pool is None
+        assert p.stats().checkouts == 1
+
+    def test_request_many_stop_early(self):
+        release = threading.Event()
+        responses = []
+
+        def request(method, url, **kw):
+            if not url.endswith("/0"):
+                release.wait(5)
+            response = Mock()
+            responses.append(response)
+            return response
+
+        p = PoolManager()
+        requests = [("GET", f"http://{i}.example.com/{i}") for i in range(4)]
+        with patch.object(p, "request", side_effect=request) as mock_request:
+            results = p.request_many(requests, concurrency=2)
+            assert next(results).index == 0
+            # Doesn't wait for the requests in progress.
+            results.close()
+            release.set()
+
+            deadline = time.monotonic() + 5
+            while len(responses) < 3 or not responses[2].release_conn.called:
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+            # Responses which weren't yielded are closed and released.
+            responses[0].release_conn.assert_not_called()
+            for response in responses[1:]:
+                response.close.assert_called_once_with()
+                response.release_conn.assert_called_once_with()
+            assert mock_request.call_count == 3
+
+    def test_request_many_host_limit_survives_pool_eviction(self):
+        lock = threading.Lock()
+        active = collections.Counter()
+        peak = collections.Counter()
+
+        def request(method, url, **kw):
+            host = url.split("/")[2]
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.05)
+            with lock:
+                active[host] -= 1
+            return Mock()
+
+        # The pool of a.example.com is discarded by the next request and
+        # created again for the last one.
+        p = PoolManager(num_pools=1)
+        requests = [
+            ("GET", "http://a.example.com/1"),
+            ("GET", "http://b.example.com/"),
+            ("GET", "http://a.example.com/2"),
+        ]
+        with patch.object(p, "request", side_effect=request):
+            results = list(p.request_many(requests, concurrency=3))
+        assert sorted(result.index for result in results) == [0, 1, 2]
+        assert peak["a.example.com"] == 1
+        assert p.stats().pool_evictions >= 2
+
+    def test_request_many_ordered_read_ahead(self):
+        num_read = 0
+        read_while_slow = []
+
+        def requests():
+            nonlocal num_read
+            yield ("GET", "http://slow.example.com/")
+            for i in range(1, 20):
+                num_read = i
+                yield ("GET", f"http://fast.example.com/{i}")
+
+        def request(method, url, **kw):
+            if "slow" in url:
+                time.sleep(0.1)
+                read_while_slow.append(num_read)
+            return Mock()
+
+        p = PoolManager()
+        with patch.object(p, "request", side_effect=request):
+            results = list(p.request_many(requests(), concurrency=2, ordered=True))
+        assert [result.index for result in results] == list(range(20))
+        # The results after the slow request are kept until it finishes, so
+        # reading ahead is bounded.
+        assert read_while_slow[0] < 4
+
+    def test_circuit_breaker_connection_failures(self):
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=60,
+            on_state_change=lambda *args: changes.append(args),
+        )
+        url = f"http://localhost:{find_unused_port()}/"
+        with PoolManager(circuit_breaker=breaker) as p:
+            for _ in range(2):
+                with pytest.raises(MaxRetryError):
+                    p.request("GET", url, retries=1)
+
+            pool = p.connection_from_url(url)
+            key = ("http", "localhost", pool.port)
+            assert changes == [(key, "closed", "open")]
+
+            with patch.object(pool, "urlopen") as urlopen:
+                with pytest.raises(CircuitOpenError):
+                    p.request("GET", url)
+                urlopen.assert_not_called()
+            assert pool.stats.circuit_breaker_rejected == 1
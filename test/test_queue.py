@@ -0,0 +1,78 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from urllib3.util.queue import FairLifoQueue
+
+
+def wait_for_waiters(q, n):
+    deadline = time.monotonic() + 5
+    while q.waiting < n:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestFairLifoQueue:
+    def test_items_are_lifo(self):
+        q = FairLifoQueue(3)
+        for item in (1, 2, 3):
+            q.put(item)
+        assert [q.get(), q.get(), q.get()] == [3, 2, 1]
+
+    def test_empty_and_full(self):
+        q = FairLifoQueue(1)
+        with pytest.raises(queue.Empty):
+            q.get(block=False)
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.01)
+        q.put(1)
+        with pytest.raises(queue.Full):
+            q.put(2, block=False)
+        # put() never blocks.
+        with pytest.raises(queue.Full):
+            q.put(2)
+        with pytest.raises(ValueError):
+            q.get(timeout=-1)
+
+    def test_timed_out_waiter_is_removed(self):
+        q = FairLifoQueue(1)
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.01)
+        assert q.waiting == 0
+        q.put(1)
+        assert q.get(block=False) == 1
+
+    def _start_waiters(self, q, priorities):
+        served = []
+
+        def get(name, priority):
+            served.append((name, q.get(timeout=5, priority=priority)))
+
+        threads = []
+        for name, priority in enumerate(priorities):
+            thread = threading.Thread(target=get, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            # Make sure the waiters arrive in order.
+            wait_for_waiters(q, name + 1)
+        return served, threads
+
+    @pytest.mark.parametrize(
+        "priorities, order",
+        [([0, 0, 0, 0], [0, 1, 2, 3]), ([0, 1, 0, 5], [3, 1, 0, 2])],
+    )
+    def test_waiters_are_served_in_order(self, priorities, order):
+        q = FairLifoQueue(1)
+        served, threads = self._start_waiters(q, priorities)
+        for item in range(len(priorities)):
+            q.put(item)
+            # Threads which arrive later can't take the item of a waiter.
+            with pytest.raises(queue.Empty):
+                q.get(block=False)
+        for thread in threads:
+            thread.join()
+        assert sorted(served, key=lambda s: s[1]) == [
+            (name, item) for item, name in enumerate(order)
+        ]
@@ -0,0 +1,167 @@
+import socket
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from urllib3.util.resolver import CachingResolver, Resolver
+
+
+class StubResolver(Resolver):
+    def __init__(self, hosts):
+        self.hosts = hosts
+        self.lookups = []
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.lookups.append(host)
+        try:
+            address = self.hosts[host]
+        except KeyError:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port))]
+
+
+class TestResolver:
+    def test_default_resolver_calls_getaddrinfo(self):
+        with mock.patch("socket.getaddrinfo") as getaddrinfo:
+            getaddrinfo.return_value = []
+            assert Resolver().getaddrinfo("example.com", 80) == []
+        getaddrinfo.assert_called_once_with("example.com", 80, 0, 0, 0, 0)
+
+
+class TestCachingResolver:
+    def test_caches_lookups(self):
+        stub = StubResolver({"example.com": "192.0.2.1"})
+        resolver = CachingResolver(stub)
+
+        first = resolver.getaddrinfo("example.com", 80)
+        assert first[0][4] == ("192.0.2.1", 80)
+        assert resolver.getaddrinfo("example.com", 80) == first
+        assert stub.lookups == ["example.com"]
+
+        # Different arguments are different lookups.
+        resolver.getaddrinfo("example.com", 443)
+        assert stub.lookups == ["example.com", "example.com"]
+        assert len(resolver) == 2
+
+    def test_lookups_expire(self):
+        stub = StubResolver({"example.com": "192.0.2.1"})
+        resolver = CachingResolver(stub, ttl=10)
+
+        with mock.patch("time.monotonic", return_value=100):
+            resolver.getaddrinfo("example.com", 80)
+        with mock.patch("time.monotonic", return_value=109):
+            resolver.getaddrinfo("example.com", 80)
+        assert len(stub.lookups) == 1
+
+        stub.hosts["example.com"] = "192.0.2.2"
+        with mock.patch("time.monotonic", return_value=110):
+            result = resolver.getaddrinfo("example.com", 80)
+        assert result[0][4] == ("192.0.2.2", 80)
+        assert len(stub.lookups) == 2
+
+    def test_negative_caching(self):
+        stub = StubResolver({})
+        resolver = CachingResolver(stub, negative_ttl=5)
+
+        with mock.patch("time.monotonic", return_value=100):
+            with pytest.raises(socket.gaierror):
+                resolver.getaddrinfo("missing.example.com", 80)
+            with pytest.raises(socket.gaierror):
+                resolver.getaddrinfo("missing.example.com", 80)
+        assert len(stub.lookups) == 1
+
+        stub.hosts["missing.example.com"] = "192.0.2.1"
+        with mock.patch("time.monotonic", return_value=105):
+            assert resolver.getaddrinfo("missing.example.com", 80)
+        assert len(stub.lookups) == 2
+
+    def test_negative_caching_raises_new_error(self):
+        stub = StubResolver({})
+        resolver = CachingResolver(stub)
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(socket.gaierror) as e:
+                resolver.getaddrinfo("missing.example.com", 80)
+            errors.append(e.value)
+        assert errors[0] is not errors[1]
+        assert errors[0].args == errors[1].args
+        assert errors[1].errno == socket.EAI_NONAME
+        assert len(stub.lookups) == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowResolver(StubResolver):
+            def getaddrinfo(self, *args, **kwargs):
+                started.set()
+                release.wait(5)
+                return super().getaddrinfo(*args, **kwargs)
+
+        stub = SlowResolver({"example.com": "192.0.2.1"})
+        resolver = CachingResolver(stub)
+        results = []
+
+        def lookup():
+            results.append(resolver.getaddrinfo("example.com", 80))
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # Give the other threads time to miss the cache.
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert stub.lookups == ["example.com"]
+        assert len(results) == 4
+        assert all(result[0][4] == ("192.0.2.1", 80) for result in results)
+
+    def test_negative_caching_disabled(self):
+        stub = StubResolver({})
+        resolver = CachingResolver(stub, negative_ttl=0)
+
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                resolver.getaddrinfo("missing.example.com", 80)
+        assert len(stub.lookups) == 2
+        assert len(resolver) == 0
+
+    def test_evicts_least_recently_used(self):
+        stub = StubResolver(
+            {"a.example.com": "192.0.2.1", "b.example.com": "192.0.2.2"}
+        )
+        resolver = CachingResolver(stub, maxsize=1)
+
+        resolver.getaddrinfo("a.example.com", 80)
+        resolver.getaddrinfo("b.example.com", 80)
+        resolver.getaddrinfo("a.example.com", 80)
+        assert stub.lookups == ["a.example.com", "b.example.com", "a.example.com"]
+        assert len(resolver) == 1
+
+    def test_preresolve(self):
+        stub = StubResolver({"example.com": "192.0.2.1"})
+        resolver = CachingResolver(stub)
+
+        resolved = resolver.preresolve(
+            [("example.com", 80), ("missing.example.com", 80)], family=0
+        )
+        assert resolved == 1
+
+        resolver.getaddrinfo("example.com", 80, 0, socket.SOCK_STREAM)
+        assert stub.lookups == ["example.com", "missing.example.com"]
+
+    def test_clear(self):
+        stub = StubResolver({"example.com": "192.0.2.1"})
+        resolver = CachingResolver(stub)
+
+        resolver.getaddrinfo("example.com", 80)
+        resolver.clear()
+        resolver.getaddrinfo("example.com", 80)
+        assert len(stub.lookups) == 2
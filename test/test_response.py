@@ -5,11 +5,13 @@ import ssl
 import zlib
 from base64 import b64decode
 from io import BufferedReader, BytesIO, TextIOWrapper
-from test import onlyBrotli
+from test import onlyBrotli, onlyZstd
 from unittest import mock
 
 import pytest
 
+from urllib3._collections import HTTPHeaderDict
+from urllib3.connection import HTTPLibResponse
 from urllib3.exceptions import (
     BodyNotHttplibCompatible,
     DecodeError,
@@ -21,7 +23,16 @@ from urllib3.exceptions import (
     SSLError,
     httplib_IncompleteRead,
 )
-from urllib3.response import HTTPResponse, brotli
+from urllib3.response import (
+    BytesQueueBuffer,
+    ContentDecoder,
+    HTTPResponse,
+    brotli,
+    register_content_decoder,
+    registered_content_encodings,
+    unregister_content_decoder,
+    zstd,
+)
 from urllib3.util.response import is_fp_closed
 from urllib3.util.retry import RequestHistory, Retry
 
@@ -62,6 +73,32 @@ class TestLegacyResponse:
         assert r.getheader("host") == "example.com"
 
 
+class TestBytesQueueBuffer:
+    def test_get(self):
+        buffer = BytesQueueBuffer()
+        assert len(buffer) == 0
+        assert buffer.get(3) == b""
+
+        buffer.put(b"foo")
+        buffer.put(b"")
+        buffer.put(b"barbaz")
+        assert len(buffer) == 9
+        assert buffer.get(0) == b""
+        assert buffer.get(2) == b"fo"
+        assert buffer.get(4) == b"obar"
+        assert len(buffer) == 3
+        assert buffer.get(5) == b"baz"
+        assert len(buffer) == 0
+
+    def test_get_whole_part(self):
+        buffer = BytesQueueBuffer()
+        data = b"x" * 100
+        buffer.put(data)
+        buffer.put(b"y")
+        assert buffer.get(100) is data
+        assert buffer.get_all() == b"y"
+
+
 class TestResponse:
     def test_cache_content(self):
         r = HTTPResponse("foo")
@@ -131,9 +168,6 @@ class TestResponse:
             fp, headers={"content-encoding": "deflate"}, preload_content=False
         )
 
-        assert r.read(3) == b""
-        # Buffer in case we need to switch to the raw stream
-        assert r._decoder._data is not None
         assert r.read(1) == b"f"
         # Now that we've decoded data, we just stream through the decoder
         assert r._decoder._data is None
@@ -151,7 +185,6 @@ class TestResponse:
             fp, headers={"content-encoding": "deflate"}, preload_content=False
         )
 
-        assert r.read(1) == b""
         assert r.read(1) == b"f"
         # Once we've decoded data, we just stream to the decoder; no buffering
         assert r._decoder._data is None
@@ -169,7 +202,6 @@ class TestResponse:
             fp, headers={"content-encoding": "gzip"}, preload_content=False
         )
 
-        assert r.read(11) == b""
         assert r.read(1) == b"f"
         assert r.read(2) == b"oo"
         assert r.read() == b""
@@ -251,6 +283,104 @@ class TestResponse:
         with pytest.raises(DecodeError):
             HTTPResponse(fp, headers={"content-encoding": "br"})
 
+    @onlyZstd()
+    def test_decode_zstd(self):
+        data = zstd.ZstdCompressor().compress(b"foo")
+
+        fp = BytesIO(data)
+        r = HTTPResponse(fp, headers={"content-encoding": "zstd"})
+        assert r.data == b"foo"
+
+    @onlyZstd()
+    def test_decode_multiframe_zstd(self):
+        data = (
+            # Zstandard frame
+            zstd.ZstdCompressor().compress(b"foo")
+            # skippable frame (must be ignored)
+            + bytes.fromhex(
+                "50 2A 4D 18"  # Magic_Number (little-endian)
+                "07 00 00 00"  # Frame_Size (little-endian)
+                "00 00 00 00 00 00 00"  # User_Data
+            )
+            # Zstandard frame
+            + zstd.ZstdCompressor().compress(b"bar")
+        )
+
+        fp = BytesIO(data)
+        r = HTTPResponse(fp, headers={"content-encoding": "zstd"})
+        assert r.data == b"foobar"
+
+    @onlyZstd()
+    def test_chunked_decoding_zstd(self):
+        data = zstd.ZstdCompressor().compress(b"foobarbaz")
+
+        fp = BytesIO(data)
+        r = HTTPResponse(
+            fp, headers={"content-encoding": "zstd"}, preload_content=False
+        )
+
+        ret = b""
+        for _ in range(100):
+            ret += r.read(1)
+            if r.closed:
+                break
+        assert ret == b"foobarbaz"
+
+    @onlyZstd()
+    @pytest.mark.parametrize("data", [b"foo", b"x" * 10])
+    def test_decode_zstd_error(self, data):
+        fp = BytesIO(data)
+        with pytest.raises(DecodeError):
+            HTTPResponse(fp, headers={"content-encoding": "zstd"})
+
+    @onlyZstd()
+    def test_decode_zstd_incomplete(self):
+        data = zstd.ZstdCompressor().compress(b"foo" * 100)
+
+        fp = BytesIO(data[:-4])
+        with pytest.raises(DecodeError):
+            HTTPResponse(fp, headers={"content-encoding": "zstd"})
+
+    def test_registered_content_decoder(self):
+        class ReverseDecoder(ContentDecoder):
+            def decompress(self, data, max_length=-1):
+                return data[::-1]
+
+            def flush(self):
+                return b""
+
+        class ReverseError(Exception):
+            pass
+
+        register_content_decoder("X-Reverse", ReverseDecoder, (ReverseError,))
+        try:
+            assert registered_content_encodings()[-1] == "x-reverse"
+
+            fp = BytesIO(zlib.compress(b"foo")[::-1])
+            r = HTTPResponse(fp, headers={"content-encoding": "deflate, x-reverse"})
+            assert r.data == b"foo"
+
+            with mock.patch.object(
+                ReverseDecoder, "decompress", side_effect=ReverseError
+            ):
+                with pytest.raises(DecodeError):
+                    HTTPResponse(
+                        BytesIO(b"foo"), headers={"content-encoding": "x-reverse"}
+                    )
+        finally:
+            unregister_content_decoder("x-reverse")
+
+        assert "x-reverse" not in registered_content_encodings()
+        r = HTTPResponse(BytesIO(b"oof"), headers={"content-encoding": "x-reverse"})
+        assert r.data == b"oof"
+
+    def test_content_decoders_deprecated(self):
+        with pytest.warns(DeprecationWarning):
+            assert HTTPResponse.CONTENT_DECODERS == registered_content_encodings()
+        r = HTTPResponse(BytesIO(b""))
+        with pytest.warns(DeprecationWarning):
+            assert r.CONTENT_DECODERS[:2] == ["gzip", "deflate"]
+
     def test_multi_decoding_deflate_deflate(self):
         data = zlib.compress(zlib.compress(b"foo"))
 
@@ -373,6 +503,105 @@ class TestResponse:
         while not br.closed:
             br.read(5)
 
+    def test_readinto(self):
+        fp = BytesIO(b"foobarbaz")
+        resp = HTTPResponse(fp, headers={"content-length": "9"}, preload_content=False)
+        b = bytearray(4)
+        with mock.patch.object(resp, "read", side_effect=AssertionError):
+            assert resp.readinto(b) == 4
+            assert b == b"foob"
+            assert resp.readinto(memoryview(b)[:2]) == 2
+            assert b == b"arob"
+            assert resp.readinto(bytearray(0)) == 0
+            assert resp.readinto(b) == 3
+            assert b[:3] == b"baz"
+            assert resp.tell() == 9
+            assert resp.length_remaining == 0
+            assert resp.readinto(b) == 0
+        assert resp.closed
+
+    def test_httplib_response_headers(self):
+        hlr = HTTPLibResponse(
+            MockResponseSock(
+                b"HTTP/1.1 100 Continue\r\nX-Skipped: 1\r\n\r\n"
+                b"HTTP/1.1 200 OK\r\nContent-Length: 3\r\n"
+                b"Set-Cookie: a=1\r\nSet-Cookie: b=2\r\nConnection: close\r\n\r\nfoo"
+            )
+        )
+        hlr.begin()
+        assert isinstance(hlr.msg, HTTPHeaderDict)
+        assert hlr.status == 200
+        assert hlr.length == 3
+        assert hlr.will_close
+        assert hlr.getheader("set-cookie") == "a=1, b=2"
+
+        resp = HTTPResponse.from_httplib(hlr)
+        assert resp.headers is hlr.msg
+        assert resp.headers.getlist("Set-Cookie") == ["a=1", "b=2"]
+        assert "X-Skipped" not in resp.headers
+        assert resp.data == b"foo"
+
+    def test_readinto_chunked(self):
+        body = b"3\r\nfoo\r\n6;ext=1\r\nbarbaz\r\n0\r\n\r\n"
+        hlr = httplib.HTTPResponse(
+            MockResponseSock(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + body
+            )
+        )
+        hlr.begin()
+        resp = HTTPResponse.from_httplib(hlr, preload_content=False)
+        assert resp.chunked
+
+        data = b""
+        b = bytearray(4)
+        with mock.patch.object(hlr, "read", side_effect=AssertionError):
+            while True:
+                n = resp.readinto(b)
+                if not n:
+                    break
+                data += b[:n]
+        assert data == b"foobarbaz"
+        assert resp.tell() == 9
+        assert resp.closed
+
+    def test_readinto_decoded(self):
+        data = zlib.compress(b"foo" * 100)
+        resp = HTTPResponse(
+            BytesIO(data),
+            headers={"content-encoding": "deflate"},
+            preload_content=False,
+        )
+        b = bytearray(1000)
+        n = resp.readinto(b)
+        assert b[:n] == b"foo" * 100
+        assert resp.tell() == len(data)
+
+        resp = HTTPResponse(
+            BytesIO(data),
+            headers={"content-encoding": "deflate"},
+            preload_content=False,
+            decode_content=False,
+        )
+        n = resp.readinto(b)
+        assert b[:n] == data
+
+    def test_readinto_incomplete(self):
+        resp = HTTPResponse(
+            BytesIO(b"foo"),
+            headers={"content-length": "10"},
+            preload_content=False,
+            enforce_content_length=True,
+        )
+        b = bytearray(10)
+        assert resp.readinto(b) == 3
+        with pytest.raises(ProtocolError) as ctx:
+            resp.readinto(b)
+
+        orig_ex = ctx.value.args[1]
+        assert isinstance(orig_ex, IncompleteRead)
+        assert orig_ex.partial == 3
+        assert orig_ex.expected == 7
+
     def test_io_not_autoclose_bufferedreader(self):
         fp = BytesIO(b"hello\nworld")
         resp = HTTPResponse(fp, preload_content=False, auto_close=False)
@@ -467,8 +696,8 @@ class TestResponse:
         )
         stream = resp.stream(2)
 
-        assert next(stream) == b"f"
-        assert next(stream) == b"oo"
+        assert next(stream) == b"fo"
+        assert next(stream) == b"o"
         with pytest.raises(StopIteration):
             next(stream)
 
@@ -525,7 +754,7 @@ class TestResponse:
         resp = HTTPResponse(
             fp, headers={"content-encoding": "deflate"}, preload_content=False
         )
-        stream = resp.stream()
+        stream = resp.stream(payload_part_size)
 
         parts_positions = [(part, resp.tell()) for part in stream]
         end_of_stream = resp.tell()
@@ -539,9 +768,13 @@ class TestResponse:
         payload = b"".join(parts)
         assert uncompressed_data == payload
 
-        # Check that the positions in the stream are correct
-        expected = [(i + 1) * payload_part_size for i in range(NUMBER_OF_READS)]
-        assert expected == list(positions)
+        # Check that the positions in the stream are correct. Reads stop once
+        # enough data was decoded, several reads may be needed for one part.
+        assert [len(part) for part in parts[:-1]] == [payload_part_size] * (
+            len(parts) - 1
+        )
+        assert list(positions) == sorted(positions)
+        assert all(position % payload_part_size == 0 for position in positions[:-1])
 
         # Check that the end of the stream is in the correct place
         assert len(ZLIB_PAYLOAD) == end_of_stream
@@ -555,8 +788,8 @@ class TestResponse:
         )
         stream = resp.stream(2)
 
-        assert next(stream) == b"f"
-        assert next(stream) == b"oo"
+        assert next(stream) == b"fo"
+        assert next(stream) == b"o"
         with pytest.raises(StopIteration):
             next(stream)
 
@@ -571,11 +804,180 @@ class TestResponse:
         )
         stream = resp.stream(2)
 
-        assert next(stream) == b"f"
-        assert next(stream) == b"oo"
+        assert next(stream) == b"fo"
+        assert next(stream) == b"o"
         with pytest.raises(StopIteration):
             next(stream)
 
+    def test_read_decoded_exact_size(self):
+        data = zlib.compress(bytes(range(256)) * 1000)
+        fp = BytesIO(data)
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "deflate"}, preload_content=False
+        )
+        parts = list(resp.stream(1000))
+        assert [len(part) for part in parts] == [1000] * 256
+        assert b"".join(parts) == bytes(range(256)) * 1000
+
+    def test_read_decoded_expansion_capped(self):
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = compress.compress(b"\0" * 2 ** 20) + compress.flush()
+        fp = BytesIO(data)
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "gzip"}, preload_content=False
+        )
+
+        assert resp.read(1024) == b"\0" * 1024
+        # The rest of the first read stays compressed.
+        assert resp._decoder.has_unconsumed_tail
+        assert len(resp._decoded_buffer) == 0
+
+        size = 1024
+        while True:
+            part = resp.read(1024)
+            if not part:
+                break
+            assert len(resp._decoded_buffer) == 0
+            size += len(part)
+        assert size == 2 ** 20
+
+    @pytest.mark.parametrize(
+        "encoding, limit_output",
+        [
+            pytest.param("br", True, marks=onlyBrotli()),
+            pytest.param("br", False, marks=onlyBrotli()),
+            pytest.param("zstd", True, marks=onlyZstd()),
+        ],
+    )
+    def test_read_decoded_expansion_capped_without_zlib(self, encoding, limit_output):
+        body = b"\0" * 2 ** 26
+        if encoding == "br":
+            data = brotli.compress(body, quality=5)
+        else:
+            data = zstd.ZstdCompressor().compress(body)
+        resp = HTTPResponse(
+            BytesIO(data), headers={"content-encoding": encoding}, preload_content=False
+        )
+        resp._init_decoder()
+        if not limit_output:
+            # Brotli bindings older than 1.2 can't limit their output.
+            resp._decoder._can_limit = False
+
+        assert resp.read(1) == b"\0"
+        assert len(resp._decoded_buffer) < 2 ** 23
+
+        size = 1
+        while True:
+            part = resp.read(2 ** 20)
+            if not part:
+                break
+            assert len(resp._decoded_buffer) < 2 ** 23
+            size += len(part)
+        assert size == 2 ** 26
+
+    @pytest.mark.parametrize(
+        "encoding",
+        [
+            pytest.param("br", marks=onlyBrotli()),
+            pytest.param("zstd", marks=onlyZstd()),
+        ],
+    )
+    @pytest.mark.parametrize("amt", [1, 1000, 100000])
+    def test_read_decoded_exact_without_zlib(self, encoding, amt):
+        body = ZLIB_PAYLOAD * 10
+        if encoding == "br":
+            data = brotli.compress(body)
+        else:
+            data = zstd.ZstdCompressor().compress(body)
+        resp = HTTPResponse(
+            BytesIO(data), headers={"content-encoding": encoding}, preload_content=False
+        )
+        parts = list(resp.stream(amt))
+        assert all(len(part) == amt for part in parts[:-1])
+        assert b"".join(parts) == body
+
+    @pytest.mark.parametrize(
+        "encoding",
+        [
+            "deflate",
+            "gzip",
+            "gzip, gzip",
+            pytest.param("br", marks=onlyBrotli()),
+            pytest.param("zstd", marks=onlyZstd()),
+            pytest.param("gzip, br", marks=onlyBrotli()),
+        ],
+    )
+    def test_read_decoded_then_read_rest(self, encoding):
+        body = bytes(range(256)) * 4096
+        data = body
+        for mode in encoding.split(", "):
+            if mode == "deflate":
+                data = zlib.compress(data)
+            elif mode == "gzip":
+                compress = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+                data = compress.compress(data) + compress.flush()
+            elif mode == "br":
+                data = brotli.compress(data)
+            else:
+                data = zstd.ZstdCompressor().compress(data)
+        resp = HTTPResponse(
+            BytesIO(data), headers={"content-encoding": encoding}, preload_content=False
+        )
+        # The whole body fits into the first raw read, the rest stays in the
+        # decoder.
+        first = resp.read(100000)
+        assert len(first) == 100000
+        assert first + resp.read() == body
+
+    def test_stream_decoded_after_connection_closed(self):
+        body = bytes(range(256)) * 4096
+        compress = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        data = compress.compress(body) + compress.flush()
+
+        class ClosingBytesIO(BytesIO):
+            # Closes once the body was read, like http.client.HTTPResponse.
+            def read(self, amt=-1):
+                chunk = super().read(amt)
+                if self.tell() == len(data):
+                    self.close()
+                return chunk
+
+        resp = HTTPResponse(
+            ClosingBytesIO(data),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+        parts = list(resp.stream(100000))
+        assert all(len(part) == 100000 for part in parts[:-1])
+        assert b"".join(parts) == body
+
+    def test_read_decoded_then_read_all(self):
+        data = zlib.compress(b"foobarbaz")
+        fp = BytesIO(data)
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "deflate"}, preload_content=False
+        )
+        assert resp.read(3) == b"foo"
+        assert resp.read() == b"barbaz"
+
+    def test_save_to(self, tmp_path):
+        fp = BytesIO(b"foo" * 1000)
+        resp = HTTPResponse(fp, preload_content=False)
+        assert resp.read(3) == b"foo"
+        assert resp.save_to(str(tmp_path / "body")) == 2997
+        assert (tmp_path / "body").read_bytes() == b"foo" * 999
+        assert resp.save_to(tmp_path / "empty") == 0
+
+    def test_save_to_decoded(self):
+        fp = BytesIO(zlib.compress(b"foo" * 1000))
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "deflate"}, preload_content=False
+        )
+        resp.save_buffer_size = 100
+        f = BytesIO()
+        assert resp.save_to(f) == 3000
+        assert f.getvalue() == b"foo" * 1000
+
     def test_empty_stream(self):
         fp = BytesIO(b"")
         resp = HTTPResponse(fp, preload_content=False)
@@ -739,6 +1141,72 @@ class TestResponse:
         )
         assert stream == list(resp.read_chunked())
 
+    @staticmethod
+    def _chunked_response(body, headers=b""):
+        hlr = httplib.HTTPResponse(
+            MockResponseSock(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n%s\r\n%s"
+                % (headers, body)
+            ),
+            method="GET",
+        )
+        hlr.begin()
+        return HTTPResponse.from_httplib(hlr, preload_content=False)
+
+    def test_chunked_coalesces_buffered_chunks(self):
+        body = b"".join(b"1\r\n%s\r\n" % bytes([c]) for c in b"foobarbaz")
+        resp = self._chunked_response(body + b"0\r\n\r\n")
+        assert list(resp.stream(4)) == [b"foob", b"arba", b"z"]
+        assert resp.closed
+
+        resp = self._chunked_response(body + b"0\r\n\r\n")
+        assert list(resp.read_chunked()) == [b"foobarbaz"]
+
+    def test_chunked_decoded_exact_size(self):
+        data = zlib.compress(b"x" * 100000)
+        body = b"".join(
+            b"%X\r\n%s\r\n" % (len(data[i : i + 100]), data[i : i + 100])
+            for i in range(0, len(data), 100)
+        )
+        resp = self._chunked_response(
+            body + b"0\r\n\r\n", b"Content-Encoding: deflate\r\n"
+        )
+        parts = list(resp.read_chunked(4096, decode_content=True))
+        assert [len(part) for part in parts] == [4096] * 24 + [1696]
+        assert b"".join(parts) == b"x" * 100000
+        assert resp.closed
+
+    def test_chunked_trailers(self):
+        resp = self._chunked_response(
+            b"3;name=value\r\nfoo\r\n0\r\nExpires: never\r\nX-Foo: bar\r\n\r\n"
+        )
+        assert list(resp.stream()) == [b"foo"]
+        assert resp.closed
+
+    def test_chunked_chunk_left(self):
+        resp = self._chunked_response(b"6\r\nfoobar\r\n0\r\n\r\n")
+        assert resp.chunk_left is None
+        chunks = resp.read_chunked(2)
+        assert next(chunks) == b"fo"
+        assert resp.chunk_left == 4
+        assert list(chunks) == [b"ob", b"ar"]
+        assert resp.chunk_left is None
+
+    def test_chunked_size_line_too_long(self):
+        resp = self._chunked_response(b"1" * 70000 + b"\r\n")
+        with pytest.raises(ProtocolError):
+            list(resp.stream())
+
+    def test_chunked_truncated(self):
+        resp = self._chunked_response(b"a\r\nfoo")
+        with pytest.raises(ProtocolError) as ctx:
+            list(resp.stream())
+
+        orig_ex = ctx.value.args[1]
+        assert isinstance(orig_ex, httplib_IncompleteRead)
+        assert orig_ex.partial == b"foo"
+        assert orig_ex.expected == 7
+
     def test_read_not_chunked_response_as_chunks(self):
         fp = BytesIO(b"foo")
         resp = HTTPResponse(fp, preload_content=False)
@@ -1061,3 +1529,11 @@ class MockSock:
     @classmethod
     def makefile(cls, *args, **kwargs):
         return
+
+
+class MockResponseSock:
+    def __init__(self, data):
+        self.data = data
+
+    def makefile(self, *args, **kwargs):
+        return BufferedReader(BytesIO(self.data))
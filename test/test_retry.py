@@ -8,10 +8,12 @@ from urllib3.exceptions import (
     MaxRetryError,
     ReadTimeoutError,
     ResponseError,
+    RetryBudgetExhaustedError,
     SSLError,
 )
 from urllib3.response import HTTPResponse
-from urllib3.util.retry import RequestHistory, Retry
+from urllib3.util.retry import RequestHistory, Retry, RetryBudget
+from urllib3.util.stats import PoolStats
 
 
 class TestRetry:
@@ -172,6 +174,44 @@ class TestRetry:
         retry = retry.increment(method="GET")
         assert retry.get_backoff_time() == 0.4
 
+    def test_backoff_full_jitter(self):
+        retry = Retry(total=100, backoff_factor=0.2, backoff_jitter="full")
+        for _ in range(3):
+            retry = retry.increment(method="GET")
+        with mock.patch("random.uniform", return_value=0.3) as uniform:
+            assert retry.get_backoff_time() == 0.3
+        uniform.assert_called_once_with(0, 0.8)
+
+        for _ in range(20):
+            retry = retry.increment(method="GET")
+        backoffs = {retry.get_backoff_time() for _ in range(10)}
+        assert len(backoffs) > 1
+        assert all(0 <= backoff <= Retry.BACKOFF_MAX for backoff in backoffs)
+
+    def test_backoff_decorrelated_jitter(self):
+        retry = Retry(total=100, backoff_factor=0.2, backoff_jitter="decorrelated")
+        retry = retry.increment(method="GET")
+        assert retry.get_backoff_time() == 0  # First retry
+
+        retry = retry.increment(method="GET")
+        with mock.patch("random.uniform", side_effect=[0.5, 1.2]) as uniform:
+            assert retry.get_backoff_time() == 0.5
+            retry = retry.increment(method="GET")
+            assert retry.get_backoff_time() == 1.2
+        # The upper bound is three times the previous backoff.
+        assert uniform.call_args_list == [
+            mock.call(0.2, pytest.approx(0.6)),
+            mock.call(0.2, pytest.approx(1.5)),
+        ]
+
+        for _ in range(20):
+            retry = retry.increment(method="GET")
+            assert 0.2 <= retry.get_backoff_time() <= Retry.BACKOFF_MAX
+
+    def test_backoff_jitter_invalid(self):
+        with pytest.raises(ValueError, match="backoff_jitter must be one of"):
+            Retry(backoff_jitter="equal")
+
     def test_sleep(self):
         # sleep a very small amount of time so our code coverage is happy
         retry = Retry(backoff_factor=0.0001)
@@ -354,3 +394,62 @@ class TestRetry:
                 sleep_mock.assert_called_with(sleep_duration)
             else:
                 sleep_mock.assert_not_called()
+
+
+class TestRetryBudget:
+    def test_withdraw(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        # Two successful requests earn one retry.
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+
+        for _ in range(10):
+            budget.deposit()
+        assert budget.tokens == 2
+
+    def test_min_per_second(self):
+        with mock.patch("time.monotonic", return_value=100.0) as monotonic:
+            budget = RetryBudget(ratio=0, min_per_second=2, max_tokens=1)
+            assert budget.withdraw()
+            assert not budget.withdraw()
+            monotonic.return_value = 100.25
+            assert budget.tokens == 0.5
+            assert not budget.withdraw()
+            monotonic.return_value = 100.5
+            assert budget.withdraw()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"ratio": -1}, {"min_per_second": -1}, {"max_tokens": 0.5}]
+    )
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryBudget(**kwargs)
+
+    def test_exhausted(self):
+        pool = mock.Mock(stats=PoolStats())
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1)
+        retry = Retry(total=10, budget=budget)
+        error = ConnectTimeoutError()
+
+        retry = retry.increment(error=error, _pool=pool)
+        assert retry.budget is budget
+        with pytest.raises(RetryBudgetExhaustedError) as e:
+            retry.increment(error=error, _pool=pool)
+        assert isinstance(e.value, MaxRetryError)
+        assert e.value.reason is error
+        assert "Retry budget exhausted" in str(e.value)
+        assert pool.stats.retry_budget_exhausted == 1
+
+    def test_redirects_are_free(self):
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1)
+        retry = Retry(total=10, budget=budget)
+        redirect_response = HTTPResponse(status=302, headers={"location": "test"})
+        for _ in range(3):
+            retry = retry.increment(method="GET", response=redirect_response)
+        assert budget.tokens == 1
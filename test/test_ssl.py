@@ -134,6 +134,19 @@ class TestSSL:
 
         context.load_default_certs.assert_called_with()
 
+    def test_wrap_socket_offers_session(self):
+        context = mock.create_autospec(ssl_.SSLContext)
+        session = mock.Mock()
+
+        sock = mock.Mock()
+        ssl_.ssl_wrap_socket(
+            sock, server_hostname="example.com", ssl_context=context, session=session
+        )
+
+        context.wrap_socket.assert_called_once_with(
+            sock, server_hostname="example.com", session=session
+        )
+
     def test_wrap_socket_no_ssltransport(self):
         with mock.patch("urllib3.util.ssl_.SSLTransport", None):
             with pytest.raises(ProxySchemeUnsupported):
@@ -178,3 +191,114 @@ class TestSSL:
             ssl_.assert_fingerprint(
                 cert=None, fingerprint="55:39:BF:70:05:12:43:FA:1F:D1:BF:4E:E8:1B:07:1D"
             )
+
+    def test_ssl_context_cache_reuses_context(self, monkeypatch):
+        contexts = []
+        context_cls = ssl_.SSLContext
+
+        def new_context(*_, **__):
+            context = mock.create_autospec(context_cls)
+            context.options = 0
+            contexts.append(context)
+            return context
+
+        monkeypatch.setattr(ssl_, "SSLContext", new_context)
+        cache = ssl_.SSLContextCache()
+
+        first = cache.get_context(ca_certs="/tmp/fake-file")
+        assert cache.get_context(ca_certs="/tmp/fake-file") is first
+        other = cache.get_context(ca_certs="/tmp/fake-file", cert_reqs="CERT_NONE")
+        assert other is not first
+        assert len(contexts) == 2
+        assert len(cache) == 2
+        first.load_verify_locations.assert_called_once_with(
+            "/tmp/fake-file", None, None
+        )
+        first.load_default_certs.assert_not_called()
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_context(ca_certs="/tmp/fake-file") is not first
+
+    def test_ssl_context_cache_loads_default_certs_once(self, monkeypatch):
+        context = mock.create_autospec(ssl_.SSLContext)
+        context.options = 0
+        monkeypatch.setattr(ssl_, "SSLContext", lambda *_, **__: context)
+        cache = ssl_.SSLContextCache()
+
+        for _ in range(3):
+            assert cache.get_context() is context
+
+        context.load_default_certs.assert_called_once_with()
+        assert context.check_hostname is False
+
+    def test_ssl_context_cache_evicts_least_recently_used(self, monkeypatch):
+        context_cls = ssl_.SSLContext
+
+        def new_context(*_, **__):
+            context = mock.create_autospec(context_cls)
+            context.options = 0
+            return context
+
+        monkeypatch.setattr(ssl_, "SSLContext", new_context)
+        cache = ssl_.SSLContextCache(maxsize=2)
+
+        a = cache.get_context(ca_certs="a")
+        b = cache.get_context(ca_certs="b")
+        assert cache.get_context(ca_certs="a") is a
+        cache.get_context(ca_certs="c")
+
+        assert len(cache) == 2
+        assert cache.get_context(ca_certs="a") is a
+        assert cache.get_context(ca_certs="b") is not b
+
+    def test_ssl_context_cache_does_not_cache_failures(self):
+        cache = ssl_.SSLContextCache()
+
+        with pytest.raises(SSLError):
+            cache.get_context(ca_certs="/tmp/fake-file")
+        assert len(cache) == 0
+
+    def test_ssl_context_cache_session_tickets(self):
+        cache = ssl_.SSLContextCache()
+
+        context = cache.get_context()
+        ticket_context = cache.get_context(session_tickets=True)
+
+        assert context is not ticket_context
+        assert context.options & ssl_.OP_NO_TICKET
+        assert not ticket_context.options & ssl_.OP_NO_TICKET
+
+    def test_ssl_session_cache(self):
+        context = mock.Mock()
+        session = mock.Mock()
+        cache = ssl_.SSLSessionCache()
+
+        assert cache.get("example.com", 443, context) is None
+        cache.put("example.com", 443, context, session)
+        assert cache.get("example.com", 443, context) is session
+        assert cache.get("example.com", 8443, context) is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert cache.get("example.com", 443, context) is None
+
+    def test_ssl_session_cache_requires_same_context(self):
+        context = mock.Mock()
+        cache = ssl_.SSLSessionCache()
+
+        cache.put("example.com", 443, context, mock.Mock())
+        assert cache.get("example.com", 443, mock.Mock()) is None
+
+    def test_ssl_session_cache_evicts_least_recently_used(self):
+        context = mock.Mock()
+        cache = ssl_.SSLSessionCache(maxsize=2)
+
+        cache.put("a.example.com", 443, context, mock.Mock())
+        cache.put("b.example.com", 443, context, mock.Mock())
+        cache.get("a.example.com", 443, context)
+        cache.put("c.example.com", 443, context, mock.Mock())
+
+        assert len(cache) == 2
+        assert cache.get("a.example.com", 443, context) is not None
+        assert cache.get("b.example.com", 443, context) is None
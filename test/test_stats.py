@@ -0,0 +1,58 @@
+import pytest
+
+from urllib3.util.stats import CHECKOUT_WAIT_BUCKETS, PoolStats
+
+
+class TestPoolStats:
+    def test_incr(self):
+        stats = PoolStats()
+        stats.incr("requests")
+        stats.incr("bytes_sent", 100)
+        stats.incr("in_flight", -1)
+        assert stats.requests == 1
+        assert stats.bytes_sent == 100
+        assert stats.in_flight == -1
+
+    @pytest.mark.parametrize(
+        "wait, bucket",
+        [(0, 0.0001), (0.0001, 0.0001), (0.05, 0.1), (2, 10.0), (60, float("inf"))],
+    )
+    def test_record_checkout(self, wait, bucket):
+        stats = PoolStats()
+        stats.record_checkout(wait)
+        histogram = stats.snapshot()["checkout_wait_histogram"]
+        assert list(histogram) == list(CHECKOUT_WAIT_BUCKETS)
+        assert histogram[bucket] == 1
+        assert sum(histogram.values()) == 1
+        assert stats.checkouts == 1
+        assert stats.checkout_wait_total == wait
+
+    def test_merge(self):
+        a, b = PoolStats(), PoolStats()
+        a.incr("connections_created", 2)
+        b.incr("connections_created", 3)
+        a.record_checkout(0.5)
+        b.record_checkout(0.5)
+        b.record_checkout(0)
+
+        a.merge(b)
+        snapshot = a.snapshot()
+        assert snapshot["connections_created"] == 5
+        assert snapshot["checkouts"] == 3
+        assert snapshot["checkout_wait_total"] == 1.0
+        assert snapshot["checkout_wait_histogram"][1.0] == 2
+        assert snapshot["checkout_wait_histogram"][0.0001] == 1
+        # The other stats are left alone.
+        assert b.connections_created == 3
+
+    def test_snapshot_is_a_copy(self):
+        stats = PoolStats()
+        snapshot = stats.snapshot()
+        stats.incr("requests")
+        stats.record_checkout(0)
+        assert snapshot["requests"] == 0
+        assert sum(snapshot["checkout_wait_histogram"].values()) == 0
+        assert set(snapshot) == set(PoolStats.COUNTERS) | {
+            "checkout_wait_total",
+            "checkout_wait_histogram",
+        }
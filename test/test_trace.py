@@ -0,0 +1,82 @@
+import pytest
+
+from urllib3.util.trace import TimingTracer, Tracer, _TracingResolver
+
+from .test_resolver import StubResolver
+
+
+class TestTimingTracer:
+    def test_timings(self):
+        tracer = TimingTracer()
+        for name, timestamp in [
+            ("checkout_start", 100.0),
+            ("checkout_end", 100.5),
+            ("connect_start", 100.5),
+            ("dns_start", 100.5),
+            ("dns_end", 101.0),
+            ("connect_end", 102.0),
+            ("tls_start", 102.0),
+            ("tls_end", 103.0),
+            ("request_start", 103.0),
+            ("request_end", 103.5),
+            ("response_start", 105.0),
+            ("response_end", 106.0),
+        ]:
+            tracer.event(name, timestamp)
+
+        assert tracer.timings() == {
+            "pool_wait": 0.5,
+            "dns": 0.5,
+            "connect": 1.0,
+            "tls": 1.0,
+            "send": 0.5,
+            "wait": 1.5,
+            "receive": 1.0,
+            "total": 6.0,
+        }
+
+    def test_timings_retried(self):
+        tracer = TimingTracer()
+        for name, timestamp in [
+            ("checkout_start", 100.0),
+            ("checkout_end", 100.0),
+            ("connect_start", 100.0),
+            ("connect_end", 101.0),
+            ("request_start", 101.0),
+            ("request_end", 102.0),
+            # The connection was reused for the retry.
+            ("checkout_start", 103.0),
+            ("checkout_end", 104.0),
+            ("request_start", 104.0),
+            ("request_end", 104.5),
+            ("response_start", 105.0),
+        ]:
+            tracer.event(name, timestamp)
+
+        timings = tracer.timings()
+        assert timings["pool_wait"] == 1.0
+        assert timings["dns"] == 0.0
+        assert timings["connect"] == 1.0
+        assert timings["send"] == 1.5
+        assert timings["wait"] == 0.5
+        assert timings["receive"] == 0.0
+        assert timings["total"] == 5.0
+
+    def test_no_events(self):
+        assert set(TimingTracer().timings().values()) == {0.0}
+
+
+class TestTracingResolver:
+    def test_traces_lookups(self):
+        tracer = TimingTracer()
+        resolver = _TracingResolver(StubResolver({"example.com": "192.0.2.1"}), tracer)
+
+        assert resolver.getaddrinfo("example.com", 80)
+        with pytest.raises(OSError):
+            resolver.getaddrinfo("missing.example.com", 80)
+
+        names = [name for name, _ in tracer.events]
+        assert names == ["dns_start", "dns_end"] * 2
+
+    def test_default_tracer_does_nothing(self):
+        assert Tracer().event("dns_start", 0.0) is None
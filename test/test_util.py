@@ -5,13 +5,23 @@ import ssl
 import sys
 import warnings
 from itertools import chain
-from test import ImportBlocker, ModuleStash, notBrotli, onlyBrotli
+from test import (
+    ImportBlocker,
+    ModuleStash,
+    notBrotli,
+    notWindows,
+    notZstd,
+    onlyBrotli,
+    onlyZstd,
+)
 from unittest.mock import Mock, patch
 
 import pytest
 
 from urllib3 import add_stderr_logger, disable_warnings, util
+from urllib3._collections import HTTPHeaderDict
 from urllib3.exceptions import (
+    HeaderParsingError,
     InsecureRequestWarning,
     LocationParseError,
     SNIMissingWarning,
@@ -19,11 +29,21 @@ from urllib3.exceptions import (
     UnrewindableBodyError,
 )
 from urllib3.poolmanager import ProxyConfig
+from urllib3.response import (
+    DeflateDecoder,
+    register_content_decoder,
+    unregister_content_decoder,
+)
 from urllib3.util import is_fp_closed
-from urllib3.util.connection import _has_ipv6, allowed_gai_family, create_connection
+from urllib3.util.connection import (
+    _has_ipv6,
+    _interleave_addrinfos,
+    allowed_gai_family,
+    create_connection,
+)
 from urllib3.util.proxy import connection_requires_http_tunnel, create_proxy_ssl_context
 from urllib3.util.request import _FAILEDTELL, make_headers, rewind_body
-from urllib3.util.response import assert_header_parsing
+from urllib3.util.response import assert_header_parsing, parse_headers
 from urllib3.util.ssl_ import resolve_cert_reqs, resolve_ssl_version, ssl_wrap_socket
 from urllib3.util.timeout import Timeout
 from urllib3.util.url import Url, _encode_invalid_chars, parse_url
@@ -453,24 +473,44 @@ class TestUtil:
             pytest.param(
                 {"accept_encoding": True},
                 {"accept-encoding": "gzip,deflate,br"},
-                marks=onlyBrotli(),
+                marks=[onlyBrotli(), notZstd()],
             ),
             pytest.param(
                 {"accept_encoding": True},
                 {"accept-encoding": "gzip,deflate"},
-                marks=notBrotli(),
+                marks=[notBrotli(), notZstd()],
+            ),
+            pytest.param(
+                {"accept_encoding": True},
+                {"accept-encoding": "gzip,deflate,br,zstd"},
+                marks=[onlyBrotli(), onlyZstd()],
+            ),
+            pytest.param(
+                {"accept_encoding": True},
+                {"accept-encoding": "gzip,deflate,zstd"},
+                marks=[notBrotli(), onlyZstd()],
             ),
             ({"accept_encoding": "foo,bar"}, {"accept-encoding": "foo,bar"}),
             ({"accept_encoding": ["foo", "bar"]}, {"accept-encoding": "foo,bar"}),
             pytest.param(
                 {"accept_encoding": True, "user_agent": "banana"},
                 {"accept-encoding": "gzip,deflate,br", "user-agent": "banana"},
-                marks=onlyBrotli(),
+                marks=[onlyBrotli(), notZstd()],
             ),
             pytest.param(
                 {"accept_encoding": True, "user_agent": "banana"},
                 {"accept-encoding": "gzip,deflate", "user-agent": "banana"},
-                marks=notBrotli(),
+                marks=[notBrotli(), notZstd()],
+            ),
+            pytest.param(
+                {"accept_encoding": True, "user_agent": "banana"},
+                {"accept-encoding": "gzip,deflate,br,zstd", "user-agent": "banana"},
+                marks=[onlyBrotli(), onlyZstd()],
+            ),
+            pytest.param(
+                {"accept_encoding": True, "user_agent": "banana"},
+                {"accept-encoding": "gzip,deflate,zstd", "user-agent": "banana"},
+                marks=[notBrotli(), onlyZstd()],
             ),
             ({"user_agent": "banana"}, {"user-agent": "banana"}),
             ({"keep_alive": True}, {"connection": "keep-alive"}),
@@ -485,6 +525,28 @@ class TestUtil:
     def test_make_headers(self, kwargs, expected):
         assert make_headers(**kwargs) == expected
 
+    def test_make_headers_registered_decoders(self):
+        register_content_decoder("x-custom", DeflateDecoder)
+        try:
+            assert make_headers(accept_encoding=True)["accept-encoding"].startswith(
+                "gzip,deflate,"
+            )
+            assert make_headers(accept_encoding=True)["accept-encoding"].endswith(
+                ",x-custom"
+            )
+        finally:
+            unregister_content_decoder("x-custom")
+        assert "x-custom" not in make_headers(accept_encoding=True)["accept-encoding"]
+
+    def test_accept_encoding_deprecated(self):
+        from urllib3.util import request
+
+        with pytest.warns(DeprecationWarning):
+            accept_encoding = request.ACCEPT_ENCODING
+        assert accept_encoding == make_headers(accept_encoding=True)["accept-encoding"]
+        with pytest.raises(AttributeError):
+            request.UNKNOWN
+
     def test_rewind_body(self):
         body = io.BytesIO(b"test data")
         assert body.read() == b"test data"
@@ -731,6 +793,49 @@ class TestUtil:
         header_msg.seek(0)
         assert_header_parsing(client.parse_headers(header_msg))
 
+    @pytest.mark.parametrize(
+        "block",
+        [
+            b"Content-Type: text/plain\r\nContent-Length: 3\r\n\r\n",
+            b"Set-Cookie: a=1\r\nset-cookie: b=2\r\nX:\r\n\r\n",
+            b"X-Folded: a\r\n  b\r\n\tc\r\nX-Spaces:  d \r\n\r\n",
+            b"X-Latin-1: \xe9\nX-Bare-LF: e\n\n",
+            b"\r\n",
+        ],
+    )
+    def test_parse_headers_like_http_client(self, block):
+        from http import client
+
+        headers = parse_headers(io.BytesIO(block + b"body"))
+        assert isinstance(headers, HTTPHeaderDict)
+        expected = client.parse_headers(io.BytesIO(block + b"body"))
+        assert headers == HTTPHeaderDict(expected.items())
+        assert_header_parsing(headers)
+
+    def test_parse_headers_stops_at_blank_line(self):
+        fp = io.BytesIO(b"Content-Length: 4\r\n\r\nbody")
+        parse_headers(fp)
+        assert fp.read() == b"body"
+
+    @pytest.mark.parametrize(
+        "block", [b"Broken Header\r\n", b": Value\r\n", b":\r\n", b" Folded\r\n"]
+    )
+    def test_parse_headers_malformed(self, block):
+        from http import client
+
+        headers = parse_headers(io.BytesIO(block + b"X: y\r\n\r\n"))
+        assert isinstance(headers, client.HTTPMessage)
+        with pytest.raises(HeaderParsingError):
+            assert_header_parsing(headers)
+
+    def test_parse_headers_limits(self):
+        from http import client
+
+        with pytest.raises(client.LineTooLong):
+            parse_headers(io.BytesIO(b"X: " + b"y" * 65536 + b"\r\n\r\n"))
+        with pytest.raises(client.HTTPException, match="more than 100 headers"):
+            parse_headers(io.BytesIO(b"X: y\r\n" * 101 + b"\r\n"))
+
     @pytest.mark.parametrize("host", [".localhost", "...", "t" * 64])
     def test_create_connection_with_invalid_idna_labels(self, host):
         with pytest.raises(
@@ -762,6 +867,99 @@ class TestUtil:
         with pytest.raises(OSError, match="getaddrinfo returns an empty list"):
             create_connection(("example.com", 80))
 
+    def test_interleave_addrinfos(self):
+        v6 = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", (f"::{i}", 80))
+            for i in range(3)
+        ]
+        v4 = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", (f"10.0.0.{i}", 80))
+            for i in range(2)
+        ]
+
+        assert _interleave_addrinfos(v6 + v4) == [v6[0], v4[0], v6[1], v4[1], v6[2]]
+        assert _interleave_addrinfos(v4 + v6) == [v4[0], v6[0], v4[1], v6[1], v6[2]]
+
+    @pytest.fixture
+    def listening_address(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        yield server.getsockname()
+        server.close()
+
+    @pytest.fixture
+    def refusing_address(self):
+        # A port which was just in use is very unlikely to be taken again.
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        address = sock.getsockname()
+        sock.close()
+        return address
+
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs(
+        self, getaddrinfo, listening_address, refusing_address
+    ):
+        getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", address)
+            for address in (refusing_address, listening_address)
+        ]
+        sock = create_connection(
+            ("example.com", 80), timeout=5, happy_eyeballs_delay=10
+        )
+        try:
+            # The refused attempt doesn't have to wait for the delay.
+            assert sock.getpeername() == listening_address
+            assert sock.gettimeout() == 5
+        finally:
+            sock.close()
+
+    @pytest.fixture
+    def stalling_address(self):
+        # Once the accept queue of a listening socket is full new connection
+        # attempts are left unanswered, just like with a black-holed route.
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(0)
+        clients = []
+        for _ in range(3):
+            client = socket.socket()
+            client.setblocking(False)
+            client.connect_ex(server.getsockname())
+            clients.append(client)
+        yield server.getsockname()
+        for client in clients:
+            client.close()
+        server.close()
+
+    @notWindows
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs_races_stalled_address(
+        self, getaddrinfo, stalling_address, listening_address
+    ):
+        getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", address)
+            for address in (stalling_address, listening_address)
+        ]
+        sock = create_connection(
+            ("example.com", 80), timeout=5, happy_eyeballs_delay=0.01
+        )
+        try:
+            assert sock.getpeername() == listening_address
+        finally:
+            sock.close()
+
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs_error(
+        self, getaddrinfo, refusing_address
+    ):
+        getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", refusing_address)
+        ] * 2
+        with pytest.raises(ConnectionRefusedError):
+            create_connection(("example.com", 80), timeout=5, happy_eyeballs_delay=0.01)
+
     @pytest.mark.parametrize(
         "input,params,expected",
         (
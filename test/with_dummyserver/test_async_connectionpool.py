@@ -0,0 +1,360 @@
+import asyncio
+import gzip
+import io
+import json
+from test import SHORT_TIMEOUT
+from threading import Event
+
+import pytest
+
+from dummyserver.server import DEFAULT_CA
+from dummyserver.testcase import (
+    HTTPDummyServerTestCase,
+    HTTPSDummyServerTestCase,
+    SocketDummyServerTestCase,
+)
+from urllib3 import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from urllib3.exceptions import (
+    EmptyPoolError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+from urllib3.util.retry import Retry
+from urllib3.util.timeout import Timeout
+
+from ..port_helpers import find_unused_port
+
+# Retry failed tests
+pytestmark = pytest.mark.flaky
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncConnectionPool(HTTPDummyServerTestCase):
+    def test_get(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request(
+                    "GET", "/specific_method", fields={"method": "GET"}
+                )
+                assert r.status == 200, r.data
+                r = await pool.request("GET", "/echo", fields={"a": "b"})
+                assert r.data == b"a=b"
+                assert r.headers["Content-Length"] == "3"
+                assert pool.num_connections == 1
+                assert pool.num_requests == 2
+                assert pool.stats.connections_reused == 1
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_post(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("POST", "/echo", body=b"hello")
+                assert r.data == b"hello"
+                r = await pool.request("POST", "/echo", body=io.BytesIO(b"file"))
+                assert r.data == b"file"
+                r = await pool.request(
+                    "POST", "/echo", body=[b"a", b"b", b"c"], chunked=True
+                )
+                assert r.data == b"abc"
+                r = await pool.request("POST", "/echo", fields={"x": "1"})
+                assert b'name="x"' in r.data
+                assert pool.stats.bytes_sent > 0
+
+        run(go())
+
+    def test_headers(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, headers={"X-Pool": "1"}
+            ) as pool:
+                r = await pool.request("GET", "/headers")
+                headers = json.loads(r.data.decode("utf-8"))
+                assert headers["X-Pool"] == "1"
+                assert headers["User-Agent"].startswith("python-urllib3/")
+                assert headers["Host"] == f"{self.host}:{self.port}"
+
+        run(go())
+
+    def test_stream_chunked(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/chunked", preload_content=False)
+                assert r.chunked
+                chunks = [chunk async for chunk in r.stream(2)]
+                assert b"".join(chunks) == b"123" * 4
+                assert r.closed
+                assert pool.stats.in_flight == 0
+
+                r = await pool.request("GET", "/chunked")
+                assert r.data == b"123" * 4
+                assert pool.num_connections == 1
+
+        run(go())
+
+    def test_stream_content_length(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request(
+                    "GET", "/nbytes?length=100000", preload_content=False
+                )
+                assert r.data == b""
+                data = b""
+                async for chunk in r.stream(4096):
+                    assert len(chunk) <= 4096
+                    data += chunk
+                assert data == b"1" * 100000
+                assert r.tell() == 100000
+                assert pool.stats.bytes_received == 100000
+
+        run(go())
+
+    def test_decode_content(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                headers = {"accept-encoding": "gzip"}
+                r = await pool.request("GET", "/encodingrequest", headers=headers)
+                assert r.data == b"hello, world!"
+
+                r = await pool.request(
+                    "GET", "/encodingrequest", headers=headers, decode_content=False
+                )
+                assert gzip.decompress(r.data) == b"hello, world!"
+
+        run(go())
+
+    def test_head(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("HEAD", "/nbytes?length=10")
+                assert r.status == 200
+                assert r.data == b""
+                r = await pool.request("GET", "/nbytes?length=10")
+                assert r.data == b"1" * 10
+                assert pool.num_connections == 1
+
+        run(go())
+
+    def test_release_conn_unread(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request(
+                    "GET", "/nbytes?length=100000", preload_content=False
+                )
+                await r.read(10)
+                r.release_conn()
+                assert pool.stats.in_flight == 0
+
+                # The unread connection was closed instead of being reused.
+                r = await pool.request("GET", "/")
+                assert r.data == b"Dummy server!"
+                assert pool.num_connections == 2
+
+        run(go())
+
+    def test_redirect(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request(
+                    "GET", "/redirect", fields={"target": "/"}, redirect=False
+                )
+                assert r.status == 303
+
+                r = await pool.request("GET", "/redirect", fields={"target": "/"})
+                assert r.status == 200
+                assert r.data == b"Dummy server!"
+                assert r.url == "/"
+
+        run(go())
+
+    def test_status_retry(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                retry = Retry(total=1, status_forcelist=[418])
+                r = await pool.request(
+                    "GET",
+                    "/successful_retry",
+                    headers={"test-name": "test_async_status_retry"},
+                    retries=retry,
+                )
+                assert r.status == 200
+                assert len(r.retries.history) == 1
+
+                retry = Retry(total=1, status_forcelist=[500])
+                with pytest.raises(MaxRetryError):
+                    await pool.request(
+                        "GET",
+                        "/status",
+                        fields={"status": "500 Internal Server Error"},
+                        retries=retry,
+                    )
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_connection_error_retries(self):
+        async def go():
+            port = find_unused_port()
+            async with AsyncHTTPConnectionPool(self.host, port) as pool:
+                with pytest.raises(MaxRetryError) as e:
+                    await pool.request("GET", "/", retries=Retry(connect=2))
+                assert type(e.value.reason) == NewConnectionError
+                assert pool.num_connections == 3
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_block_pool_timeout(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, maxsize=1, block=True
+            ) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                with pytest.raises(EmptyPoolError):
+                    await pool.request("GET", "/", pool_timeout=0.01)
+                await r.drain_conn()
+
+                r = await pool.request("GET", "/", pool_timeout=0.01)
+                assert r.status == 200
+                assert pool.num_connections == 1
+
+        run(go())
+
+    def test_block_concurrent(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, maxsize=2, block=True
+            ) as pool:
+                responses = await asyncio.gather(
+                    *[pool.request("GET", f"/echo?i={i}") for i in range(10)]
+                )
+                assert [r.data for r in responses] == [
+                    f"i={i}".encode() for i in range(10)
+                ]
+                assert pool.num_connections == 2
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_dropped_connection(self):
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/keepalive?close=1")
+                assert r.status == 200
+                r = await pool.request("GET", "/")
+                assert r.status == 200
+                assert pool.num_connections == 2
+
+        run(go())
+
+
+class TestAsyncConnectionPoolSockets(SocketDummyServerTestCase):
+    def test_read_timeout(self):
+        block_send = Event()
+        self.start_response_handler(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n", block_send=block_send
+        )
+
+        async def go():
+            async with AsyncHTTPConnectionPool(
+                self.host,
+                self.port,
+                timeout=Timeout(read=SHORT_TIMEOUT),
+                retries=False,
+            ) as pool:
+                with pytest.raises(ReadTimeoutError):
+                    await pool.request("GET", "/")
+                assert pool.stats.in_flight == 0
+
+        try:
+            run(go())
+        finally:
+            block_send.set()
+
+    def test_truncated_body(self):
+        self.start_response_handler(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort"
+        )
+
+        async def go():
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, retries=False
+            ) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                with pytest.raises(ProtocolError):
+                    await r.read()
+                assert r.closed
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_informational_response(self):
+        self.start_response_handler(
+            b"HTTP/1.1 103 Early Hints\r\nLink: </style.css>\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+        )
+
+        async def go():
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/")
+                assert r.status == 200
+                assert r.data == b"ok"
+
+        run(go())
+
+
+class TestAsyncHTTPSConnectionPool(HTTPSDummyServerTestCase):
+    def test_verified(self):
+        async def go():
+            async with AsyncHTTPSConnectionPool(
+                self.host, self.port, ca_certs=DEFAULT_CA
+            ) as pool:
+                r = await pool.request("GET", "/")
+                assert r.status == 200
+                r = await pool.request("GET", "/")
+                assert r.data == b"Dummy server!"
+                assert pool.stats.tls_handshakes == 1
+
+        run(go())
+
+    def test_unknown_ca(self):
+        async def go():
+            async with AsyncHTTPSConnectionPool(
+                self.host, self.port, retries=False
+            ) as pool:
+                with pytest.raises(SSLError):
+                    await pool.request("GET", "/")
+                assert pool.stats.in_flight == 0
+
+        run(go())
+
+    def test_wrong_hostname(self):
+        async def go():
+            async with AsyncHTTPSConnectionPool(
+                "127.0.0.1", self.port, ca_certs=DEFAULT_CA, retries=False
+            ) as pool:
+                with pytest.raises(SSLError):
+                    await pool.request("GET", "/")
+
+        run(go())
+
+    def test_assert_hostname_false(self):
+        async def go():
+            async with AsyncHTTPSConnectionPool(
+                "127.0.0.1", self.port, ca_certs=DEFAULT_CA, assert_hostname=False
+            ) as pool:
+                r = await pool.request("GET", "/")
+                assert r.status == 200
+
+        run(go())
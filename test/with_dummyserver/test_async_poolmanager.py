@@ -0,0 +1,143 @@
+import json
+
+import pytest
+
+from dummyserver.testcase import HTTPDummyServerTestCase
+from urllib3 import AsyncHTTPConnectionPool, AsyncPoolManager
+from urllib3.exceptions import CircuitOpenError, MaxRetryError
+from urllib3.util.circuit_breaker import CircuitBreaker
+from urllib3.util.connection_limit import ConnectionLimit
+from urllib3.util.retry import Retry
+
+from .test_async_connectionpool import run
+
+# Retry failed tests
+pytestmark = pytest.mark.flaky
+
+
+class TestAsyncPoolManager(HTTPDummyServerTestCase):
+    @classmethod
+    def setup_class(cls):
+        super().setup_class()
+        cls.base_url = f"http://{cls.host}:{cls.port}"
+        cls.base_url_alt = f"http://{cls.host_alt}:{cls.port}"
+
+    def test_request(self):
+        async def go():
+            async with AsyncPoolManager() as http:
+                r = await http.request("GET", f"{self.base_url}/echo?a=b")
+                assert r.data == b"a=b"
+                r = await http.request("POST", f"{self.base_url}/echo", body=b"x")
+                assert r.data == b"x"
+
+                pool = http.connection_from_url(self.base_url)
+                assert isinstance(pool, AsyncHTTPConnectionPool)
+                assert pool.num_connections == 1
+                assert http.stats().requests == 2
+
+        run(go())
+
+    def test_pool_eviction(self):
+        async def go():
+            async with AsyncPoolManager(num_pools=1) as http:
+                r = await http.request("GET", f"{self.base_url}/")
+                assert r.status == 200
+                pool1 = http.connection_from_url(self.base_url)
+                r = await http.request("GET", f"{self.base_url_alt}/")
+                assert r.status == 200
+                assert len(http.pools) == 1
+                assert pool1.pool is None
+
+                # A pool with a connection in use is closed once it's released.
+                r = await http.request(
+                    "GET", f"{self.base_url}/", preload_content=False
+                )
+                pool2 = http.connection_from_url(self.base_url)
+                r2 = await http.request("GET", f"{self.base_url_alt}/")
+                assert r2.status == 200
+                assert pool2.pool is not None
+                assert await r.read() == b"Dummy server!"
+                assert pool2.pool is None
+
+                stats = http.stats()
+                assert stats.pool_evictions == 3
+                assert stats.pool_evictions_deferred == 1
+                assert stats.in_flight == 0
+
+        run(go())
+
+    def test_cross_host_redirect(self):
+        async def go():
+            async with AsyncPoolManager() as http:
+                r = await http.request(
+                    "GET",
+                    f"{self.base_url}/redirect",
+                    fields={"target": f"{self.base_url_alt}/echo?a=b"},
+                )
+                assert r.status == 200
+                assert r.data == b"a=b"
+                assert r.url == f"{self.base_url_alt}/echo?a=b"
+                assert len(http.pools) == 2
+
+        run(go())
+
+    def test_redirect_strips_authorization(self):
+        async def go():
+            async with AsyncPoolManager() as http:
+                r = await http.request(
+                    "GET",
+                    f"{self.base_url}/redirect",
+                    fields={"target": f"{self.base_url_alt}/headers"},
+                    headers={"Authorization": "foo"},
+                )
+                assert r.status == 200
+                assert "Authorization" not in json.loads(r.data.decode("utf-8"))
+
+        run(go())
+
+    def test_too_many_redirects(self):
+        async def go():
+            async with AsyncPoolManager() as http:
+                with pytest.raises(MaxRetryError):
+                    await http.request(
+                        "GET",
+                        f"{self.base_url}/redirect",
+                        fields={
+                            "target": f"{self.base_url}/redirect?target={self.base_url}/"
+                        },
+                        retries=Retry(total=None, redirect=1),
+                    )
+                assert http.stats().in_flight == 0
+
+        run(go())
+
+    def test_circuit_breaker(self):
+        async def go():
+            breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+            failing = f"{self.base_url}/status?status=503+Service+Unavailable"
+            async with AsyncPoolManager(circuit_breaker=breaker) as http:
+                for _ in range(2):
+                    assert (await http.request("GET", failing)).status == 503
+                with pytest.raises(CircuitOpenError):
+                    await http.request("GET", f"{self.base_url}/")
+                assert (
+                    await http.request("GET", f"{self.base_url_alt}/")
+                ).status == 200
+                assert http.stats().circuit_breaker_rejected == 1
+
+        run(go())
+
+    def test_sync_only_methods(self):
+        http = AsyncPoolManager()
+        with pytest.raises(NotImplementedError):
+            http.request_many([("GET", f"{self.base_url}/")])
+        with pytest.raises(NotImplementedError):
+            http.prewarm([self.base_url])
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_total_connections": 2}, {"connection_limit": ConnectionLimit(2)}],
+    )
+    def test_connection_limit_unsupported(self, kwargs):
+        with pytest.raises(TypeError, match="AsyncPoolManager doesn't support"):
+            AsyncPoolManager(**kwargs)
@@ -1,6 +1,7 @@
 import io
 import json
 import logging
+import os
 import socket
 import sys
 import time
@@ -14,7 +15,7 @@ import pytest
 
 from dummyserver.server import HAS_IPV6_AND_DNS, NoIPv6Warning
 from dummyserver.testcase import HTTPDummyServerTestCase, SocketDummyServerTestCase
-from urllib3 import HTTPConnectionPool, encode_multipart_formdata
+from urllib3 import HTTPConnectionPool, PoolManager, encode_multipart_formdata
 from urllib3._collections import HTTPHeaderDict
 from urllib3.connection import _get_default_user_agent
 from urllib3.exceptions import (
@@ -24,10 +25,18 @@ from urllib3.exceptions import (
     MaxRetryError,
     NewConnectionError,
     ReadTimeoutError,
+    ResponseError,
+    RetryBudgetExhaustedError,
     UnrewindableBodyError,
 )
-from urllib3.util import SKIP_HEADER, SKIPPABLE_HEADERS
-from urllib3.util.retry import RequestHistory, Retry
+from urllib3.util import (
+    SKIP_HEADER,
+    SKIPPABLE_HEADERS,
+    CachingResolver,
+    Resolver,
+    TimingTracer,
+)
+from urllib3.util.retry import RequestHistory, Retry, RetryBudget
 from urllib3.util.timeout import Timeout
 
 from .. import INVALID_SOURCE_ADDRESSES, TARPIT_HOST, VALID_SOURCE_ADDRESSES
@@ -208,6 +217,139 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = pool.request("GET", "/specific_method", fields={"method": "GET"})
             assert r.status == 200, r.data
 
+    def test_get_happy_eyeballs(self):
+        with HTTPConnectionPool(
+            self.host, self.port, happy_eyeballs_delay=0.25
+        ) as pool:
+            r = pool.request("GET", "/specific_method", fields={"method": "GET"})
+            assert r.status == 200, r.data
+
+    def test_get_custom_resolver(self):
+        test_host = self.host
+
+        class StubResolver(Resolver):
+            lookups = 0
+
+            def getaddrinfo(self, host, *args):
+                assert host == "dummyserver.invalid"
+                StubResolver.lookups += 1
+                return super().getaddrinfo(test_host, *args)
+
+        resolver = CachingResolver(StubResolver())
+        assert resolver.preresolve([("dummyserver.invalid", self.port)]) == 1
+        with HTTPConnectionPool(
+            "dummyserver.invalid", self.port, resolver=resolver
+        ) as pool:
+            for _ in range(2):
+                r = pool.request("GET", "/specific_method", fields={"method": "GET"})
+                assert r.status == 200, r.data
+                # Drop the connection so the next request needs a new one.
+                conn = pool._get_conn()
+                conn.close()
+                pool._put_conn(conn)
+
+        assert StubResolver.lookups == 1
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_prewarm(self, parallel):
+        with HTTPConnectionPool(self.host, self.port, maxsize=3) as pool:
+            result = pool.prewarm(parallel=parallel)
+            assert result.succeeded == 3
+            assert result.failed == 0
+            assert result.elapsed >= 0
+            assert pool.num_connections == 3
+
+            # Connections which are already open aren't opened again.
+            assert pool.prewarm().succeeded == 0
+
+            conns = [pool._get_conn() for _ in range(3)]
+            assert all(conn.sock is not None for conn in conns)
+            for conn in conns:
+                pool._put_conn(conn)
+            r = pool.request("GET", "/specific_method", fields={"method": "GET"})
+            assert r.status == 200, r.data
+            assert pool.num_connections == 3
+
+    def test_prewarm_fewer_connections(self):
+        with HTTPConnectionPool(self.host, self.port, maxsize=3) as pool:
+            assert pool.prewarm(2).succeeded == 2
+            assert pool.prewarm(5).succeeded == 1
+            assert pool.num_connections == 3
+
+    def test_prewarm_failure(self):
+        port = find_unused_port()
+        with HTTPConnectionPool(self.host, port, maxsize=2) as pool:
+            result = pool.prewarm(parallel=True)
+            assert result.succeeded == 0
+            assert result.failed == 2
+            assert pool.pool.qsize() == 2
+
+    def test_max_idle_time(self):
+        with HTTPConnectionPool(self.host, self.port, max_idle_time=0.1) as pool:
+            assert pool.request("GET", "/").status == 200
+            assert pool.request("GET", "/").status == 200
+            assert pool.stats.connections_expired == 0
+            assert pool.stats.dropped_checks_skipped == 1
+
+            time.sleep(0.2)
+            assert pool.request("GET", "/").status == 200
+            assert pool.stats.connections_expired == 1
+            assert pool.num_requests == 3
+
+    def test_stats(self):
+        with HTTPConnectionPool(self.host, self.port) as pool:
+            r = pool.request("POST", "/echo", body=b"x" * 100)
+            assert r.data == b"x" * 100
+            assert pool.stats.bytes_sent > 100
+            assert pool.stats.bytes_received == 100
+
+            r = pool.request("GET", "/chunked", preload_content=False)
+            assert pool.stats.in_flight == 1
+            assert b"".join(r.stream()) == b"123" * 4
+            r.release_conn()
+
+            snapshot = pool.stats.snapshot()
+            assert snapshot["bytes_received"] == 112
+            assert snapshot["in_flight"] == 0
+            assert snapshot["requests"] == 2
+            assert snapshot["checkouts"] == 2
+            assert snapshot["connections_created"] == 1
+            assert snapshot["connections_reused"] == 1
+
+    def test_tracer(self):
+        pool_tracer = TimingTracer()
+        with HTTPConnectionPool(self.host, self.port, tracer=pool_tracer) as pool:
+            tracer = TimingTracer()
+            r = pool.request("GET", "/chunked", preload_content=False, tracer=tracer)
+            assert [name for name, _ in tracer.events] == [
+                "checkout_start",
+                "checkout_end",
+                "connect_start",
+                "dns_start",
+                "dns_end",
+                "connect_end",
+                "request_start",
+                "request_end",
+                "response_start",
+            ]
+            assert b"".join(r.stream()) == b"123" * 4
+            assert tracer.events[-1][0] == "response_end"
+            timestamps = [timestamp for _, timestamp in tracer.events]
+            assert timestamps == sorted(timestamps)
+            r.release_conn()
+
+            # The connection is reused and the pool's tracer is the default.
+            assert pool.request("GET", "/").status == 200
+            assert [name for name, _ in pool_tracer.events] == [
+                "checkout_start",
+                "checkout_end",
+                "request_start",
+                "request_end",
+                "response_start",
+                "response_end",
+            ]
+            assert len(tracer.events) == 10
+
     def test_post_url(self):
         with HTTPConnectionPool(self.host, self.port) as pool:
             r = pool.request("POST", "/specific_method", fields={"method": "POST"})
@@ -241,6 +383,28 @@ class TestConnectionPool(HTTPDummyServerTestCase):
             r = pool.request("POST", "/upload", fields=fields)
             assert r.status == 200, r.data
 
+    def test_upload_file_object(self, tmp_path):
+        path = tmp_path / "lolcat.txt"
+        path.write_bytes(b"cheezburgr" * 100000)
+        with open(path, "rb") as f:
+            fields = {
+                "upload_param": "filefield",
+                "upload_filename": "lolcat.txt",
+                "upload_size": 1000000,
+                "filefield": ("lolcat.txt", f),
+            }
+
+            with HTTPConnectionPool(self.host, self.port) as pool:
+                r = pool.request("POST", "/upload", fields=fields)
+                assert r.status == 200, r.data
+
+                # Redirects rewind the body.
+                f.seek(0)
+                r = pool.request(
+                    "POST", "/redirect?target=/upload&status=307", fields=fields
+                )
+                assert r.status == 200, r.data
+
     def test_one_name_multiple_values(self):
         fields = [("foo", "a"), ("foo", "b")]
 
@@ -729,12 +893,72 @@ class TestConnectionPool(HTTPDummyServerTestCase):
                     preload_content=False,
                     retries=False,
                 )
-                for chunk in response.stream():
-                    assert chunk == b"123"
+                # Chunks which arrive together are yielded together.
+                assert b"".join(response.stream()) == b"123" * 4
 
             assert pool.num_connections == 1
             assert pool.num_requests == x
 
+    @pytest.mark.skipif(not hasattr(os, "sendfile"), reason="requires os.sendfile()")
+    def test_upload_file_sendfile(self, tmp_path):
+        path = tmp_path / "body"
+        path.write_bytes(b"header" + bytes(range(256)) * 4096)
+
+        with HTTPConnectionPool(self.host, self.port) as pool:
+            with open(path, "rb") as f, mock.patch.object(
+                socket.socket,
+                "sendfile",
+                autospec=True,
+                side_effect=socket.socket.sendfile,
+            ) as sendfile:
+                f.seek(6)
+                r = pool.request("POST", "/echo", body=f)
+                assert r.data == bytes(range(256)) * 4096
+                assert sendfile.call_count == 1
+                assert f.tell() == 6 + 256 * 4096
+                assert pool.stats.bytes_sent > 256 * 4096
+
+                # Retries and redirects rewind the file.
+                f.seek(6)
+                r = pool.request("POST", "/redirect?target=/echo&status=307", body=f)
+                assert r.data == bytes(range(256)) * 4096
+                assert sendfile.call_count == 3
+
+                f.seek(0)
+                r = pool.request(
+                    "POST", "/echo", body=f, headers={"Content-Length": "6"}
+                )
+                assert r.data == b"header"
+
+    @pytest.mark.skipif(not hasattr(os, "splice"), reason="requires os.splice()")
+    def test_save_to_splice(self, tmp_path):
+        path = tmp_path / "body"
+        with HTTPConnectionPool(self.host, self.port, timeout=LONG_TIMEOUT) as pool:
+            for _ in range(2):
+                response = pool.request(
+                    "GET", "/nbytes?length=1000000", preload_content=False
+                )
+                with mock.patch("os.splice", wraps=os.splice) as splice:
+                    with open(path, "wb") as f:
+                        f.write(b"header")
+                        assert response.save_to(f) == 1000000
+                        assert f.tell() == 1000006
+                assert splice.called
+                assert path.read_bytes() == b"header" + b"1" * 1000000
+                assert response.tell() == 1000000
+                assert response.closed
+
+            assert pool.num_connections == 1
+            assert pool.stats.bytes_received >= 2000000
+
+    def test_save_to_chunked(self, tmp_path):
+        path = tmp_path / "body"
+        with HTTPConnectionPool(self.host, self.port) as pool:
+            response = pool.request("GET", "/chunked", preload_content=False)
+            assert response.save_to(str(path)) == 12
+            assert path.read_bytes() == b"123" * 4
+            assert pool.num_connections == 1
+
     def test_read_chunked_short_circuit(self):
         with HTTPConnectionPool(self.host, self.port) as pool:
             response = pool.request("GET", "/chunked", preload_content=False)
@@ -1118,6 +1342,70 @@ class TestRetry(HTTPDummyServerTestCase):
                 RequestHistory("GET", "/successful_retry", None, 418, None),
             )
 
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=1)
+        retries = Retry(3, status_forcelist=[500], budget=budget)
+        fields = {"status": "500 Internal Server Error"}
+        with HTTPConnectionPool(self.host, self.port, retries=retries) as pool:
+            # The first retry takes the only token, the second is refused.
+            with pytest.raises(RetryBudgetExhaustedError) as e:
+                pool.request("GET", "/status", fields=fields)
+            assert isinstance(e.value.reason, ResponseError)
+            assert pool.stats.requests == 2
+            assert pool.stats.retry_budget_exhausted == 1
+
+            # Two successful requests earn a retry.
+            pool.request("GET", "/")
+            pool.request("GET", "/")
+            with pytest.raises(RetryBudgetExhaustedError):
+                pool.request("GET", "/status", fields=fields)
+            assert pool.stats.requests == 6
+            assert pool.stats.retry_budget_exhausted == 2
+
+    def test_retry_budget_deposits(self):
+        budget = RetryBudget(ratio=1, min_per_second=0, max_tokens=2)
+        retries = Retry(3, status_forcelist=[500], budget=budget)
+        with HTTPConnectionPool(self.host, self.port, retries=retries) as pool:
+            assert budget.withdraw()
+            assert budget.withdraw()
+
+            # Error responses and retried requests don't deposit.
+            pool.request("GET", "/status", fields={"status": "404 Not Found"})
+            assert budget.tokens == 0
+            headers = {"test-name": "test_retry_budget_deposits"}
+            retry = Retry(3, status_forcelist=[418], budget=budget)
+            budget.deposit()
+            resp = pool.request(
+                "GET", "/successful_retry", headers=headers, retries=retry
+            )
+            assert resp.status == 200
+            assert budget.tokens == 0
+
+            # Redirected requests do, once.
+            pool.request("GET", "/redirect", fields={"target": "/"})
+            assert budget.tokens == 1
+
+        budget = RetryBudget(ratio=1, min_per_second=0, max_tokens=2)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        retries = Retry(3, budget=budget)
+        base_url = f"http://{self.host}:{self.port}"
+        with PoolManager() as http:
+            # Redirects followed by the pool manager deposit once.
+            r = http.request(
+                "GET", f"{base_url}/redirect", fields={"target": "/"}, retries=retries
+            )
+            assert r.status == 200
+            assert budget.tokens == 1
+
+        with PoolManager(retries=retries) as http:
+            # Redirects which aren't followed deposit too.
+            r = http.request(
+                "GET", f"{base_url}/redirect", fields={"target": "/"}, redirect=False
+            )
+            assert r.status == 303
+            assert budget.tokens == 2
+
     def test_retry_redirect_history(self):
         with HTTPConnectionPool(self.host, self.port) as pool:
             resp = pool.request("GET", "/redirect", fields={"target": "/"})
@@ -40,6 +40,7 @@ from urllib3.exceptions import (
     SystemTimeWarning,
 )
 from urllib3.util.timeout import Timeout
+from urllib3.util.trace import TimingTracer
 
 from .. import has_alpn
 
@@ -746,6 +747,83 @@ class TestHTTPS(HTTPSDummyServerTestCase):
             r = pool.request("GET", "/")
             assert r.status == 200, r.data
 
+    def test_ssl_context_shared_between_connections(self):
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=DEFAULT_CA, maxsize=2
+        ) as https_pool:
+            conn1 = https_pool._get_conn()
+            conn2 = https_pool._get_conn()
+            try:
+                conn1.connect()
+                conn2.connect()
+                assert conn1.sock.context is conn2.sock.context
+                assert conn1.ssl_context is None
+                assert len(https_pool.ssl_context_cache) == 1
+            finally:
+                conn1.close()
+                conn2.close()
+
+    def test_ssl_context_cache_keyed_by_configuration(self):
+        cache = util.ssl_.SSLContextCache()
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=DEFAULT_CA, ssl_context_cache=cache
+        ) as verified_pool, HTTPSConnectionPool(
+            self.host, self.port, cert_reqs="CERT_NONE", ssl_context_cache=cache
+        ) as unverified_pool:
+            assert verified_pool.request("GET", "/").status == 200
+            with pytest.warns(InsecureRequestWarning):
+                assert unverified_pool.request("GET", "/").status == 200
+            assert len(cache) == 2
+
+    def test_ssl_session_resumed(self):
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            ca_certs=DEFAULT_CA,
+            ssl_session_cache=util.ssl_.SSLSessionCache(),
+        ) as pool:
+            for _ in range(3):
+                assert pool.request("GET", "/").status == 200
+                # Drop the connection so the next request needs a new one.
+                conn = pool._get_conn()
+                conn.close()
+                pool._put_conn(conn)
+
+            assert pool.stats.tls_handshakes == 3
+            assert pool.stats.tls_resumptions == 2
+
+    def test_prewarm(self):
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=DEFAULT_CA, maxsize=2
+        ) as pool:
+            assert pool.prewarm().succeeded == 2
+            assert pool.stats.tls_handshakes == 2
+            assert pool.request("GET", "/").status == 200
+            assert pool.stats.tls_handshakes == 2
+
+    def test_ssl_session_not_resumed_by_default(self):
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=DEFAULT_CA) as pool:
+            for _ in range(2):
+                assert pool.request("GET", "/").status == 200
+                # Drop the connection so the next request needs a new one.
+                conn = pool._get_conn()
+                conn.close()
+                pool._put_conn(conn)
+
+            assert pool.stats.tls_handshakes == 2
+            assert pool.stats.tls_resumptions == 0
+
+    def test_tracer(self):
+        tracer = TimingTracer()
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=DEFAULT_CA) as pool:
+            assert pool.request("GET", "/", tracer=tracer).status == 200
+
+        names = [name for name, _ in tracer.events]
+        assert names.index("connect_end") < names.index("tls_start")
+        assert names.index("tls_end") < names.index("request_start")
+        assert names[-1] == "response_end"
+        assert tracer.timings()["tls"] > 0
+
     def test_alpn_default(self):
         """Default ALPN protocols are sent by default."""
         if not has_alpn() or not has_alpn(ssl.SSLContext):
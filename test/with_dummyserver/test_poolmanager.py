@@ -1,5 +1,5 @@
 import json
-from test import LONG_TIMEOUT
+from test import LONG_TIMEOUT, SHORT_TIMEOUT
 from unittest import mock
 
 import pytest
@@ -8,9 +8,16 @@ from dummyserver.server import HAS_IPV6
 from dummyserver.testcase import HTTPDummyServerTestCase, IPv6HTTPDummyServerTestCase
 from urllib3 import HTTPResponse, request
 from urllib3.connectionpool import port_by_scheme
-from urllib3.exceptions import MaxRetryError, URLSchemeUnknown
+from urllib3.exceptions import (
+    CircuitOpenError,
+    ConnectionLimitError,
+    MaxRetryError,
+    URLSchemeUnknown,
+)
 from urllib3.poolmanager import PoolManager
+from urllib3.util.circuit_breaker import CircuitBreaker
 from urllib3.util.retry import Retry
+from urllib3.util.trace import TimingTracer
 
 # Retry failed tests
 pytestmark = pytest.mark.flaky
@@ -43,6 +50,178 @@ class TestPoolManager(HTTPDummyServerTestCase):
             assert r.status == 200
             assert r.data == b"Dummy server!"
 
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_prewarm(self, parallel):
+        with PoolManager(maxsize=2) as http:
+            result = http.prewarm(
+                [f"{self.base_url}/", f"{self.base_url}/echo", f"{self.base_url_alt}/"],
+                parallel=parallel,
+            )
+            assert result.succeeded == 4
+            assert result.failed == 0
+            assert len(http.pools) == 2
+
+            pool = http.connection_from_url(self.base_url)
+            assert pool.num_connections == 2
+            r = http.request("GET", f"{self.base_url}/")
+            assert r.status == 200
+            assert pool.num_connections == 2
+
+    def test_prewarm_per_host(self):
+        with PoolManager(maxsize=5) as http:
+            result = http.prewarm([self.base_url], per_host=3)
+            assert result.succeeded == 3
+            assert http.connection_from_url(self.base_url).num_connections == 3
+
+    def test_stats(self):
+        with PoolManager(num_pools=1) as http:
+            for _ in range(2):
+                assert http.request("GET", f"{self.base_url}/").status == 200
+            assert http.request("GET", f"{self.base_url_alt}/").status == 200
+
+            # The pool of base_url was discarded but is still counted.
+            assert len(http.pools) == 1
+            stats = http.stats()
+            assert stats.requests == 3
+            assert stats.connections_created == 2
+            assert stats.connections_reused == 1
+            assert stats.in_flight == 0
+            assert stats.bytes_received == 3 * len(b"Dummy server!")
+
+    def test_circuit_breaker(self):
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=0,
+            on_state_change=lambda key, old, new: changes.append((old, new)),
+        )
+        failing = f"{self.base_url}/status?status=503+Service+Unavailable"
+        with PoolManager(circuit_breaker=breaker) as http:
+            for _ in range(2):
+                assert http.request("GET", failing).status == 503
+            assert changes == [("closed", "open")]
+
+            # Requests to other hosts go through.
+            assert http.request("GET", f"{self.base_url_alt}/").status == 200
+
+            # The probe fails and opens the circuit again.
+            assert http.request("GET", failing).status == 503
+            assert http.request("GET", f"{self.base_url}/").status == 200
+            assert changes == [
+                ("closed", "open"),
+                ("open", "half_open"),
+                ("half_open", "open"),
+                ("open", "half_open"),
+                ("half_open", "closed"),
+            ]
+
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        with PoolManager(circuit_breaker=breaker) as http:
+            assert http.request("GET", failing).status == 503
+            with pytest.raises(CircuitOpenError):
+                http.request("GET", f"{self.base_url}/")
+            assert http.stats().circuit_breaker_rejected == 1
+
+    def test_circuit_breaker_status_forcelist(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        retries = Retry(1, status_forcelist=[503])
+        failing = f"{self.base_url}/status?status=503+Service+Unavailable"
+        with PoolManager(circuit_breaker=breaker, retries=retries) as http:
+            with pytest.raises(MaxRetryError):
+                http.request("GET", failing)
+            assert breaker.state(("http", self.host, self.port)) == "open"
+            with pytest.raises(CircuitOpenError):
+                http.request("GET", f"{self.base_url}/")
+
+    def test_max_total_connections(self):
+        with PoolManager(max_total_connections=1) as http:
+            assert http.request("GET", f"{self.base_url}/").status == 200
+            # The idle connection to base_url makes room for this one.
+            assert http.request("GET", f"{self.base_url_alt}/").status == 200
+            stats = http.stats()
+            assert stats.connections_evicted == 1
+            assert http.connection_limit.open_connections == 1
+
+            # Connections which are in use can't be closed, and waiting for
+            # them isn't retried.
+            r = http.request("GET", f"{self.base_url}/", preload_content=False)
+            with pytest.raises(ConnectionLimitError):
+                http.request(
+                    "GET", f"{self.base_url_alt}/", timeout=SHORT_TIMEOUT, retries=1
+                )
+            assert http.stats().connection_limit_waits == 1
+            pool = http.connection_from_url(f"{self.base_url_alt}/")
+            assert pool.pool.qsize() == pool.pool.maxsize
+
+            r.release_conn()
+            assert http.request("GET", f"{self.base_url_alt}/").status == 200
+            assert http.connection_limit.open_connections == 1
+
+    def test_tracer_redirect(self):
+        tracer = TimingTracer()
+        with PoolManager() as http:
+            r = http.request(
+                "GET",
+                f"{self.base_url}/redirect",
+                fields={"target": f"{self.base_url_alt}/"},
+                tracer=tracer,
+            )
+            assert r.status == 200
+
+        names = [name for name, _ in tracer.events]
+        assert names.count("checkout_start") == 2
+        assert names.count("connect_end") == 2
+        assert names.count("response_end") == 2
+
+    def test_request_many_ordered(self):
+        requests = [
+            ("GET", f"{url}/echo?i={i}")
+            for i in range(10)
+            for url in (self.base_url, self.base_url_alt)
+        ]
+        with PoolManager(maxsize=2, block=True) as http:
+            results = list(http.request_many(requests, concurrency=8, ordered=True))
+            assert [result.index for result in results] == list(range(20))
+            assert [result.error for result in results] == [None] * 20
+            assert [result.response.data for result in results] == [
+                f"i={i}".encode() for i in range(10) for _ in range(2)
+            ]
+
+            # No host ever had more requests than connections in its pool.
+            for url in (self.base_url, self.base_url_alt):
+                assert http.connection_from_url(url).num_connections <= 2
+            stats = http.stats()
+            assert stats.requests == 20
+            assert stats.connections_created + stats.connections_reused == 20
+            assert stats.in_flight == 0
+
+    def test_request_many_errors(self):
+        requests = [
+            {"method": "GET", "url": f"{self.base_url}/echo", "fields": {"a": "b"}},
+            {
+                "method": "GET",
+                "url": f"{self.base_url}/status",
+                "fields": {"status": "500 Internal Server Error"},
+                "retries": Retry(total=1, status_forcelist=[500]),
+            },
+            ("GET", "unknown://example.com/"),
+            {"method": "POST", "url": f"{self.base_url}/echo", "body": b"x"},
+        ]
+        with PoolManager() as http:
+            results = {result.index: result for result in http.request_many(requests)}
+            assert sorted(results) == [0, 1, 2, 3]
+            assert results[0].response.data == b"a=b"
+            assert isinstance(results[1].error, MaxRetryError)
+            assert results[1].response is None
+            assert isinstance(results[2].error, URLSchemeUnknown)
+            assert results[3].response.data == b"x"
+            assert http.stats().in_flight == 0
+
+    def test_request_many_invalid_concurrency(self):
+        with PoolManager() as http:
+            with pytest.raises(ValueError):
+                list(http.request_many([], concurrency=0))
+
     def test_redirect_twice(self):
         with PoolManager() as http:
             r = http.request(
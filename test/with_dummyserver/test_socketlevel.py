@@ -1808,6 +1808,33 @@ class TestBadContentLength(SocketDummyServerTestCase):
 
             done_event.set()
 
+    def test_enforce_content_length_save_to(self, tmp_path):
+        def socket_handler(listener):
+            sock = listener.accept()[0]
+
+            buf = b""
+            while not buf.endswith(b"\r\n\r\n"):
+                buf += sock.recv(65536)
+
+            sock.send(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Length: 22\r\n"
+                b"Content-type: text/plain\r\n"
+                b"\r\n"
+                b"hello, world"
+            )
+            sock.close()
+
+        self._start_server(socket_handler)
+        with HTTPConnectionPool(self.host, self.port, maxsize=1) as conn:
+            response = conn.request(
+                "GET", url="/", preload_content=False, enforce_content_length=True
+            )
+            with pytest.raises(ProtocolError) as e:
+                response.save_to(tmp_path / "body")
+            assert "12 bytes read, 10 more expected" in str(e.value)
+            assert (tmp_path / "body").read_bytes() == b"hello, world"
+
 
 class TestRetryPoolSizeDrainFail(SocketDummyServerTestCase):
     def test_pool_size_retry_drain_fail(self):